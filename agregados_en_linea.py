@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Agregados incrementales del Cuestionario Likert para tableros en vivo
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Mantiene por ítem el conteo, la media y la varianza de las respuestas,
+más el histograma completo 1-5, y por sección (las secciones del esquema
+del cuestionario) las mismas estadísticas sobre la media de cada
+encuestado en la sección: las respuestas de una misma persona a los
+ítems de una sección están correlacionadas, así que la unidad de la
+varianza y del intervalo es el encuestado. Los ítems invertidos se dan
+vuelta antes de promediar la sección (más alto = mejor). Cada bloque
+nuevo se resume y se combina con el estado acumulado con la fórmula de
+Chan et al.; con un solo envío equivale a la actualización de Welford.
+Leer los resultados no recorre las respuestas.
+
+Las respuestas que calidad_respuestas.py marca (línea recta, varianza
+baja, llenado demasiado rápido) se descartan al incorporarlas. Las que
+se excluyen después se quitan restando su histograma y su resumen, sin
+volver a recorrer el resto.
+
+El estado se guarda en instantáneas .npz (reemplazadas de forma
+atómica) junto con el número de respuestas incluidas, para que al
+reiniciar solo se procesen las respuestas nuevas del almacén.
+
+Uso:
+    python agregados_en_linea.py --almacen campana_2025
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from calidad_respuestas import duraciones, marcar
+from esquema_cuestionario import ESCALA_LIKERT, cargar_esquema
+from puntuaciones import invertidos_en, matriz_respuestas, orientar
+
+VALORES = np.arange(len(ESCALA_LIKERT) + 1, dtype=np.float64)
+
+# 2: secciones resumidas por encuestado (antes, por respuesta a cada ítem)
+VERSION_INSTANTANEA = 2
+
+def estadisticas_histograma(histograma):
+    """Conteo, media y suma de cuadrados centrada (M2) de cada fila de un histograma 0-5"""
+    respondidas = histograma[:, 1:]
+    n = respondidas.sum(axis=1)
+    suma = respondidas @ VALORES[1:]
+    media = np.divide(suma, n, out=np.zeros(len(n)), where=n > 0)
+    m2 = (respondidas * (VALORES[1:] - media[:, None]) ** 2).sum(axis=1)
+    return n, media, m2
+
+def estadisticas_encuestados(medias, respondidas):
+    """Conteo, media y M2 por columna de las medias por encuestado (solo donde `respondidas`)"""
+    n = respondidas.sum(axis=0)
+    media = np.divide((medias * respondidas).sum(axis=0), n, out=np.zeros(len(n)), where=n > 0)
+    m2 = ((medias - media) ** 2 * respondidas).sum(axis=0)
+    return n, media, m2
+
+def fusionar(n_a, media_a, m2_a, n_b, media_b, m2_b):
+    """Combinar dos resúmenes (conteo, media, M2) sin volver a leer los datos"""
+    n = n_a + n_b
+    delta = media_b - media_a
+    proporcion = np.divide(n_b, n, out=np.zeros(len(n)), where=n > 0)
+    media = media_a + delta * proporcion
+    m2 = m2_a + m2_b + delta ** 2 * n_a * proporcion
+    return n, media, m2
+
+def separar(n, media, m2, n_b, media_b, m2_b):
+    """Quitar de un resumen (conteo, media, M2) el de un subconjunto: inversa de fusionar()"""
+    n_a = n - n_b
+    media_a = np.divide(n * media - n_b * media_b, n_a, out=np.zeros(len(n)), where=n_a > 0)
+    delta = media_b - media_a
+    m2_a = m2 - m2_b - delta ** 2 * np.divide(n_a * n_b, n, out=np.zeros(len(n)), where=n > 0)
+    # Sin encuestados (o por redondeo) el M2 restante no puede ser negativo
+    return n_a, np.where(n_a > 0, media_a, 0.0), np.where(n_a > 1, np.maximum(m2_a, 0.0), 0.0)
+
+class AgregadosEnLinea:
+    """Conteo, media, varianza e histograma por ítem y por sección"""
+
+    def __init__(self, esquema=None, filtrar_calidad=True):
+        self.esquema = esquema or cargar_esquema()
+        self.filtrar_calidad = filtrar_calidad
+        self.items = list(self.esquema['items'])
+        self.secciones = [titulo for titulo, _ in self.esquema['secciones']]
+        self.item_seccion = np.array(self.esquema['item_seccion'], dtype=np.intp)
+        # Matriz ítem × sección: suma por encuestado y sección con un producto de matrices
+        self._pertenencia = (self.item_seccion[:, None] == np.arange(len(self.secciones))).astype(np.float64)
+        self.invertidas = [bool(invertidos_en(self.item_seccion == s, self.esquema).any())
+                           for s in range(len(self.secciones))]
+        self.filas = 0
+        self.excluidas = 0
+        self.histograma = np.zeros((len(self.items), len(VALORES)), dtype=np.int64)
+        self.n = np.zeros(len(self.items), dtype=np.int64)
+        self.media = np.zeros(len(self.items))
+        self.m2 = np.zeros(len(self.items))
+        self.n_seccion = np.zeros(len(self.secciones), dtype=np.int64)
+        self.media_seccion = np.zeros(len(self.secciones))
+        self.m2_seccion = np.zeros(len(self.secciones))
+
+    # Actualización
+
+    def _validar(self, likert):
+        likert = np.asarray(likert)
+        if likert.ndim != 2 or likert.shape[1] != len(self.items):
+            raise ValueError(f"Se esperaba una matriz de N × {len(self.items)} ítems")
+        return likert
+
+    def _histogramas(self, likert):
+        # Histograma del bloque con un solo bincount: celda (ítem, valor) -> ítem * 6 + valor
+        desplazamiento = np.arange(len(self.items), dtype=np.intp) * len(VALORES)
+        histograma = np.bincount((likert.astype(np.intp) + desplazamiento).ravel(),
+                                 minlength=self.histograma.size).reshape(self.histograma.shape)
+        return histograma
+
+    def _resumen_secciones(self, likert):
+        # Media de cada encuestado en cada sección (ítems invertidos ya dados vuelta, sin contar los 0)
+        sumas = orientar(likert, self.esquema) @ self._pertenencia
+        respondidas = (likert > 0) @ self._pertenencia
+        medias = np.divide(sumas, respondidas, out=np.zeros(sumas.shape), where=respondidas > 0)
+        return estadisticas_encuestados(medias, respondidas > 0)
+
+    def agregar_columnas(self, likert, categoricos=None, textos=None, recibido=None, duracion=None):
+        """Incorporar un bloque de respuestas (matriz encuestado × ítem, 0 = sin respuesta)"""
+        likert = self._validar(likert)
+        filas = len(likert)
+        if not filas:
+            return 0
+        if self.filtrar_calidad:
+            # Las respuestas marcadas cuentan como procesadas pero no entran en los agregados
+            aceptadas = marcar(likert, self.esquema, duracion) == 0
+            self.excluidas += int(filas - np.count_nonzero(aceptadas))
+            likert = likert[aceptadas]
+
+        histograma = self._histogramas(likert)
+        self.n, self.media, self.m2 = fusionar(self.n, self.media, self.m2, *estadisticas_histograma(histograma))
+        self.n_seccion, self.media_seccion, self.m2_seccion = fusionar(
+            self.n_seccion, self.media_seccion, self.m2_seccion, *self._resumen_secciones(likert))
+        self.histograma += histograma
+        self.filas += filas
+        return filas
+
+    def quitar_columnas(self, likert):
+        """Excluir respuestas ya incorporadas (por ejemplo, marcadas en una revisión posterior)"""
+        likert = self._validar(likert)
+        if not len(likert):
+            return 0
+        histograma = self._histogramas(likert)
+        n_seccion, media_seccion, m2_seccion = self._resumen_secciones(likert)
+        if (histograma > self.histograma).any() or (n_seccion > self.n_seccion).any():
+            raise ValueError("Las respuestas a quitar no están incluidas en los agregados")
+        # Ítems: restar el histograma y recalcular desde él, exacto y sin recorrer las demás respuestas
+        self.histograma -= histograma
+        self.n, self.media, self.m2 = estadisticas_histograma(self.histograma)
+        # Secciones: restar el resumen de los encuestados quitados
+        self.n_seccion, self.media_seccion, self.m2_seccion = separar(
+            self.n_seccion, self.media_seccion, self.m2_seccion, n_seccion, media_seccion, m2_seccion)
+        self.excluidas += len(likert)
+        return len(likert)
+
+    def agregar(self, respuesta):
+        """Incorporar un envío (objeto `data` o respuesta validada)"""
+        return self.agregar_respuestas([respuesta])
+
+    def agregar_respuestas(self, respuestas):
+        """Incorporar varios envíos de una vez"""
+        respuestas = list(respuestas)
+        return self.agregar_columnas(matriz_respuestas(respuestas, self.esquema), duracion=duraciones(respuestas))
+
+    def sincronizar(self, almacen, bloque=1 << 16):
+        """Procesar las respuestas del almacén columnar posteriores a las ya incluidas"""
+        if almacen.filas < self.filas:
+            raise ValueError("El almacén tiene menos respuestas que los agregados")
+        nuevas = 0
+        duracion = almacen.duracion()
+        for inicio in range(self.filas, almacen.filas, bloque):
+            # Con la duración guardada, el filtro de llenado demasiado rápido es el mismo que en vivo
+            nuevas += self.agregar_columnas(almacen.matriz(inicio=inicio, fin=inicio + bloque),
+                                            duracion=np.array(duracion[inicio:inicio + bloque]))
+        return nuevas
+
+    # Lectura
+
+    def _estadisticas(self, n, media, m2, histograma):
+        n = int(n)
+        varianza = float(m2) / (n - 1) if n > 1 else 0.0
+        return {
+            'n': n,
+            'media': float(media),
+            'varianza': varianza,
+            'desviacion': varianza ** 0.5,
+            'histograma': [int(c) for c in histograma[1:]],
+        }
+
+    def estadisticas_item(self, item):
+        """Estadísticas actuales de un ítem"""
+        j = self.items.index(item)
+        return self._estadisticas(self.n[j], self.media[j], self.m2[j], self.histograma[j])
+
+    def estadisticas_seccion(self, indice):
+        """Estadísticas actuales de una sección: n, media y varianza de la media por encuestado
+        (orientada, más alto = mejor); el histograma suma las respuestas de sus ítems tal como se dieron"""
+        histograma = self.histograma[self.item_seccion == indice].sum(axis=0)
+        estadisticas = self._estadisticas(self.n_seccion[indice], self.media_seccion[indice],
+                                          self.m2_seccion[indice], histograma)
+        estadisticas['respuestas'] = int(histograma[1:].sum())
+        estadisticas['invertida'] = self.invertidas[indice]
+        return estadisticas
+
+    def resumen(self):
+        """Resultados actuales por sección e ítem, listos para JSON"""
+        return {
+            'respuestas': self.filas - self.excluidas,
+            'excluidas': self.excluidas,
+            'secciones': [
+                dict(self.estadisticas_seccion(s), titulo=titulo) for s, titulo in enumerate(self.secciones)
+            ],
+            'items': {item: self.estadisticas_item(item) for item in self.items},
+        }
+
+    # Instantáneas
+
+    def guardar(self, ruta):
+        """Guardar el estado en un .npz (reemplazo atómico)"""
+        directorio = os.path.dirname(os.path.abspath(ruta))
+        os.makedirs(directorio, exist_ok=True)
+        temporal = f'{ruta}.{os.getpid()}.tmp'
+        with open(temporal, 'wb') as f:
+            np.savez(f, version=np.int64(VERSION_INSTANTANEA), items=np.array(self.items), filas=np.int64(self.filas), excluidas=np.int64(self.excluidas),
+                     filtrar_calidad=np.bool_(self.filtrar_calidad), histograma=self.histograma,
+                     n=self.n, media=self.media, m2=self.m2, n_seccion=self.n_seccion,
+                     media_seccion=self.media_seccion, m2_seccion=self.m2_seccion)
+        os.replace(temporal, ruta)
+
+    @classmethod
+    def cargar(cls, ruta, esquema=None, filtrar_calidad=True):
+        """Estado guardado con guardar(); ValueError si corresponde a otro cuestionario u otro filtro"""
+        agregados = cls(esquema, filtrar_calidad)
+        with np.load(ruta) as datos:
+            if datos['items'].tolist() != agregados.items or len(datos['n_seccion']) != len(agregados.secciones):
+                raise ValueError("La instantánea corresponde a otra versión del cuestionario")
+            if 'version' not in datos or int(datos['version']) != VERSION_INSTANTANEA:
+                raise ValueError("La instantánea tiene otro formato de agregados por sección")
+            if bool(datos['filtrar_calidad']) != filtrar_calidad:
+                raise ValueError("La instantánea se calculó con otro filtro de calidad")
+            agregados.filas = int(datos['filas'])
+            agregados.excluidas = int(datos['excluidas'])
+            for nombre in ('histograma', 'n', 'media', 'm2', 'n_seccion', 'media_seccion', 'm2_seccion'):
+                setattr(agregados, nombre, datos[nombre])
+        return agregados
+
+    @classmethod
+    def restaurar(cls, almacen, ruta=None, esquema=None, filtrar_calidad=True):
+        """Agregados al día con el almacén: instantánea más respuestas nuevas, o cálculo completo"""
+        agregados = None
+        if ruta and os.path.exists(ruta):
+            try:
+                agregados = cls.cargar(ruta, esquema, filtrar_calidad)
+            except (OSError, ValueError, KeyError):
+                agregados = None  # Instantánea dañada u obsoleta: recalcular
+        agregados = agregados or cls(esquema, filtrar_calidad)
+
+        total = almacen.contar()
+        if agregados.filas == total:
+            return agregados
+        if hasattr(almacen, 'matriz'):
+            # Almacén columnar: las filas nuevas, o todas si el almacén se truncó o reemplazó
+            if agregados.filas > total:
+                agregados = cls(esquema, filtrar_calidad)
+            agregados.sincronizar(almacen)
+            return agregados
+        # Base SQLite, sin posición confiable: recalcular desde el principio
+        agregados = cls(esquema, filtrar_calidad)
+        for respuestas in almacen.iterar_datos():
+            agregados.agregar_respuestas(respuestas)
+        return agregados
+
+def imprimir_resumen(agregados):
+    """Mostrar los resultados por sección"""
+    print(f"📊 Respuestas: {agregados.filas - agregados.excluidas} ({agregados.excluidas} excluidas por calidad)")
+    for s, titulo in enumerate(agregados.secciones):
+        e = agregados.estadisticas_seccion(s)
+        barras = ' '.join(f'{c / e["respuestas"]:5.1%}' if e['respuestas'] else '  -  ' for c in e['histograma'])
+        marca = ' (invertida)' if e['invertida'] else ''
+        print(f"   {titulo + marca:<45} n={e['n']:<9} media {e['media']:.2f} ± {e['desviacion']:.2f}  [{barras}]")
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Agregados incrementales de las respuestas del cuestionario')
+    parser.add_argument('--almacen', required=True, help='Directorio del almacén columnar')
+    parser.add_argument('--instantanea', help='Archivo .npz del estado (por defecto: agregados.npz en el almacén)')
+    args = parser.parse_args()
+
+    from almacen_columnar import AlmacenColumnar
+    esquema = cargar_esquema()
+    almacen = AlmacenColumnar(args.almacen, esquema)
+    ruta = args.instantanea or os.path.join(args.almacen, 'agregados.npz')
+
+    print(f"🚀 Actualizando agregados de {args.almacen}...")
+    inicio = time.perf_counter()
+    agregados = AgregadosEnLinea.restaurar(almacen, ruta, esquema)
+    agregados.guardar(ruta)
+    print(f"✅ Agregados al día en {time.perf_counter() - inicio:.2f}s")
+    print(f"💾 Instantánea: {ruta}")
+    imprimir_resumen(agregados)
+
+if __name__ == "__main__":
+    main()
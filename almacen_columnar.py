@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Almacén columnar de respuestas del Cuestionario Likert
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Guarda cada campaña de respuestas por columnas en un directorio, con
+la lista de ítems del esquema del cuestionario (facilidad_1 …
+objetivos_5):
+
+    meta.json                   ítems, campos y filas confirmadas
+    recibido.f8                 fecha de recepción (float64, epoch)
+    duracion.f8                 segundos de llenado (tiempos.total_ms / 1000; NaN = no se registró)
+    likert/<ítem>.u8            respuesta Likert (uint8, 0 = sin respuesta)
+    categorico/<campo>.u8       opción elegida, 1..n (uint8, 0 = sin respuesta)
+    texto/<campo>.heap          textos UTF-8 concatenados
+    texto/<campo>.off           fin de cada texto en el heap (uint64)
+
+Todas las columnas se leen con np.memmap, sin parsear JSON. Las filas
+nuevas se agregan al final de cada archivo y solo cuentan cuando
+meta.json (reemplazado de forma atómica) registra el nuevo total; una
+escritura interrumpida se descarta en la siguiente. Admite un solo
+escritor a la vez y cualquier número de lectores.
+
+Uso:
+    python almacen_columnar.py campana_2025 --desde-sqlite respuestas_cuestionario.sqlite3
+    python almacen_columnar.py campana_2025
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+from calidad_respuestas import duraciones
+from esquema_cuestionario import cargar_esquema
+
+ALMACEN_VERSION = 1
+
+def campos_del_esquema(esquema):
+    """Campos categóricos (con opciones) y de texto libre del esquema"""
+    categoricos = {}
+    for name, (opciones, _) in esquema['perfil'].items():
+        if opciones is not None:
+            categoricos[name] = tuple(opciones)
+    categoricos.update((name, tuple(opciones)) for name, opciones in esquema['evaluacion_general'].items())
+    textos = [name for name, (opciones, _) in esquema['perfil'].items() if opciones is None]
+    textos += [name for _, name in esquema['comentarios']]
+    return categoricos, textos
+
+class AlmacenColumnar:
+    """Columnas de respuestas en disco, con lectura por memory-map"""
+
+    def __init__(self, directorio, esquema=None):
+        self.directorio = directorio
+        self.ruta_meta = os.path.join(directorio, 'meta.json')
+        if os.path.exists(self.ruta_meta):
+            with open(self.ruta_meta, encoding='utf-8') as f:
+                self.meta = json.load(f)
+            if self.meta['version'] != ALMACEN_VERSION:
+                raise ValueError(f"Versión de almacén no soportada: {self.meta['version']}")
+            if esquema is not None and list(esquema['items']) != self.meta['items']:
+                raise ValueError("El almacén fue creado con otra lista de ítems del cuestionario")
+        else:
+            esquema = esquema or cargar_esquema()
+            categoricos, textos = campos_del_esquema(esquema)
+            self.meta = {
+                'version': ALMACEN_VERSION,
+                'huella_esquema': esquema['huella'],
+                'items': list(esquema['items']),
+                'categoricos': {name: list(opciones) for name, opciones in categoricos.items()},
+                'textos': textos,
+                'filas': 0,
+            }
+            for subdirectorio in ('likert', 'categorico', 'texto'):
+                os.makedirs(os.path.join(directorio, subdirectorio), exist_ok=True)
+            self._guardar_meta()
+        self._reparado = False
+
+    # Metadatos
+
+    @property
+    def filas(self):
+        return self.meta['filas']
+
+    @property
+    def items(self):
+        return self.meta['items']
+
+    @property
+    def categoricos(self):
+        return self.meta['categoricos']
+
+    @property
+    def textos(self):
+        return self.meta['textos']
+
+    def _guardar_meta(self):
+        temporal = f'{self.ruta_meta}.{os.getpid()}.tmp'
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(self.meta, f, ensure_ascii=False, indent=1)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, self.ruta_meta)
+
+    def recargar(self):
+        """Leer de nuevo meta.json para ver las filas confirmadas por otro proceso"""
+        with open(self.ruta_meta, encoding='utf-8') as f:
+            self.meta = json.load(f)
+
+    # Rutas de columnas
+
+    def _ruta(self, *partes):
+        return os.path.join(self.directorio, *partes)
+
+    def _ruta_likert(self, item):
+        return self._ruta('likert', f'{item}.u8')
+
+    def _ruta_categorico(self, campo):
+        return self._ruta('categorico', f'{campo}.u8')
+
+    def _rutas_texto(self, campo):
+        return self._ruta('texto', f'{campo}.heap'), self._ruta('texto', f'{campo}.off')
+
+    def _columna(self, ruta, dtype, filas=None):
+        filas = self.filas if filas is None else filas
+        if filas == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(ruta, dtype=dtype, mode='r', shape=(filas,))
+
+    # Lectura
+
+    def likert(self, item):
+        """Columna Likert de un ítem (memmap uint8)"""
+        if item not in self.items:
+            raise KeyError(item)
+        return self._columna(self._ruta_likert(item), np.uint8)
+
+    def matriz(self, items=None, inicio=0, fin=None):
+        """Matriz encuestado × ítem (uint8) de las filas [inicio, fin)"""
+        items = self.items if items is None else items
+        fin = self.filas if fin is None else min(fin, self.filas)
+        # Orden Fortran: cada columna se copia de forma contigua desde su archivo
+        matriz = np.empty((max(fin - inicio, 0), len(items)), dtype=np.uint8, order='F')
+        for j, item in enumerate(items):
+            matriz[:, j] = self.likert(item)[inicio:fin]
+        return matriz
+
+    def categorico(self, campo):
+        """Códigos de un campo categórico (memmap uint8; 1 = primera opción)"""
+        if campo not in self.categoricos:
+            raise KeyError(campo)
+        return self._columna(self._ruta_categorico(campo), np.uint8)
+
+    def recibido(self):
+        """Fecha de recepción de cada respuesta (memmap float64)"""
+        return self._columna(self._ruta('recibido.f8'), np.float64)
+
+    def duracion(self):
+        """Segundos de llenado de cada respuesta (memmap float64; NaN si no se registró)"""
+        if not os.path.exists(self._ruta('duracion.f8')):
+            # Almacén creado antes de esta columna y aún sin escrituras nuevas
+            return np.full(self.filas, np.nan)
+        return self._columna(self._ruta('duracion.f8'), np.float64)
+
+    def _heap_y_finales(self, campo):
+        if campo not in self.textos:
+            raise KeyError(campo)
+        ruta_heap, ruta_off = self._rutas_texto(campo)
+        finales = self._columna(ruta_off, np.uint64)
+        largo = int(finales[-1]) if len(finales) else 0
+        heap = np.memmap(ruta_heap, dtype=np.uint8, mode='r', shape=(largo,)) if largo else np.zeros(0, np.uint8)
+        return heap, finales
+
+    def texto(self, campo, fila):
+        """Texto de una respuesta ('' si no se respondió)"""
+        heap, finales = self._heap_y_finales(campo)
+        inicio = int(finales[fila - 1]) if fila else 0
+        return heap[inicio:int(finales[fila])].tobytes().decode('utf-8')
+
+    def iterar_textos(self, campo, inicio=0, fin=None):
+        """Textos de las filas [inicio, fin), en orden"""
+        heap, finales = self._heap_y_finales(campo)
+        fin = len(finales) if fin is None else min(fin, len(finales))
+        anterior = int(finales[inicio - 1]) if inicio else 0
+        for final in finales[inicio:fin].tolist():
+            yield heap[anterior:final].tobytes().decode('utf-8')
+            anterior = final
+
+    # Escritura
+
+    def _reparar(self):
+        """Recortar lo escrito después de la última confirmación (escritura interrumpida)"""
+        self.recargar()
+        filas = self.filas
+        if not os.path.exists(self._ruta('duracion.f8')):
+            # Almacén anterior a la columna de duración: las filas existentes quedan sin duración
+            with open(self._ruta('duracion.f8'), 'wb') as f:
+                f.write(np.full(filas, np.nan).tobytes())
+        esperados = {self._ruta('recibido.f8'): filas * 8, self._ruta('duracion.f8'): filas * 8}
+        esperados.update((self._ruta_likert(item), filas) for item in self.items)
+        esperados.update((self._ruta_categorico(campo), filas) for campo in self.categoricos)
+        for campo in self.textos:
+            ruta_heap, ruta_off = self._rutas_texto(campo)
+            finales = self._columna(ruta_off, np.uint64)
+            esperados[ruta_off] = filas * 8
+            esperados[ruta_heap] = int(finales[-1]) if filas else 0
+            del finales
+        for ruta, tamano in esperados.items():
+            if not os.path.exists(ruta):
+                open(ruta, 'wb').close()
+            if os.path.getsize(ruta) != tamano:
+                with open(ruta, 'r+b') as f:
+                    f.truncate(tamano)
+        self._reparado = True
+
+    def agregar_columnas(self, likert, categoricos=None, textos=None, recibido=None, duracion=None):
+        """Agregar filas ya en columnas: matriz Likert N × ítems, códigos uint8, listas de textos y segundos de llenado"""
+        likert = np.ascontiguousarray(likert, dtype=np.uint8)
+        if likert.ndim != 2 or likert.shape[1] != len(self.items):
+            raise ValueError(f"Se esperaba una matriz de N × {len(self.items)} ítems")
+        nuevas = likert.shape[0]
+        if nuevas == 0:
+            return 0
+        if likert.max() > 5:
+            raise ValueError("La matriz contiene valores fuera de la escala Likert")
+        categoricos = categoricos or {}
+        textos = textos or {}
+        desconocidos = sorted((set(categoricos) - set(self.categoricos)) | (set(textos) - set(self.textos)))
+        if desconocidos:
+            raise ValueError(f"Campos desconocidos: {', '.join(desconocidos)}")
+        if recibido is None:
+            recibido = np.full(nuevas, time.time())
+        if duracion is None:
+            duracion = np.full(nuevas, np.nan)
+
+        # Preparar y validar todo antes de tocar los archivos
+        columnas = {
+            self._ruta('recibido.f8'): np.asarray(recibido, dtype=np.float64).reshape(nuevas).tobytes(),
+            self._ruta('duracion.f8'): np.asarray(duracion, dtype=np.float64).reshape(nuevas).tobytes(),
+        }
+        # Transponer una vez: cada columna queda contigua en memoria
+        for item, columna in zip(self.items, np.ascontiguousarray(likert.T)):
+            columnas[self._ruta_likert(item)] = columna.tobytes()
+        for campo, opciones in self.categoricos.items():
+            codigos = np.asarray(categoricos.get(campo, np.zeros(nuevas)), dtype=np.uint8).reshape(nuevas)
+            if codigos.max() > len(opciones):
+                raise ValueError(f"Código fuera de rango en '{campo}'")
+            columnas[self._ruta_categorico(campo)] = codigos.tobytes()
+        heaps = {}
+        for campo in self.textos:
+            valores = textos.get(campo)
+            if not valores:
+                heaps[campo] = None
+                continue
+            if len(valores) != nuevas:
+                raise ValueError(f"El campo '{campo}' tiene {len(valores)} textos para {nuevas} filas")
+            heaps[campo] = [(valor or '').encode('utf-8') for valor in valores]
+
+        if not self._reparado:
+            self._reparar()
+        try:
+            for ruta, contenido in columnas.items():
+                with open(ruta, 'ab') as f:
+                    f.write(contenido)
+            for campo, codificados in heaps.items():
+                ruta_heap, ruta_off = self._rutas_texto(campo)
+                base = os.path.getsize(ruta_heap)
+                if codificados is None:
+                    # Campo sin textos en este lote: todas las filas vacías
+                    finales = np.full(nuevas, base, dtype=np.uint64)
+                else:
+                    finales = base + np.cumsum([len(b) for b in codificados], dtype=np.uint64)
+                    with open(ruta_heap, 'ab') as f:
+                        f.write(b''.join(codificados))
+                with open(ruta_off, 'ab') as f:
+                    f.write(finales.tobytes())
+        except BaseException:
+            # Lo escrito a medias se recorta antes de la próxima escritura
+            self._reparado = False
+            raise
+
+        # Confirmación: las filas existen cuando meta.json las cuenta
+        self.meta['filas'] += nuevas
+        self._guardar_meta()
+        return nuevas
+
+    def agregar(self, respuestas, recibido=None):
+        """Agregar respuestas validadas (diccionarios como los de validar_respuesta)"""
+        respuestas = list(respuestas)
+        indice = {item: j for j, item in enumerate(self.items)}
+        likert = np.zeros((len(respuestas), len(self.items)), dtype=np.uint8)
+        categoricos = {campo: np.zeros(len(respuestas), dtype=np.uint8) for campo in self.categoricos}
+        codigos = {campo: {opcion: i for i, opcion in enumerate(opciones, 1)}
+                   for campo, opciones in self.categoricos.items()}
+        textos = {campo: [''] * len(respuestas) for campo in self.textos}
+        for fila, respuesta in enumerate(respuestas):
+            for key, value in respuesta.items():
+                if key in indice:
+                    likert[fila, indice[key]] = int(value)
+                elif key in codigos:
+                    categoricos[key][fila] = codigos[key][str(value)]
+                elif key in textos:
+                    textos[key][fila] = value
+        return self.agregar_columnas(likert, categoricos, textos, recibido, duraciones(respuestas))
+
+    # Interfaz de AlmacenRespuestas para servicio_respuestas.py
+
+    def abrir(self):
+        self._reparar()
+
+    def escribir_lote(self, filas):
+        """Agregar un lote de (id, recibido, datos_json) del servicio de respuestas"""
+        self.agregar([json.loads(datos) for _, _, datos in filas], [recibido for _, recibido, _ in filas])
+
+    def contar(self):
+        return self.filas
+
+    def cerrar(self):
+        pass
+
+def importar_sqlite(almacen, ruta_db, lote=50_000):
+    """Copiar al almacén las respuestas guardadas por servicio_respuestas.py"""
+    conexion = sqlite3.connect(ruta_db)
+    total = 0
+    try:
+        cursor = conexion.execute('SELECT recibido, datos FROM respuestas ORDER BY recibido')
+        while True:
+            filas = cursor.fetchmany(lote)
+            if not filas:
+                break
+            total += almacen.agregar([json.loads(datos) for _, datos in filas], [recibido for recibido, _ in filas])
+    finally:
+        conexion.close()
+    return total
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Almacén columnar de respuestas del cuestionario')
+    parser.add_argument('directorio', help='Directorio del almacén (se crea si no existe)')
+    parser.add_argument('--desde-sqlite', metavar='DB', help='Importar las respuestas del servicio de respuestas')
+    args = parser.parse_args()
+
+    almacen = AlmacenColumnar(args.directorio, cargar_esquema())
+    if args.desde_sqlite:
+        print(f"🚀 Importando respuestas de {args.desde_sqlite}...")
+        inicio = time.perf_counter()
+        total = importar_sqlite(almacen, args.desde_sqlite)
+        print(f"✅ {total} respuestas importadas en {time.perf_counter() - inicio:.2f}s")
+
+    print(f"📁 Almacén: {args.directorio}")
+    print(f"📊 Respuestas: {almacen.filas}")
+    print(f"📝 Ítems Likert: {len(almacen.items)}")
+    print(f"🏷️ Campos categóricos: {len(almacen.categoricos)}")
+    print(f"💬 Campos de texto: {len(almacen.textos)}")
+
+if __name__ == "__main__":
+    main()
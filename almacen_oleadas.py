@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Almacén de oleadas del Cuestionario Likert (encuestas periódicas)
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Organiza las respuestas por campaña y oleada (por ejemplo, una oleada
+por trimestre), cada una en su propio almacén columnar, junto con sus
+agregados por ítem y por sección (agregados_en_linea.py) ya calculados:
+
+    <raíz>/<campaña>/oleadas.json           orden y fecha de las oleadas
+    <raíz>/<campaña>/<oleada>/              almacén columnar de la oleada
+    <raíz>/<campaña>/<oleada>/agregados.npz resumen materializado
+
+Las respuestas tardías se agregan a su oleada en cualquier momento: solo
+el bloque nuevo se incorpora al resumen. Las consultas de tendencia
+comparan las oleadas leyendo únicamente los resúmenes (media, varianza
+y conteo de cada una), sin volver a leer ni importar respuestas viejas.
+Por sección, la unidad de comparación es el encuestado (su media en la
+sección), no cada respuesta a un ítem; por ítem, cada respuesta.
+
+Uso:
+    python almacen_oleadas.py --campana satisfaccion --oleada 2025T3 --importar respuestas_forms.csv
+    python almacen_oleadas.py --campana satisfaccion --oleada 2025T4 --sintetico 100000
+    python almacen_oleadas.py --campana satisfaccion
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+import zlib
+
+from agregados_en_linea import AgregadosEnLinea
+from almacen_columnar import AlmacenColumnar
+from esquema_cuestionario import cargar_esquema
+from intervalos_bootstrap import NIVEL_CONFIANZA
+
+OLEADAS_VERSION = 1
+
+def comparar(actual, anterior=None, nivel=NIVEL_CONFIANZA):
+    """Media de una oleada con su intervalo y, si hay `anterior`, la diferencia con su intervalo (Welch)"""
+    z = statistics.NormalDist().inv_cdf((1 + nivel) / 2)
+    punto = {'n': actual['n'], 'media': actual['media'], 'inferior': None, 'superior': None}
+    error = actual['varianza'] / actual['n'] if actual['n'] > 1 else None
+    if error is not None:
+        punto['inferior'] = actual['media'] - z * error ** 0.5
+        punto['superior'] = actual['media'] + z * error ** 0.5
+    if anterior is None:
+        return punto
+
+    punto['diferencia'] = actual['media'] - anterior['media'] if actual['n'] and anterior['n'] else None
+    punto['significativa'] = False
+    if error is not None and anterior['n'] > 1:
+        margen = z * (error + anterior['varianza'] / anterior['n']) ** 0.5
+        punto['diferencia_inferior'] = punto['diferencia'] - margen
+        punto['diferencia_superior'] = punto['diferencia'] + margen
+        punto['significativa'] = not punto['diferencia_inferior'] <= 0 <= punto['diferencia_superior']
+    return punto
+
+class Oleada:
+    """Almacén columnar de una oleada con su resumen actualizado en cada bloque"""
+
+    def __init__(self, directorio, esquema=None):
+        self.esquema = esquema or cargar_esquema()
+        self.directorio = directorio
+        self.almacen = AlmacenColumnar(directorio, self.esquema)
+        self.ruta_agregados = os.path.join(directorio, 'agregados.npz')
+        self._agregados = None
+
+    @property
+    def agregados(self):
+        """Resumen al día con el almacén (solo incorpora las filas que aún no contiene)"""
+        self.almacen.recargar()
+        if self._agregados is None:
+            try:
+                self._agregados = AgregadosEnLinea.cargar(self.ruta_agregados, self.esquema)
+            except (OSError, ValueError, KeyError):
+                self._agregados = AgregadosEnLinea(self.esquema)  # Sin resumen o dañado: recalcular
+        if self._agregados.filas > self.almacen.filas:
+            self._agregados = AgregadosEnLinea(self.esquema)
+        if self._agregados.filas < self.almacen.filas:
+            # Filas escritas por otro proceso o tras una interrupción
+            self._agregados.sincronizar(self.almacen)
+            self._agregados.guardar(self.ruta_agregados)
+        return self._agregados
+
+    @property
+    def filas(self):
+        return self.almacen.filas
+
+    def agregar_columnas(self, likert, categoricos=None, textos=None, recibido=None, duracion=None):
+        """Guardar un bloque en la oleada e incorporarlo al resumen"""
+        agregados = self.agregados
+        nuevas = self.almacen.agregar_columnas(likert, categoricos, textos, recibido, duracion)
+        if nuevas:
+            agregados.agregar_columnas(likert, duracion=duracion)
+            agregados.guardar(self.ruta_agregados)
+        return nuevas
+
+    def resumen(self):
+        """Resultados actuales por sección e ítem"""
+        return self.agregados.resumen()
+
+def validar_nombre(nombre, tipo):
+    """Nombre de campaña u oleada usable como directorio dentro de la raíz; ValueError si no lo es"""
+    if not nombre or os.sep in nombre or (os.altsep and os.altsep in nombre) or nombre.startswith('.'):
+        raise ValueError(f"Nombre de {tipo} no válido: {nombre!r}")
+    return nombre
+
+class AlmacenOleadas:
+    """Campañas y oleadas de la encuesta con sus resúmenes materializados"""
+
+    def __init__(self, raiz, esquema=None):
+        self.raiz = raiz
+        self.esquema = esquema or cargar_esquema()
+        self._oleadas = {}
+
+    # Campañas y oleadas
+
+    def _ruta_indice(self, campana):
+        return os.path.join(self.raiz, validar_nombre(campana, 'campaña'), 'oleadas.json')
+
+    def _leer_indice(self, campana):
+        validar_nombre(campana, 'campaña')
+        try:
+            with open(self._ruta_indice(campana), encoding='utf-8') as f:
+                indice = json.load(f)
+        except FileNotFoundError:
+            return {'version': OLEADAS_VERSION, 'oleadas': []}
+        if indice['version'] != OLEADAS_VERSION:
+            raise ValueError(f"Versión de índice de oleadas no soportada: {indice['version']}")
+        return indice
+
+    def _guardar_indice(self, campana, indice):
+        ruta = self._ruta_indice(campana)
+        temporal = f'{ruta}.{os.getpid()}.tmp'
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(indice, f, ensure_ascii=False, indent=1)
+        os.replace(temporal, ruta)
+
+    def campanas(self):
+        """Campañas con al menos una oleada"""
+        if not os.path.isdir(self.raiz):
+            return []
+        return sorted(nombre for nombre in os.listdir(self.raiz)
+                      if not nombre.startswith('.') and os.path.exists(self._ruta_indice(nombre)))
+
+    def oleadas(self, campana):
+        """Nombres de las oleadas de una campaña, en orden de creación"""
+        return [o['nombre'] for o in self._leer_indice(campana)['oleadas']]
+
+    def oleada(self, campana, nombre, crear=True):
+        """Oleada de una campaña (la registra al final si no existe y `crear` es True)"""
+        clave = (campana, nombre)
+        if clave in self._oleadas:
+            return self._oleadas[clave]
+        validar_nombre(campana, 'campaña')
+        validar_nombre(nombre, 'oleada')
+        indice = self._leer_indice(campana)
+        if nombre not in (o['nombre'] for o in indice['oleadas']):
+            if not crear:
+                raise KeyError(f"La campaña '{campana}' no tiene la oleada '{nombre}'")
+            os.makedirs(os.path.join(self.raiz, campana), exist_ok=True)
+            indice['oleadas'].append({'nombre': nombre, 'creada': time.time()})
+            self._guardar_indice(campana, indice)
+        self._oleadas[clave] = Oleada(os.path.join(self.raiz, campana, nombre), self.esquema)
+        return self._oleadas[clave]
+
+    # Consultas
+
+    def resumenes(self, campana, oleadas=None):
+        """{oleada: resumen} en orden, desde los resúmenes materializados"""
+        return {nombre: self.oleada(campana, nombre, crear=False).resumen()
+                for nombre in (oleadas or self.oleadas(campana))}
+
+    def tendencia(self, campana, oleadas=None, nivel=NIVEL_CONFIANZA):
+        """Por sección, una entrada por oleada con su media, intervalo y diferencia con la anterior
+
+        Se compara la media por encuestado de cada sección (n = encuestados, varianza entre encuestados):
+        con las respuestas a cada ítem como unidad el intervalo sería demasiado estrecho.
+        """
+        resumenes = self.resumenes(campana, oleadas)
+        tendencia = {titulo: [] for titulo, _ in self.esquema['secciones']}
+        anteriores = {}
+        for nombre, resumen in resumenes.items():
+            for titulo, seccion in zip(tendencia, resumen['secciones']):
+                encuestados = {clave: seccion[clave] for clave in ('n', 'media', 'varianza')}
+                tendencia[titulo].append(dict(comparar(encuestados, anteriores.get(titulo), nivel),
+                                              oleada=nombre, invertida=seccion['invertida']))
+                anteriores[titulo] = encuestados
+        return tendencia
+
+    def tendencia_item(self, campana, item, oleadas=None, nivel=NIVEL_CONFIANZA):
+        """Una entrada por oleada con la media del ítem (sin invertir) y su diferencia con la oleada anterior"""
+        puntos = []
+        anterior = None
+        for nombre, resumen in self.resumenes(campana, oleadas).items():
+            actual = resumen['items'][item]
+            puntos.append(dict(comparar(actual, anterior, nivel), oleada=nombre))
+            anterior = actual
+        return puntos
+
+def imprimir_tendencia(tendencia):
+    """Media de cada sección por oleada, con ▲/▼ si cambia respecto de la anterior"""
+    for titulo, puntos in tendencia.items():
+        invertida = any(punto.get('invertida') for punto in puntos)
+        print(f"📊 {titulo}" + (' (ítems invertidos: más alto = mejor)' if invertida else ''))
+        for punto in puntos:
+            linea = f"   {punto['oleada']:<12} n={punto['n']:<9}"
+            if not punto['n']:
+                print(f"{linea} sin respuestas")
+                continue
+            linea += f" media {punto['media']:.2f}"
+            if punto.get('diferencia') is not None:
+                marca = ('▲' if punto['diferencia'] > 0 else '▼') if punto['significativa'] else '='
+                linea += f"  {marca} {punto['diferencia']:+.2f}"
+            print(linea)
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Almacén de oleadas de la encuesta y comparación entre oleadas')
+    parser.add_argument('--raiz', default='oleadas', help='Directorio raíz de las campañas')
+    parser.add_argument('--campana', required=True, help='Campaña (encuesta que se repite)')
+    parser.add_argument('--oleada', help='Oleada a la que se agregan respuestas')
+    grupo = parser.add_mutually_exclusive_group()
+    grupo.add_argument('--importar', nargs='+', metavar='ARCHIVO', help='Exportaciones CSV/JSONL a importar')
+    grupo.add_argument('--sintetico', type=int, metavar='N', help='Agregar N respuestas aleatorias')
+    args = parser.parse_args()
+    if (args.importar or args.sintetico) and not args.oleada:
+        parser.error('--importar y --sintetico requieren --oleada')
+    try:
+        validar_nombre(args.campana, 'campaña')
+        if args.oleada is not None:
+            validar_nombre(args.oleada, 'oleada')
+    except ValueError as error:
+        parser.error(str(error))
+
+    esquema = cargar_esquema()
+    almacen = AlmacenOleadas(args.raiz, esquema)
+    if args.oleada and (args.importar or args.sintetico):
+        oleada = almacen.oleada(args.campana, args.oleada)
+        print(f"🚀 Agregando respuestas a {args.campana}/{args.oleada}...")
+        inicio = time.perf_counter()
+        if args.importar:
+            from importador_respuestas import importar
+            importar(args.importar, [oleada], esquema)
+        else:
+            from puntuaciones import BLOQUE_FILAS, matriz_sintetica
+            # Semilla distinta por oleada y por bloque
+            semilla = zlib.crc32(f'{args.campana}/{args.oleada}'.encode('utf-8'))
+            for desde in range(0, args.sintetico, BLOQUE_FILAS):
+                oleada.agregar_columnas(matriz_sintetica(min(BLOQUE_FILAS, args.sintetico - desde),
+                                                         [semilla, oleada.filas], esquema))
+        print(f"✅ Oleada con {oleada.filas} respuestas ({time.perf_counter() - inicio:.2f}s)")
+
+    inicio = time.perf_counter()
+    tendencia = almacen.tendencia(args.campana)
+    print(f"📈 Tendencia de {args.campana}: {len(almacen.oleadas(args.campana))} oleadas "
+          f"({time.perf_counter() - inicio:.2f}s)")
+    imprimir_tendencia(tendencia)
+
+if __name__ == "__main__":
+    main()
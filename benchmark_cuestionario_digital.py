@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark del generador de Cuestionario Digital HTML
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Compara la escritura por secciones (write_cuestionario_html) con la
+concatenación acumulada de la versión anterior, midiendo tiempo de
+construcción y memoria pico (RSS) para 100, 10k y 100k preguntas.
+Cada medición corre en un proceso aparte para aislar la memoria pico.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import generar_cuestionario_digital as gcd
+from esquema_cuestionario import cargar_esquema
+
+TAMANOS = [100, 10_000, 100_000]
+MODOS = ['streaming', 'concatenacion']
+
+def crear_cuestionario_sintetico(total_preguntas, por_subseccion=5, subsecciones_por_seccion=4):
+    """Crear preguntas y secciones sintéticas con el total indicado"""
+    preguntas = {}
+    subsecciones = []
+    for g in range(0, total_preguntas, por_subseccion):
+        key = f'grupo{g // por_subseccion}'
+        n = min(por_subseccion, total_preguntas - g)
+        preguntas[key] = [f'Pregunta de prueba {g + i + 1} sobre el sistema LogicQP' for i in range(n)]
+        subsecciones.append((f'Subsección {key}', key))
+
+    secciones = []
+    for s in range(0, len(subsecciones), subsecciones_por_seccion):
+        secciones.append((f'SECCIÓN {s // subsecciones_por_seccion + 1}', subsecciones[s:s + subsecciones_por_seccion]))
+    return preguntas, secciones
+
+def generate_likert_table_concatenado(questions, section_name, question_prefix):
+    """Tabla Likert armada con html += ... como en la versión anterior"""
+    html = gcd.generate_likert_table([], section_name, question_prefix).rsplit('</tbody>', 1)[0]
+    for i, question in enumerate(questions, 1):
+        question_name = f"{question_prefix}_{i}"
+        html += f"""
+                            <tr>
+                                <td class="question-text">{question}</td>
+"""
+        for value in range(1, 6):
+            html += f"""                                <td class="likert-options">
+                                    <input type="radio" name="{question_name}" value="{value}" required>
+                                </td>
+"""
+        html += """                            </tr>
+        """
+    html += """
+                        </tbody>
+                    </table>
+    """
+    return html
+
+def render_concatenado(preguntas, secciones):
+    """Reproducir el armado anterior con html_content += ..."""
+    html_content = gcd.HTML_ENCABEZADO
+    section_counter = 1
+    for section_title, subsections in secciones:
+        html_content += f"""
+                <div class="section">
+                    <div class="section-counter">Sección {section_counter}</div>
+                    <h2>{section_title}</h2>
+"""
+        for subsection_title, question_key in subsections:
+            html_content += generate_likert_table_concatenado(preguntas[question_key], subsection_title, question_key)
+        html_content += """
+                </div>
+"""
+        section_counter += 1
+    html_content += gcd.HTML_COMENTARIOS
+    for pregunta, name in cargar_esquema()['comentarios']:
+        html_content += gcd.generate_text_area(pregunta, name, required=False)
+    html_content += gcd.HTML_EVALUACION_GENERAL
+    html_content += gcd.HTML_FIN_FORMULARIO
+    html_content += gcd.JS_PROGRESO
+    html_content += gcd.JS_TIEMPOS
+    html_content += f"        const ENDPOINT_RESPUESTAS = {json.dumps(gcd.ENDPOINT_RESPUESTAS)};\n"
+    html_content += gcd.JS_ENVIO
+    html_content += gcd.generate_calculate_scores(cargar_esquema())
+    html_content += gcd.JS_RESUMEN_PUNTUACIONES
+    html_content += gcd.JS_AUTOGUARDADO_INDEXEDDB
+    html_content += gcd.HTML_FIN
+    return html_content
+
+def peak_rss_mb():
+    """Memoria pico del proceso actual en MB"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+def medir(total_preguntas, modo):
+    """Medir una construcción en el proceso actual"""
+    preguntas, secciones = crear_cuestionario_sintetico(total_preguntas)
+    base_rss = peak_rss_mb()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = os.path.join(tmp, 'cuestionario.html')
+        inicio = time.perf_counter()
+        if modo == 'streaming':
+            with open(output_file, 'w', encoding='utf-8') as f:
+                gcd.write_cuestionario_html(f, preguntas, secciones)
+        else:
+            html_content = render_concatenado(preguntas, secciones)
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(html_content)
+        duracion = time.perf_counter() - inicio
+        tamano = os.path.getsize(output_file)
+
+    print(f'{duracion:.4f} {peak_rss_mb() - base_rss:.1f} {peak_rss_mb():.1f} {tamano}')
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Benchmark del cuestionario digital HTML')
+    parser.add_argument('--tamanos', type=int, nargs='+', default=TAMANOS)
+    parser.add_argument('--modos', nargs='+', choices=MODOS, default=MODOS)
+    parser.add_argument('--medir', nargs=2, metavar=('PREGUNTAS', 'MODO'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        medir(int(args.medir[0]), args.medir[1])
+        return
+
+    print("🚀 Benchmark del Cuestionario Digital HTML")
+    print(f"{'Preguntas':>10} {'Modo':>14} {'Tiempo (s)':>11} {'Δ RSS (MB)':>11} {'RSS pico (MB)':>14} {'HTML (MB)':>10}")
+    for total in args.tamanos:
+        for modo in args.modos:
+            resultado = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--medir', str(total), modo],
+                capture_output=True, text=True, check=True,
+                cwd=os.path.dirname(os.path.abspath(__file__))
+            )
+            duracion, delta, pico, tamano = resultado.stdout.split()
+            print(f"{total:>10} {modo:>14} {float(duracion):>11.3f} {float(delta):>11.1f} {float(pico):>14.1f} {int(tamano) / 1e6:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de la escritura en flujo de documentos Word
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Compara python-docx (todo el documento en memoria hasta save()) con
+EscritorDocx (escritor_docx.py) en cuestionarios sintéticos de 10k,
+100k y 300k preguntas Likert repartidas en secciones de 500, midiendo
+tiempo, memoria pico (RSS) y tamaño del archivo. Cada medición corre en
+un proceso aparte para aislar la memoria pico.
+
+Con --validar se arma el mismo documento por ambos caminos y se
+comprueba que python-docx lo vuelve a abrir con los mismos párrafos y
+tablas, y que word/document.xml es idéntico.
+
+Uso:
+    python benchmark_escritor_docx.py
+    python benchmark_escritor_docx.py --tamanos 10000 --modos flujo
+    python benchmark_escritor_docx.py --validar
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+
+from docx import Document
+
+from escritor_docx import EscritorDocx
+from generar_cuestionario_docx import create_likert_table, create_text_area
+from plantilla_estilos import contenido_plantilla, documento_base
+
+TAMANOS = [10_000, 100_000, 300_000]
+MODOS = ['python-docx', 'flujo']
+PREGUNTAS_POR_SECCION = 500
+
+def peak_rss_mb():
+    """Memoria pico del proceso actual en MB"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+def crear_documento(modo):
+    """Documento vacío del modo indicado"""
+    return EscritorDocx() if modo == 'flujo' else documento_base()
+
+def escribir_cuestionario(doc, preguntas):
+    """Cuestionario sintético de `preguntas` preguntas Likert en secciones"""
+    doc.add_heading('📊 CUESTIONARIO SINTÉTICO - SISTEMA LOGICQP', 0)
+    for numero, inicio in enumerate(range(0, preguntas, PREGUNTAS_POR_SECCION), 1):
+        fin = min(inicio + PREGUNTAS_POR_SECCION, preguntas)
+        doc.add_heading(f'SECCIÓN {numero}', level=1)
+        doc.add_paragraph(f'Preguntas {inicio + 1} a {fin} sobre el uso diario del sistema.')
+        create_likert_table(doc, f'{numero}.1 Evaluación', [f'Pregunta de prueba {i} sobre el sistema LogicQP'
+                                                             for i in range(inicio + 1, fin + 1)])
+        create_text_area(doc, f'Comentarios de la sección {numero}:')
+    return doc
+
+def medir(preguntas, modo):
+    """Medir una construcción en el proceso actual"""
+    contenido_plantilla()
+    base_rss = peak_rss_mb()
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, 'cuestionario.docx')
+        inicio = time.perf_counter()
+        escribir_cuestionario(crear_documento(modo), preguntas).save(ruta)
+        duracion = time.perf_counter() - inicio
+        tamano = os.path.getsize(ruta)
+    print(f'{duracion:.4f} {peak_rss_mb() - base_rss:.1f} {peak_rss_mb():.1f} {tamano}')
+
+def validar(preguntas):
+    """Comprobar que el documento en flujo es el mismo que arma python-docx"""
+    with tempfile.TemporaryDirectory() as directorio:
+        rutas = {}
+        for modo in MODOS:
+            rutas[modo] = os.path.join(directorio, f'{modo}.docx')
+            escribir_cuestionario(crear_documento(modo), preguntas).save(rutas[modo])
+
+        partes = {}
+        for modo, ruta in rutas.items():
+            with zipfile.ZipFile(ruta) as docx:
+                partes[modo] = docx.read('word/document.xml')
+        documentos = {modo: Document(ruta) for modo, ruta in rutas.items()}
+
+    referencia, flujo = documentos['python-docx'], documentos['flujo']
+    parrafos = [p.text for p in referencia.paragraphs] == [p.text for p in flujo.paragraphs]
+    tablas = ([[c.text for r in t.rows for c in r.cells] for t in referencia.tables] ==
+              [[c.text for r in t.rows for c in r.cells] for t in flujo.tables])
+    estilos = [p.style.name for p in referencia.paragraphs] == [p.style.name for p in flujo.paragraphs]
+    print(f"{'✅' if parrafos else '❌'} Párrafos: {len(flujo.paragraphs)}")
+    print(f"{'✅' if tablas else '❌'} Tablas: {len(flujo.tables)} ({sum(len(t.rows) for t in flujo.tables)} filas)")
+    print(f"{'✅' if estilos else '❌'} Estilos de párrafo")
+    identico = partes['python-docx'] == partes['flujo']
+    print(f"{'✅' if identico else '❌'} word/document.xml idéntico ({len(partes['flujo']) / 1e6:.1f} MB)")
+    return parrafos and tablas and estilos and identico
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Benchmark de la escritura en flujo de documentos Word')
+    parser.add_argument('--tamanos', type=int, nargs='+', default=TAMANOS, help='Preguntas Likert por documento')
+    parser.add_argument('--modos', nargs='+', choices=MODOS, default=MODOS)
+    parser.add_argument('--validar', type=int, nargs='?', const=2_000, metavar='PREGUNTAS',
+                        help='Comparar ambos caminos con python-docx')
+    parser.add_argument('--medir', nargs=2, metavar=('PREGUNTAS', 'MODO'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        medir(int(args.medir[0]), args.medir[1])
+        return
+    if args.validar:
+        print(f"🔍 Validando el documento en flujo con python-docx ({args.validar} preguntas)...")
+        sys.exit(0 if validar(args.validar) else 1)
+
+    print("🚀 Benchmark de la escritura en flujo (DOCX)")
+    print(f"{'Preguntas':>10} {'Modo':>12} {'Tiempo (s)':>11} {'Δ RSS (MB)':>11} {'RSS pico (MB)':>14} {'Archivo (MB)':>13}")
+    for total in args.tamanos:
+        for modo in args.modos:
+            resultado = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--medir', str(total), modo],
+                capture_output=True, text=True, check=True,
+                cwd=os.path.dirname(os.path.abspath(__file__))
+            )
+            duracion, delta, pico, tamano = resultado.stdout.split()
+            print(f"{total:>10} {modo:>12} {float(duracion):>11.3f} {float(delta):>11.1f} "
+                  f"{float(pico):>14.1f} {int(tamano) / 1e6:>13.1f}")
+
+if __name__ == "__main__":
+    main()
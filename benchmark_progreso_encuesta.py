@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de latencia de eventos en el Cuestionario Digital HTML
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Abre el cuestionario generado en Chrome headless (Selenium) con 100, 1k
+y 5k ítems Likert y mide cuánto tarda el navegador en despachar cada
+evento 'change' (radio) e 'input' (textarea), comparando el progreso
+incremental con listener delegado contra la versión anterior, que
+recorría todo el formulario con querySelectorAll en cada evento.
+"""
+
+import argparse
+import os
+import tempfile
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+import generar_cuestionario_digital as gcd
+from benchmark_cuestionario_digital import crear_cuestionario_sintetico
+
+TAMANOS = [100, 1_000, 5_000]
+
+# Progreso de la versión anterior: una lectura completa del DOM por evento
+JS_PROGRESO_ANTERIOR = """        // Función para actualizar la barra de progreso
+        function updateProgress() {
+            const form = document.getElementById('likertForm');
+            const inputs = form.querySelectorAll('input[type="radio"]:checked, input[type="text"], input[type="email"], select, textarea');
+            const totalInputs = form.querySelectorAll('input[type="radio"], input[type="text"], input[type="email"], select, textarea').length;
+            const progress = (inputs.length / totalInputs) * 100;
+            document.getElementById('progressFill').style.width = progress + '%';
+        }
+
+        // Agregar event listeners para actualizar el progreso
+        document.addEventListener('DOMContentLoaded', function() {
+            const form = document.getElementById('likertForm');
+            const inputs = form.querySelectorAll('input, select, textarea');
+
+            inputs.forEach(input => {
+                input.addEventListener('change', updateProgress);
+                input.addEventListener('input', updateProgress);
+            });
+
+            updateProgress();
+        });
+
+"""
+
+VARIANTES = {
+    'incremental': gcd.JS_PROGRESO,
+    'anterior': JS_PROGRESO_ANTERIOR,
+}
+
+# Despacha eventos sintéticos y devuelve la duración de cada uno en ms
+JS_MEDICION = """
+const eventos = arguments[0];
+const form = document.getElementById('likertForm');
+const radios = form.querySelectorAll('input[type="radio"]');
+const textarea = form.querySelector('textarea');
+const change = [];
+const input = [];
+for (let i = 0; i < eventos; i++) {
+    const radio = radios[(i * 7919) % radios.length];
+    radio.checked = true;
+    let t0 = performance.now();
+    radio.dispatchEvent(new Event('change', { bubbles: true }));
+    change.push(performance.now() - t0);
+
+    textarea.value += 'a';
+    t0 = performance.now();
+    textarea.dispatchEvent(new Event('input', { bubbles: true }));
+    input.push(performance.now() - t0);
+}
+const resumen = valores => {
+    valores.sort((a, b) => a - b);
+    const suma = valores.reduce((a, b) => a + b, 0);
+    return {
+        media: suma / valores.length,
+        p50: valores[Math.floor(valores.length * 0.5)],
+        p95: valores[Math.floor(valores.length * 0.95)],
+    };
+};
+return { change: resumen(change), input: resumen(input) };
+"""
+
+def crear_driver():
+    """Chrome headless igual que en las capturas del informe"""
+    options = Options()
+    options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--window-size=1280,1024')
+    return webdriver.Chrome(options=options)
+
+def generar_variante(ruta, total_items, variante):
+    """Escribir el cuestionario sintético con el JS de progreso indicado"""
+    preguntas, secciones = crear_cuestionario_sintetico(total_items)
+    original = gcd.JS_PROGRESO
+    gcd.JS_PROGRESO = VARIANTES[variante]
+    try:
+        with open(ruta, 'w', encoding='utf-8') as f:
+            gcd.write_cuestionario_html(f, preguntas, secciones)
+    finally:
+        gcd.JS_PROGRESO = original
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Benchmark de latencia de eventos del cuestionario HTML')
+    parser.add_argument('--tamanos', type=int, nargs='+', default=TAMANOS)
+    parser.add_argument('--eventos', type=int, default=200, help='Eventos de cada tipo por medición')
+    args = parser.parse_args()
+
+    print("🚀 Benchmark de latencia de eventos (Chrome headless)")
+    print(f"{'Ítems':>7} {'Variante':>12} {'change media':>13} {'change p95':>11} {'input media':>12} {'input p95':>10}  (ms)")
+
+    driver = crear_driver()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for total in args.tamanos:
+                for variante in VARIANTES:
+                    ruta = os.path.join(tmp, f'cuestionario_{total}_{variante}.html')
+                    generar_variante(ruta, total, variante)
+                    driver.get(f'file://{ruta}')
+                    r = driver.execute_script(JS_MEDICION, args.eventos)
+                    print(f"{total:>7} {variante:>12} {r['change']['media']:>13.3f} {r['change']['p95']:>11.3f} "
+                          f"{r['input']['media']:>12.3f} {r['input']['p95']:>10.3f}")
+    finally:
+        driver.quit()
+
+if __name__ == "__main__":
+    main()
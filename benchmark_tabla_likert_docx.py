@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de la tabla Likert de los cuestionarios Word
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Compara la construcción en bloque de tabla_likert_docx.py con el armado
+anterior celda por celda (table.add_row(), cell.text, alineación y
+cell.width a través de python-docx), midiendo tiempo y memoria pico
+(RSS) para tablas de 100, 5k y 50k filas. Cada medición corre en un
+proceso aparte para aislar la memoria pico.
+
+Uso:
+    python benchmark_tabla_likert_docx.py
+    python benchmark_tabla_likert_docx.py --tamanos 100 5000 --modos bloque
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from docx import Document
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Inches
+
+from tabla_likert_docx import agregar_tabla_likert
+
+TAMANOS = [100, 5_000, 50_000]
+MODOS = ['bloque', 'celdas']
+
+def create_likert_table_celdas(doc, questions):
+    """Tabla Likert armada celda por celda como en la versión anterior"""
+    table = doc.add_table(rows=1, cols=6)
+    table.style = 'Table Grid'
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+
+    hdr_cells = table.rows[0].cells
+    for i, texto in enumerate(['Pregunta', '1', '2', '3', '4', '5']):
+        hdr_cells[i].text = texto
+    for cell in hdr_cells:
+        cell.paragraphs[0].runs[0].bold = True
+        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    for question in questions:
+        row_cells = table.add_row().cells
+        row_cells[0].text = question
+        for i in range(1, 6):
+            row_cells[i].text = '☐'
+            row_cells[i].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    for row in table.rows:
+        row.cells[0].width = Inches(4.0)
+        for i in range(1, 6):
+            row.cells[i].width = Inches(0.5)
+    return table
+
+def create_likert_table_bloque(doc, questions):
+    """Tabla Likert construida en bloque"""
+    rows = [[question, '☐', '☐', '☐', '☐', '☐'] for question in questions]
+    return agregar_tabla_likert(doc, ['Pregunta', '1', '2', '3', '4', '5'], rows, [4.0, 0.5, 0.5, 0.5, 0.5, 0.5])
+
+def peak_rss_mb():
+    """Memoria pico del proceso actual en MB"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+def medir(filas, modo):
+    """Medir una construcción en el proceso actual"""
+    questions = [f'Pregunta de prueba {i} sobre el sistema LogicQP' for i in range(1, filas + 1)]
+    doc = Document()
+    base_rss = peak_rss_mb()
+    crear = create_likert_table_bloque if modo == 'bloque' else create_likert_table_celdas
+    inicio = time.perf_counter()
+    crear(doc, questions)
+    duracion = time.perf_counter() - inicio
+    print(f'{duracion:.4f} {peak_rss_mb() - base_rss:.1f} {peak_rss_mb():.1f}')
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Benchmark de la tabla Likert de los cuestionarios Word')
+    parser.add_argument('--tamanos', type=int, nargs='+', default=TAMANOS)
+    parser.add_argument('--modos', nargs='+', choices=MODOS, default=MODOS)
+    parser.add_argument('--medir', nargs=2, metavar=('FILAS', 'MODO'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        medir(int(args.medir[0]), args.medir[1])
+        return
+
+    print("🚀 Benchmark de la tabla Likert (DOCX)")
+    print(f"{'Filas':>10} {'Modo':>8} {'Tiempo (s)':>11} {'Δ RSS (MB)':>11} {'RSS pico (MB)':>14}")
+    for total in args.tamanos:
+        for modo in args.modos:
+            resultado = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--medir', str(total), modo],
+                capture_output=True, text=True, check=True,
+                cwd=os.path.dirname(os.path.abspath(__file__))
+            )
+            duracion, delta, pico = resultado.stdout.split()
+            print(f"{total:>10} {modo:>8} {float(duracion):>11.3f} {float(delta):>11.1f} {float(pico):>14.1f}")
+
+if __name__ == "__main__":
+    main()
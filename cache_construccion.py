@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Caché incremental por contenido para los documentos generados
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Cada objetivo se identifica con una clave SHA-256 calculada a partir del
+código del generador y de los módulos locales que importa (incluido el
+esquema del cuestionario), las versiones de Python, python-docx y lxml, y
+cualquier valor externo que afecte el resultado (por ejemplo, el mes
+impreso en el documento).
+
+Las salidas se guardan en un almacén direccionado por contenido. Un
+objetivo cuya clave no cambió y cuyo archivo sigue intacto se omite sin
+leer su contenido; si el archivo falta, se restaura desde el almacén.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import shutil
+import sys
+from importlib import metadata
+
+from esquema_cuestionario import CACHE_DIR
+
+DIRECTORIO_BASE = os.path.dirname(os.path.abspath(__file__))
+
+# Bibliotecas cuya versión forma parte de la clave
+BIBLIOTECAS = ('python-docx', 'lxml')
+
+def sha256_archivo(ruta, bloque=1 << 20):
+    """Huella SHA-256 del contenido de un archivo"""
+    h = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for chunk in iter(lambda: f.read(bloque), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def modulos_locales(modulo, directorio=DIRECTORIO_BASE):
+    """Módulo y todos los módulos locales que importa, de forma recursiva"""
+    pendientes = [modulo]
+    encontrados = set()
+    while pendientes:
+        nombre = pendientes.pop()
+        ruta = os.path.join(directorio, f'{nombre}.py')
+        if nombre in encontrados or not os.path.exists(ruta):
+            continue
+        encontrados.add(nombre)
+        with open(ruta, 'rb') as f:
+            arbol = ast.parse(f.read(), filename=ruta)
+        for nodo in ast.walk(arbol):
+            if isinstance(nodo, ast.Import):
+                pendientes.extend(alias.name.split('.')[0] for alias in nodo.names)
+            elif isinstance(nodo, ast.ImportFrom) and nodo.module and not nodo.level:
+                pendientes.append(nodo.module.split('.')[0])
+    return sorted(encontrados)
+
+def versiones_bibliotecas():
+    """Versiones de Python y de las bibliotecas que generan los documentos"""
+    versiones = {'python': sys.version.split()[0]}
+    for biblioteca in BIBLIOTECAS:
+        try:
+            versiones[biblioteca] = metadata.version(biblioteca)
+        except metadata.PackageNotFoundError:
+            versiones[biblioteca] = None
+    return versiones
+
+class CacheConstruccion:
+    """Almacén por contenido y manifiesto de salidas instaladas"""
+
+    def __init__(self, directorio=None):
+        self.directorio = directorio or os.path.join(CACHE_DIR, 'construccion')
+        self.objetos = os.path.join(self.directorio, 'objetos')
+        self.claves = os.path.join(self.directorio, 'claves')
+        self.ruta_manifiesto = os.path.join(self.directorio, 'manifiesto.json')
+        self._versiones = versiones_bibliotecas()
+        self._huellas_fuente = {}
+        os.makedirs(self.objetos, exist_ok=True)
+        os.makedirs(self.claves, exist_ok=True)
+        try:
+            with open(self.ruta_manifiesto, encoding='utf-8') as f:
+                self.manifiesto = json.load(f)
+        except (OSError, ValueError):
+            self.manifiesto = {}
+
+    def clave(self, objetivo, modulo, extra=None):
+        """Clave de construcción de un objetivo"""
+        fuentes = {}
+        for nombre in modulos_locales(modulo):
+            if nombre not in self._huellas_fuente:
+                self._huellas_fuente[nombre] = sha256_archivo(os.path.join(DIRECTORIO_BASE, f'{nombre}.py'))
+            fuentes[nombre] = self._huellas_fuente[nombre]
+        contenido = json.dumps({
+            'objetivo': objetivo,
+            'fuentes': fuentes,
+            'versiones': self._versiones,
+            'extra': extra,
+        }, sort_keys=True)
+        return hashlib.sha256(contenido.encode('utf-8')).hexdigest()
+
+    def _ruta_objeto(self, sha):
+        return os.path.join(self.objetos, sha[:2], sha)
+
+    def _ruta_clave(self, clave):
+        return os.path.join(self.claves, clave)
+
+    def vigente(self, ruta, clave):
+        """True si `ruta` ya contiene la salida de `clave` (sin leer el archivo)"""
+        estado = self.manifiesto.get(os.path.abspath(ruta))
+        if not estado or estado['clave'] != clave:
+            return False
+        try:
+            st = os.stat(ruta)
+        except OSError:
+            return False
+        return st.st_size == estado['tamano'] and st.st_mtime_ns == estado['mtime_ns']
+
+    def objeto_de(self, clave):
+        """Huella de la salida almacenada para `clave`, o None"""
+        try:
+            with open(self._ruta_clave(clave), encoding='utf-8') as f:
+                sha = f.read().strip()
+        except OSError:
+            return None
+        return sha if os.path.exists(self._ruta_objeto(sha)) else None
+
+    def restaurar(self, ruta, clave):
+        """Copiar la salida almacenada de `clave` a `ruta`; False si no existe"""
+        sha = self.objeto_de(clave)
+        if sha is None:
+            return False
+        os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+        temporal = f'{ruta}.{os.getpid()}.tmp'
+        shutil.copyfile(self._ruta_objeto(sha), temporal)
+        os.replace(temporal, ruta)
+        self._registrar(ruta, clave, sha)
+        return True
+
+    def guardar(self, ruta, clave):
+        """Guardar en el almacén la salida recién construida en `ruta`"""
+        sha = sha256_archivo(ruta)
+        destino = self._ruta_objeto(sha)
+        if not os.path.exists(destino):
+            os.makedirs(os.path.dirname(destino), exist_ok=True)
+            temporal = f'{destino}.{os.getpid()}.tmp'
+            shutil.copyfile(ruta, temporal)
+            os.replace(temporal, destino)
+        with open(self._ruta_clave(clave), 'w', encoding='utf-8') as f:
+            f.write(sha)
+        self._registrar(ruta, clave, sha)
+        return sha
+
+    def _registrar(self, ruta, clave, sha):
+        st = os.stat(ruta)
+        self.manifiesto[os.path.abspath(ruta)] = {
+            'clave': clave,
+            'sha256': sha,
+            'tamano': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+        }
+
+    def guardar_manifiesto(self):
+        """Escribir el manifiesto de salidas instaladas"""
+        temporal = f'{self.ruta_manifiesto}.{os.getpid()}.tmp'
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(self.manifiesto, f, indent=1, sort_keys=True)
+        os.replace(temporal, self.ruta_manifiesto)
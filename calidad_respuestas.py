@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Control de calidad de las respuestas del Cuestionario Likert
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Marca a los encuestados cuyas respuestas no parecen atentas, con
+operaciones sobre toda la matriz encuestado × ítem (sin recorrer filas
+en Python):
+  - línea recta: casi todos los ítems con el mismo valor, o casi todas
+    las secciones respondidas con un único valor
+  - varianza baja entre los ítems del propio encuestado
+  - demasiado rápido: menos de SEGUNDOS_MINIMOS_POR_ITEM por ítem
+    respondido, según los tiempos que registra el cuestionario HTML
+
+Cada marca es un bit (LINEA_RECTA, VARIANZA_BAJA, RAPIDO); 0 = sin
+observaciones. Los agregados en línea (agregados_en_linea.py) descartan
+las respuestas marcadas al incorporarlas.
+
+Uso:
+    python calidad_respuestas.py --db respuestas.sqlite3
+    python calidad_respuestas.py --almacen campana_2025
+    python calidad_respuestas.py --sintetico 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from esquema_cuestionario import ESCALA_LIKERT, cargar_esquema
+from puntuaciones import BLOQUE_FILAS, leer_respuestas_sqlite, matriz_respuestas, matriz_sintetica
+
+LINEA_RECTA = 1
+VARIANZA_BAJA = 2
+RAPIDO = 4
+
+MOTIVOS = {
+    LINEA_RECTA: 'línea recta',
+    VARIANZA_BAJA: 'varianza baja',
+    RAPIDO: 'demasiado rápido',
+}
+
+# Umbrales
+PROPORCION_MODAL_MAXIMA = 0.9
+PROPORCION_SECCIONES_PLANAS = 0.75
+VARIANZA_MINIMA = 0.25
+SEGUNDOS_MINIMOS_POR_ITEM = 1.0
+# Con menos ítems respondidos no se evalúa el patrón de respuestas
+ITEMS_MINIMOS = 10
+
+VALORES = np.arange(1, len(ESCALA_LIKERT) + 1, dtype=np.float64)
+
+def validar_tiempos(tiempos):
+    """Normalizar el objeto `tiempos` que envía el cuestionario; lanza ValueError si no es válido"""
+    if not isinstance(tiempos, dict):
+        raise ValueError("'tiempos' debe ser un objeto")
+
+    def milisegundos(valor, nombre):
+        if isinstance(valor, bool) or not isinstance(valor, (int, float)) or not 0 <= valor < 1e9:
+            raise ValueError(f"Tiempo no válido en '{nombre}': {valor!r}")
+        return int(valor)
+
+    secciones = tiempos.get('secciones', {})
+    if not isinstance(secciones, dict):
+        raise ValueError("'tiempos.secciones' debe ser un objeto")
+    return {
+        'total_ms': milisegundos(tiempos.get('total_ms'), 'total_ms'),
+        'secciones': {str(seccion): milisegundos(valor, f'secciones.{seccion}')
+                      for seccion, valor in secciones.items()},
+    }
+
+def duraciones(respuestas):
+    """Segundos desde la carga del cuestionario hasta el envío (NaN si no se registró)"""
+    return np.array([(r.get('tiempos') or {}).get('total_ms', np.nan) for r in respuestas],
+                    dtype=np.float64) / 1000
+
+def indicadores_calidad(likert, esquema=None, duracion=None, bloque=BLOQUE_FILAS):
+    """Por encuestado: ítems respondidos, proporción del valor más repetido, varianza, secciones planas y s/ítem"""
+    esquema = esquema or cargar_esquema()
+    likert = np.asarray(likert)
+    filas, items = likert.shape
+    # Los ítems de cada sección son contiguos en la matriz
+    inicios = np.flatnonzero(np.diff(esquema['item_seccion'], prepend=-1))
+
+    indicadores = {
+        'respondidos': np.zeros(filas, dtype=np.int32),
+        'proporcion_modal': np.zeros(filas),
+        'varianza': np.full(filas, np.nan),
+        'secciones_planas': np.zeros(filas),
+    }
+    for inicio in range(0, filas, bloque):
+        valores = likert[inicio:inicio + bloque]
+        n_bloque = len(valores)
+        tramo = slice(inicio, inicio + n_bloque)
+        # Histograma 0-5 de cada fila con un solo bincount: celda fila * 6 + valor
+        desplazamiento = np.arange(n_bloque, dtype=np.intp)[:, None] * (len(VALORES) + 1)
+        conteos = np.bincount((valores + desplazamiento).ravel(), minlength=n_bloque * (len(VALORES) + 1))
+        conteos = conteos.reshape(n_bloque, len(VALORES) + 1)[:, 1:]
+        n = conteos.sum(axis=1)
+        suma = conteos @ VALORES
+        with np.errstate(divide='ignore', invalid='ignore'):
+            indicadores['proporcion_modal'][tramo] = np.where(n > 0, conteos.max(axis=1) / n, 0)
+            varianza = (conteos @ VALORES ** 2 - suma ** 2 / n) / (n - 1)
+        indicadores['varianza'][tramo] = np.where(n > 1, varianza, np.nan)
+        indicadores['respondidos'][tramo] = n
+
+        # Una sección es plana si tiene al menos dos respuestas y todas iguales (los 0 no cuentan)
+        maximo = np.maximum.reduceat(valores, inicios, axis=1)
+        minimo = np.minimum.reduceat(np.where(valores > 0, valores, len(VALORES) + 1), inicios, axis=1)
+        respondidas = np.add.reduceat((valores > 0).astype(np.int32), inicios, axis=1)
+        evaluables = respondidas >= 2
+        planas = (evaluables & (maximo == minimo)).sum(axis=1)
+        indicadores['secciones_planas'][tramo] = planas / np.maximum(evaluables.sum(axis=1), 1)
+
+    if duracion is None:
+        duracion = np.full(filas, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        indicadores['segundos_por_item'] = np.asarray(duracion, dtype=np.float64) / indicadores['respondidos']
+    return indicadores
+
+def marcas_desde_indicadores(indicadores):
+    """Bits de calidad de cada encuestado a partir de indicadores_calidad()"""
+    evaluable = indicadores['respondidos'] >= ITEMS_MINIMOS
+    linea_recta = evaluable & ((indicadores['proporcion_modal'] >= PROPORCION_MODAL_MAXIMA)
+                               | (indicadores['secciones_planas'] >= PROPORCION_SECCIONES_PLANAS))
+    # Las comparaciones con NaN son falsas: sin varianza o sin tiempos no se marca
+    varianza_baja = evaluable & (indicadores['varianza'] < VARIANZA_MINIMA)
+    rapido = indicadores['segundos_por_item'] < SEGUNDOS_MINIMOS_POR_ITEM
+    return (linea_recta * LINEA_RECTA | varianza_baja * VARIANZA_BAJA | rapido * RAPIDO).astype(np.uint8)
+
+def marcar(likert, esquema=None, duracion=None):
+    """Bits de calidad (0 = sin observaciones) de cada fila de la matriz"""
+    return marcas_desde_indicadores(indicadores_calidad(likert, esquema, duracion))
+
+def describir(marca):
+    """Motivos de una marca, separados por coma"""
+    return ', '.join(motivo for bit, motivo in MOTIVOS.items() if marca & bit) or 'sin observaciones'
+
+def datos_sinteticos(total, semilla=0, esquema=None):
+    """Respuestas aleatorias con un 3% en línea recta y un 2% respondidas a toda velocidad"""
+    esquema = esquema or cargar_esquema()
+    rng = np.random.default_rng(semilla)
+    likert = matriz_sintetica(total, semilla, esquema)
+    linea = rng.random(total) < 0.03
+    likert[linea] = rng.integers(1, 6, (int(linea.sum()), 1), dtype=np.uint8)
+    duracion = rng.uniform(3, 8, total) * len(esquema['items'])
+    rapidas = rng.random(total) < 0.02
+    duracion[rapidas] = rng.uniform(0.2, 0.8, int(rapidas.sum())) * len(esquema['items'])
+    return likert, duracion
+
+def imprimir_resumen(marcas):
+    """Cantidad de respuestas por motivo"""
+    total = len(marcas)
+    print(f"📊 Respuestas evaluadas: {total}")
+    if not total:
+        return
+    print(f"   ✅ Sin observaciones: {int(np.count_nonzero(marcas == 0))} ({np.mean(marcas == 0):.1%})")
+    for bit, motivo in MOTIVOS.items():
+        cantidad = int(np.count_nonzero(marcas & bit))
+        print(f"   ⚠️ {motivo:<18} {cantidad:>9} ({cantidad / total:.1%})")
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Detección de respuestas en línea recta y demasiado rápidas')
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument('--db', help='Base SQLite de servicio_respuestas.py')
+    grupo.add_argument('--almacen', help='Directorio del almacén columnar')
+    grupo.add_argument('--sintetico', type=int, metavar='N', help='Medir con N respuestas aleatorias')
+    args = parser.parse_args()
+
+    esquema = cargar_esquema()
+    duracion = None
+    if args.sintetico:
+        print(f"🚀 Generando {args.sintetico} respuestas sintéticas...")
+        likert, duracion = datos_sinteticos(args.sintetico, esquema=esquema)
+    elif args.almacen:
+        from almacen_columnar import AlmacenColumnar
+        print(f"🚀 Cargando respuestas de {args.almacen}...")
+        almacen = AlmacenColumnar(args.almacen, esquema)
+        likert, duracion = almacen.matriz(), np.array(almacen.duracion())
+    else:
+        print(f"🚀 Cargando respuestas de {args.db}...")
+        respuestas = list(leer_respuestas_sqlite(args.db))
+        likert, duracion = matriz_respuestas(respuestas, esquema), duraciones(respuestas)
+
+    inicio = time.perf_counter()
+    marcas = marcar(likert, esquema, duracion)
+    print(f"⏱️ Calidad evaluada en {time.perf_counter() - inicio:.2f}s")
+    imprimir_resumen(marcas)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Combinación de correspondencia del Cuestionario Likert en Word
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Genera un cuestionario prellenado por encuestado (nombre, rol, sucursal
+e ID único) con el diseño de generar_cuestionario_docx.py, sin volver a
+construir el documento cada vez:
+
+  1. El documento base se construye una sola vez, con marcadores
+     ({{nombre}}, {{rol}}, ...) en los datos del encuestado.
+  2. Su word/document.xml se divide en los tramos fijos entre
+     marcadores; las demás partes del .docx se comprimen una sola vez.
+  3. Cada cuestionario une los tramos con los datos escapados para XML
+     y agrega ese document.xml al .docx base ya comprimido.
+
+Los cuestionarios se reparten en un pool de procesos y se escriben en
+un directorio o en un .zip.
+
+Uso:
+    python combinar_cuestionarios_docx.py encuestados.csv --salida cuestionarios.zip --procesos 4
+    python combinar_cuestionarios_docx.py --sintetico 10000 --salida cuestionarios
+"""
+
+import argparse
+import csv
+import io
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+
+from generar_cuestionario_docx import create_cuestionario_docx
+
+CAMPOS = ('nombre', 'rol', 'sucursal', 'id')
+MARCADOR = re.compile(r'\{\{(' + '|'.join(CAMPOS) + r')\}\}')
+PARTE_DOCUMENTO = 'word/document.xml'
+
+# Caracteres que XML 1.0 no admite (controles salvo tabulación y saltos de línea)
+CONTROLES = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Encuestados por tarea del pool
+ENCUESTADOS_POR_TAREA = 250
+
+# Plantilla de cada proceso del pool, preparada una sola vez
+_plantilla_proceso = None
+
+class PlantillaCuestionario:
+    """Documento base dividido en tramos fijos y marcadores"""
+
+    def __init__(self, docx):
+        with zipfile.ZipFile(io.BytesIO(docx)) as origen:
+            documento = origen.read(PARTE_DOCUMENTO).decode('utf-8')
+            # Todas las partes salvo document.xml, comprimidas una sola vez
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as base:
+                for info in origen.infolist():
+                    if info.filename != PARTE_DOCUMENTO:
+                        base.writestr(info, origen.read(info), zipfile.ZIP_DEFLATED)
+        self.base = buffer.getvalue()
+        self.docx = docx
+
+        # Tramos fijos y campo de cada marcador: tramo, campo, tramo, campo, ..., tramo
+        partes = MARCADOR.split(documento)
+        self.tramos = partes[0::2]
+        self.campos = partes[1::2]
+        faltantes = sorted(set(CAMPOS) - set(self.campos))
+        if faltantes:
+            raise ValueError(f"El documento base no tiene los marcadores: {', '.join(faltantes)}")
+
+    @classmethod
+    def crear(cls):
+        """Construir el documento base con marcadores en los datos del encuestado"""
+        doc = create_cuestionario_docx({campo: f'{{{{{campo}}}}}' for campo in CAMPOS})
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        return cls(buffer.getvalue())
+
+    def document_xml(self, encuestado):
+        """word/document.xml con los datos de un encuestado"""
+        valores = {campo: escape(CONTROLES.sub('', str(encuestado.get(campo, ''))).strip()) for campo in CAMPOS}
+        partes = [self.tramos[0]]
+        for campo, tramo in zip(self.campos, self.tramos[1:]):
+            partes += (valores[campo], tramo)
+        return ''.join(partes)
+
+    def documento(self, encuestado):
+        """Contenido .docx del cuestionario de un encuestado"""
+        buffer = io.BytesIO(self.base)
+        buffer.seek(0, io.SEEK_END)
+        with zipfile.ZipFile(buffer, 'a', zipfile.ZIP_DEFLATED) as docx:
+            docx.writestr(PARTE_DOCUMENTO, self.document_xml(encuestado))
+        return buffer.getvalue()
+
+def nombre_archivo(encuestado):
+    """Nombre del .docx de un encuestado, a partir de su ID"""
+    return f"cuestionario_{re.sub(r'[^0-9A-Za-z_.-]', '_', str(encuestado['id']))}.docx"
+
+def leer_encuestados(ruta):
+    """Encuestados de un CSV con columnas nombre, rol, sucursal e id (opcional)"""
+    with open(ruta, newline='', encoding='utf-8-sig') as f:
+        lector = csv.DictReader(f)
+        encuestados = [{(k or '').strip().lower(): (v or '').strip() for k, v in fila.items()} for fila in lector]
+    for numero, encuestado in enumerate(encuestados, 1):
+        if not encuestado.get('id'):
+            encuestado['id'] = f'LQP-{numero:06d}'
+    return encuestados
+
+def validar_encuestados(encuestados):
+    """Comprobar que cada ID (y cada nombre de archivo) sea único"""
+    vistos = {}
+    for encuestado in encuestados:
+        archivo = nombre_archivo(encuestado)
+        if archivo in vistos:
+            raise ValueError(f"ID repetido: {encuestado['id']!r} y {vistos[archivo]!r}")
+        vistos[archivo] = encuestado['id']
+
+def encuestados_sinteticos(total):
+    """Encuestados de prueba"""
+    roles = ('Farmacéutico', 'Cajero', 'Bodeguero', 'Administrador')
+    sucursales = ('Matriz', 'Norte', 'Sur', 'Centro', 'Valle')
+    return [{'nombre': f'Encuestado {i}', 'rol': roles[i % len(roles)],
+             'sucursal': sucursales[i % len(sucursales)], 'id': f'LQP-{i:06d}'}
+            for i in range(1, total + 1)]
+
+def _iniciar_proceso(docx):
+    global _plantilla_proceso
+    _plantilla_proceso = PlantillaCuestionario(docx)
+
+def _combinar_en_proceso(encuestados, directorio):
+    return combinar(_plantilla_proceso, encuestados, directorio)
+
+def combinar(plantilla, encuestados, directorio=None):
+    """Cuestionarios de `encuestados`: escritos en `directorio`, o [(archivo, contenido)] si es None"""
+    resultado = []
+    for encuestado in encuestados:
+        archivo, contenido = nombre_archivo(encuestado), plantilla.documento(encuestado)
+        if directorio is None:
+            resultado.append((archivo, contenido))
+        else:
+            with open(os.path.join(directorio, archivo), 'wb') as f:
+                f.write(contenido)
+            resultado.append((archivo, len(contenido)))
+    return resultado
+
+def generar_cuestionarios(encuestados, salida, procesos=1, plantilla=None):
+    """Escribir un cuestionario por encuestado en el directorio o .zip `salida`; devuelve los bytes escritos"""
+    validar_encuestados(encuestados)
+    plantilla = plantilla or PlantillaCuestionario.crear()
+    en_zip = salida.lower().endswith('.zip')
+    directorio = None if en_zip else salida
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    tareas = [encuestados[i:i + ENCUESTADOS_POR_TAREA] for i in range(0, len(encuestados), ENCUESTADOS_POR_TAREA)]
+
+    total = 0
+    contenedor = zipfile.ZipFile(salida, 'w', zipfile.ZIP_STORED) if en_zip else None
+    try:
+        if procesos <= 1 or len(tareas) == 1:
+            lotes = (combinar(plantilla, tarea, directorio) for tarea in tareas)
+            total = escribir_lotes(lotes, contenedor)
+        else:
+            with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_proceso,
+                                     initargs=(plantilla.docx,)) as pool:
+                lotes = pool.map(_combinar_en_proceso, tareas, [directorio] * len(tareas))
+                total = escribir_lotes(lotes, contenedor)
+    finally:
+        if contenedor is not None:
+            contenedor.close()
+    return total
+
+def escribir_lotes(lotes, contenedor=None):
+    """Guardar en el .zip los cuestionarios de cada lote (ya comprimidos: sin volver a comprimir)"""
+    total = 0
+    for lote in lotes:
+        for archivo, contenido in lote:
+            if contenedor is None:
+                total += contenido
+            else:
+                contenedor.writestr(archivo, contenido)
+                total += len(contenido)
+    return total
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Cuestionarios Word prellenados por encuestado')
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument('encuestados', nargs='?', help='CSV con columnas nombre, rol, sucursal e id')
+    grupo.add_argument('--sintetico', type=int, metavar='N', help='Generar N encuestados de prueba')
+    parser.add_argument('--salida', default='cuestionarios_prellenados.zip', help='Directorio o archivo .zip')
+    parser.add_argument('--procesos', type=int, default=os.cpu_count() or 1, help='Procesos en paralelo')
+    args = parser.parse_args()
+
+    encuestados = encuestados_sinteticos(args.sintetico) if args.sintetico else leer_encuestados(args.encuestados)
+    print(f"🚀 Generando {len(encuestados)} cuestionarios prellenados con {args.procesos} procesos...")
+
+    inicio = time.perf_counter()
+    plantilla = PlantillaCuestionario.crear()
+    preparacion = time.perf_counter() - inicio
+    total = generar_cuestionarios(encuestados, args.salida, args.procesos, plantilla)
+    duracion = time.perf_counter() - inicio
+
+    print(f"📄 Documento base preparado en {preparacion:.2f}s")
+    print(f"✅ {len(encuestados)} cuestionarios en {duracion:.2f}s ({len(encuestados) / duracion:.0f} documentos/s)")
+    print(f"💾 {args.salida}: {total / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Construcción en paralelo de todos los documentos generados
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Ejecuta los generadores DOCX, HTML y Markdown en un pool de procesos,
+opcionalmente para varios clientes (un directorio de salida por cliente),
+y muestra un resumen con el tiempo y los fallos de cada objetivo.
+Los objetivos sin cambios se omiten o se restauran desde la caché por
+contenido (ver cache_construccion.py), salvo que se use --sin-cache.
+
+Uso:
+    python construir_documentos.py --jobs 4
+    python construir_documentos.py --jobs 8 --clientes cliente_a cliente_b --salida build
+    python construir_documentos.py --objetivos informe guia --sin-cache
+"""
+
+import argparse
+import contextlib
+import datetime
+import importlib
+import io
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from cache_construccion import CacheConstruccion
+
+DIRECTORIO_BASE = os.path.dirname(os.path.abspath(__file__))
+
+# Objetivo -> (módulo, función generadora, archivo de salida)
+OBJETIVOS = {
+    'informe': ('generar_informe_docx', 'create_informe_docx', 'INFORME_SESIONES_COOKIES_LogicQP.docx'),
+    'guia': ('generar_guia_observacion_docx', 'create_guia_observacion_docx', 'GUIA_OBSERVACION_PROCESOS_ASIS_LogicQP.docx'),
+    'cuestionario_docx': ('generar_cuestionario_docx', 'main', 'CUESTIONARIO_ENCUESTA_LIKERT_LogicQP.docx'),
+    'cuestionario_digital_docx': ('convertir_cuestionario_docx', 'main', 'CUESTIONARIO_DIGITAL_LIKERT_LogicQP.docx'),
+    'cuestionario_html': ('generar_cuestionario_digital', 'main', 'CUESTIONARIO_DIGITAL_LIKERT_LogicQP.html'),
+    'google_forms': ('generar_formulario_google_forms', 'main', 'INSTRUCCIONES_GOOGLE_FORMS_LogicQP.md'),
+}
+
+def mes_actual():
+    """Mes impreso en la portada de los documentos"""
+    return datetime.datetime.now().strftime('%Y-%m')
+
+# Valores externos al código que cambian el contenido generado
+VALORES_EXTERNOS = {
+    'informe': mes_actual,
+    'guia': mes_actual,
+}
+
+def nuevo_resultado(objetivo, directorio, estado):
+    """Resultado vacío de un objetivo"""
+    return {
+        'objetivo': objetivo,
+        'directorio': directorio,
+        'salida': os.path.join(directorio, OBJETIVOS[objetivo][2]),
+        'estado': estado,
+        'ok': False,
+        'duracion': 0.0,
+        'error': None,
+        'log': '',
+    }
+
+def construir_objetivo(objetivo, directorio):
+    """Ejecutar un generador dentro de `directorio` y medir su duración"""
+    modulo, funcion, salida = OBJETIVOS[objetivo]
+    resultado = nuevo_resultado(objetivo, directorio, 'construido')
+
+    if DIRECTORIO_BASE not in sys.path:
+        sys.path.insert(0, DIRECTORIO_BASE)
+
+    cwd = os.getcwd()
+    log = io.StringIO()
+    inicio = time.perf_counter()
+    try:
+        os.makedirs(directorio, exist_ok=True)
+        # Los generadores escriben en el directorio actual
+        os.chdir(directorio)
+        with contextlib.redirect_stdout(log):
+            getattr(importlib.import_module(modulo), funcion)()
+        resultado['ok'] = True
+    except Exception:
+        resultado['error'] = traceback.format_exc()
+    finally:
+        os.chdir(cwd)
+        resultado['duracion'] = time.perf_counter() - inicio
+        resultado['log'] = log.getvalue()
+
+    return resultado
+
+def clave_objetivo(cache, objetivo):
+    """Clave de la caché por contenido para un objetivo"""
+    valor_externo = VALORES_EXTERNOS.get(objetivo)
+    return cache.clave(objetivo, OBJETIVOS[objetivo][0], valor_externo() if valor_externo else None)
+
+def desde_cache(cache, objetivo, directorio, clave):
+    """Omitir o restaurar un objetivo desde la caché; None si hay que construirlo"""
+    inicio = time.perf_counter()
+    ruta = os.path.join(directorio, OBJETIVOS[objetivo][2])
+    if cache.vigente(ruta, clave):
+        resultado = nuevo_resultado(objetivo, directorio, 'omitido')
+    elif cache.restaurar(ruta, clave):
+        resultado = nuevo_resultado(objetivo, directorio, 'reutilizado')
+    else:
+        return None
+    resultado['ok'] = True
+    resultado['duracion'] = time.perf_counter() - inicio
+    return resultado
+
+def construir(objetivos, directorios, jobs=1, cache=None):
+    """Construir cada objetivo en cada directorio y devolver los resultados"""
+    tareas = [(objetivo, directorio) for directorio in directorios for objetivo in objetivos]
+    resultados = []
+
+    def registrar(resultado):
+        resultados.append(resultado)
+        imprimir_progreso(resultado, len(resultados), len(tareas))
+
+    # Resolver desde la caché; cada clave nueva se construye una sola vez
+    pendientes = []
+    repetidos = {}
+    claves = {}
+    if cache is not None:
+        claves = {objetivo: clave_objetivo(cache, objetivo) for objetivo in objetivos}
+    for objetivo, directorio in tareas:
+        clave = claves.get(objetivo)
+        if clave is None:
+            pendientes.append((objetivo, directorio))
+            continue
+        resultado = desde_cache(cache, objetivo, directorio, clave)
+        if resultado is not None:
+            registrar(resultado)
+        elif clave in repetidos:
+            repetidos[clave].append((objetivo, directorio))
+        else:
+            repetidos[clave] = []
+            pendientes.append((objetivo, directorio))
+
+    def terminar(resultado):
+        clave = claves.get(resultado['objetivo'])
+        if clave is not None and resultado['ok']:
+            cache.guardar(resultado['salida'], clave)
+        registrar(resultado)
+        for objetivo, directorio in repetidos.get(clave, []):
+            copia = desde_cache(cache, objetivo, directorio, clave) if resultado['ok'] else None
+            if copia is None:
+                copia = nuevo_resultado(objetivo, directorio, 'construido')
+                copia['error'] = resultado['error']
+            registrar(copia)
+
+    try:
+        if jobs <= 1:
+            for objetivo, directorio in pendientes:
+                terminar(construir_objetivo(objetivo, directorio))
+        elif pendientes:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futuros = [pool.submit(construir_objetivo, objetivo, directorio) for objetivo, directorio in pendientes]
+                for futuro in as_completed(futuros):
+                    terminar(futuro.result())
+    finally:
+        if cache is not None:
+            cache.guardar_manifiesto()
+
+    return resultados
+
+def imprimir_progreso(resultado, completados, total):
+    """Mostrar una línea por objetivo terminado"""
+    estado = '✅' if resultado['ok'] else '❌'
+    print(f"{estado} [{completados}/{total}] {resultado['salida']} {resultado['estado']} ({resultado['duracion']:.2f}s)")
+
+def imprimir_resumen(resultados, duracion_total):
+    """Mostrar tiempos por objetivo y detalle de los fallos"""
+    fallidos = [r for r in resultados if not r['ok']]
+    tiempo_cpu = sum(r['duracion'] for r in resultados)
+
+    print()
+    print("📊 RESUMEN DE CONSTRUCCIÓN")
+    print(f"{'Objetivo':<28} {'Directorio':<30} {'Estado':<12} {'Tiempo (s)':>10}")
+    for r in sorted(resultados, key=lambda r: (r['directorio'], r['objetivo'])):
+        estado = r['estado'] if r['ok'] else 'FALLO'
+        print(f"{r['objetivo']:<28} {r['directorio']:<30} {estado:<12} {r['duracion']:>10.3f}")
+
+    print()
+    print(f"⏱️ Tiempo total: {duracion_total:.2f}s (suma por objetivo: {tiempo_cpu:.2f}s)")
+    for estado in ('construido', 'reutilizado', 'omitido'):
+        cantidad = sum(1 for r in resultados if r['ok'] and r['estado'] == estado)
+        print(f"📦 {estado.capitalize()}s: {cantidad}")
+    print(f"✅ Correctos: {len(resultados) - len(fallidos)}")
+    print(f"❌ Fallidos: {len(fallidos)}")
+
+    for r in fallidos:
+        print()
+        print(f"❌ {r['objetivo']} en {r['directorio']}:")
+        print(r['error'])
+
+def main(argv=None):
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Construir todos los documentos de LogicQP en paralelo')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Número de procesos en paralelo (por defecto: núcleos disponibles)')
+    parser.add_argument('--objetivos', nargs='+', choices=sorted(OBJETIVOS), default=list(OBJETIVOS),
+                        help='Objetivos a construir (por defecto: todos)')
+    parser.add_argument('--salida', default='.',
+                        help='Directorio de salida (por defecto: directorio actual)')
+    parser.add_argument('--clientes', nargs='+', default=None,
+                        help='Construir para varios clientes, uno por subdirectorio de --salida')
+    parser.add_argument('--sin-cache', action='store_true',
+                        help='Reconstruir todo sin consultar la caché por contenido')
+    args = parser.parse_args(argv)
+
+    salida = os.path.abspath(args.salida)
+    if args.clientes:
+        directorios = [os.path.join(salida, cliente) for cliente in args.clientes]
+    else:
+        directorios = [salida]
+
+    print(f"🚀 Construyendo {len(args.objetivos) * len(directorios)} documentos con {args.jobs} procesos...")
+
+    inicio = time.perf_counter()
+    cache = None if args.sin_cache else CacheConstruccion()
+    resultados = construir(args.objetivos, directorios, jobs=args.jobs, cache=cache)
+    imprimir_resumen(resultados, time.perf_counter() - inicio)
+
+    return 0 if all(r['ok'] for r in resultados) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,62 +5,19 @@ Convertir Cuestionario Digital HTML a Word DOCX
 Sistema LogicQP - Grupo 6 - Cel@g
 """
 
-from docx import Document
-from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.shared import OxmlElement, qn
-import re
 
-def add_checkbox_style(doc):
-    """Agregar estilo para checkboxes"""
-    styles = doc.styles
-    checkbox_style = styles.add_style('Checkbox', 1)  # 1 = paragraph style
-    checkbox_style.font.name = 'Arial'
-    checkbox_style.font.size = Pt(11)
+from esquema_cuestionario import cargar_esquema
+from plantilla_estilos import documento_base
+from tabla_likert_docx import agregar_tabla_likert
 
 def create_likert_table(doc, title, questions, question_prefix):
     """Crear tabla de escala Likert"""
     doc.add_heading(title, level=3)
     
-    # Crear tabla
-    table = doc.add_table(rows=1, cols=6)
-    table.style = 'Table Grid'
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    
-    # Encabezados
-    hdr_cells = table.rows[0].cells
-    hdr_cells[0].text = 'Pregunta'
-    hdr_cells[1].text = '1'
-    hdr_cells[2].text = '2'
-    hdr_cells[3].text = '3'
-    hdr_cells[4].text = '4'
-    hdr_cells[5].text = '5'
-    
-    # Estilo de encabezados
-    for cell in hdr_cells:
-        cell.paragraphs[0].runs[0].bold = True
-        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    # Agregar preguntas
-    for i, question in enumerate(questions, 1):
-        row_cells = table.add_row().cells
-        row_cells[0].text = question
-        row_cells[1].text = '☐'
-        row_cells[2].text = '☐'
-        row_cells[3].text = '☐'
-        row_cells[4].text = '☐'
-        row_cells[5].text = '☐'
-        
-        # Centrar checkboxes
-        for j in range(1, 6):
-            row_cells[j].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    # Ajustar ancho de columnas
-    for row in table.rows:
-        row.cells[0].width = Inches(4.0)  # Pregunta
-        for i in range(1, 6):
-            row.cells[i].width = Inches(0.5)  # Checkboxes
+    # Toda la tabla en una sola construcción XML: preguntas con casillas centradas
+    rows = [[question, '☐', '☐', '☐', '☐', '☐'] for question in questions]
+    return agregar_tabla_likert(doc, ['Pregunta', '1', '2', '3', '4', '5'], rows, [4.0, 0.5, 0.5, 0.5, 0.5, 0.5])
 
 def create_radio_question(doc, question, name, options):
     """Crear pregunta de opción múltiple"""
@@ -79,11 +36,10 @@ def main():
     """Función principal"""
     print("🚀 Convirtiendo Cuestionario Digital HTML a Word DOCX...")
     
-    # Crear documento
-    doc = Document()
+    esquema = cargar_esquema()
     
-    # Configurar estilos
-    add_checkbox_style(doc)
+    # Crear documento (con el estilo Checkbox de la plantilla compartida)
+    doc = documento_base()
     
     # Título principal
     title = doc.add_heading('📊 CUESTIONARIO DE ENCUESTA LIKERT - SISTEMA LOGICQP', 0)
@@ -183,197 +139,9 @@ def main():
     
     doc.add_paragraph('─' * 80)
     
-    # Definir todas las preguntas por sección
-    preguntas = {
-        'facilidad': [
-            'El sistema es fácil de usar',
-            'La interfaz es intuitiva y clara',
-            'Es fácil navegar por el sistema',
-            'Los menús son fáciles de encontrar',
-            'Las funciones están bien organizadas'
-        ],
-        'diseno': [
-            'El diseño visual es atractivo',
-            'Los colores son apropiados',
-            'Los textos son legibles',
-            'Los botones son fáciles de identificar',
-            'El diseño es consistente en todas las páginas'
-        ],
-        'navegacion': [
-            'Es fácil encontrar lo que busco',
-            'La estructura del menú es lógica',
-            'Es fácil regresar a páginas anteriores',
-            'Los enlaces funcionan correctamente',
-            'El sistema tiene un buen flujo de trabajo'
-        ],
-        'velocidad': [
-            'El sistema carga rápidamente',
-            'Las páginas se abren sin demoras',
-            'Las búsquedas son rápidas',
-            'Los reportes se generan rápidamente',
-            'El sistema responde bien a mis acciones'
-        ],
-        'productividad': [
-            'Puedo completar mis tareas rápidamente',
-            'El sistema me ayuda a ser más productivo',
-            'Puedo realizar múltiples tareas simultáneamente',
-            'El sistema me ahorra tiempo',
-            'Puedo trabajar de manera eficiente'
-        ],
-        'funcionalidades': [
-            'La búsqueda de productos es eficiente',
-            'El proceso de compra es rápido',
-            'La gestión de inventario es eficaz',
-            'Los reportes son útiles y completos',
-            'Las notificaciones son oportunas'
-        ],
-        'satisfaccion': [
-            'Estoy satisfecho con el sistema en general',
-            'El sistema cumple con mis expectativas',
-            'Recomendaría el sistema a otros',
-            'El sistema mejora mi experiencia de trabajo',
-            'Estoy contento con la calidad del sistema'
-        ],
-        'experiencia': [
-            'El sistema es agradable de usar',
-            'Me siento cómodo usando el sistema',
-            'El sistema me da confianza',
-            'Me siento apoyado por el sistema',
-            'El sistema es confiable'
-        ],
-        'valor': [
-            'El sistema aporta valor a mi trabajo',
-            'Las funcionalidades son útiles',
-            'El sistema resuelve mis necesidades',
-            'El sistema es indispensable para mi trabajo',
-            'El sistema supera a otros sistemas similares'
-        ],
-        'productos': [
-            'Es fácil buscar productos',
-            'Los filtros funcionan bien',
-            'La información de productos es clara',
-            'Es fácil agregar productos al carrito',
-            'La gestión de categorías es eficiente'
-        ],
-        'compra': [
-            'El carrito de compras es fácil de usar',
-            'El proceso de checkout es claro',
-            'Los formularios son fáciles de llenar',
-            'Las opciones de pago son claras',
-            'Las confirmaciones son útiles'
-        ],
-        'inventario': [
-            'Es fácil crear nuevos productos',
-            'La actualización de stock es sencilla',
-            'Las alertas de reposición son útiles',
-            'Los reportes de inventario son completos',
-            'La trazabilidad de lotes es efectiva'
-        ],
-        'reportes': [
-            'Es fácil generar reportes',
-            'Los filtros de reportes son útiles',
-            'La exportación de datos funciona bien',
-            'Los gráficos son claros y útiles',
-            'La información de auditoría es completa'
-        ],
-        'seguridad': [
-            'Me siento seguro usando el sistema',
-            'El sistema protege mi información',
-            'Los controles de acceso son adecuados',
-            'El sistema es seguro para transacciones',
-            'Confío en la seguridad del sistema'
-        ],
-        'confiabilidad': [
-            'El sistema funciona de manera consistente',
-            'Rara vez experimento errores',
-            'El sistema está disponible cuando lo necesito',
-            'Los datos se guardan correctamente',
-            'El sistema es estable y confiable'
-        ],
-        'responsivo': [
-            'El sistema funciona bien en mi dispositivo',
-            'La interfaz se adapta bien a diferentes tamaños',
-            'Es fácil usar el sistema en móvil',
-            'Los elementos son fáciles de tocar',
-            'El sistema es accesible desde cualquier lugar'
-        ],
-        'accesibilidad': [
-            'El sistema es fácil de usar para personas con discapacidades',
-            'Los textos tienen buen contraste',
-            'El sistema es compatible con lectores de pantalla',
-            'Los elementos son fáciles de identificar',
-            'El sistema es inclusivo'
-        ],
-        'problemas': [
-            'He experimentado errores en el sistema',
-            'El sistema a veces es lento',
-            'Algunas funciones no funcionan como esperaba',
-            'He tenido problemas de conectividad',
-            'El sistema a veces se cuelga'
-        ],
-        'mejoras': [
-            'Necesito más funcionalidades',
-            'El sistema necesita mejoras en la interfaz',
-            'Necesito mejor rendimiento',
-            'El sistema necesita mejor documentación',
-            'Necesito mejor soporte técnico'
-        ],
-        'impacto': [
-            'El sistema me ayuda a ser más productivo',
-            'El sistema mejora la calidad de mi trabajo',
-            'El sistema me ahorra tiempo',
-            'El sistema reduce errores en mi trabajo',
-            'El sistema mejora la comunicación'
-        ],
-        'objetivos': [
-            'El sistema cumple con los objetivos del negocio',
-            'El sistema es rentable para la organización',
-            'El sistema mejora la satisfacción del cliente',
-            'El sistema reduce costos operativos',
-            'El sistema mejora la competitividad'
-        ]
-    }
-    
-    # Agregar todas las secciones de preguntas
-    secciones = [
-        ('🔍 SECCIÓN 1: USABILIDAD', [
-            ('1.1 Facilidad de Uso General', 'facilidad'),
-            ('1.2 Diseño de la Interfaz', 'diseno'),
-            ('1.3 Navegación y Estructura', 'navegacion')
-        ]),
-        ('⚡ SECCIÓN 2: EFICIENCIA', [
-            ('2.1 Velocidad y Rendimiento', 'velocidad'),
-            ('2.2 Productividad', 'productividad'),
-            ('2.3 Funcionalidades Específicas', 'funcionalidades')
-        ]),
-        ('😊 SECCIÓN 3: SATISFACCIÓN', [
-            ('3.1 Satisfacción General', 'satisfaccion'),
-            ('3.2 Experiencia de Usuario', 'experiencia'),
-            ('3.3 Valor y Utilidad', 'valor')
-        ]),
-        ('🔧 SECCIÓN 4: FUNCIONALIDADES ESPECÍFICAS', [
-            ('4.1 Gestión de Productos', 'productos'),
-            ('4.2 Proceso de Compra', 'compra'),
-            ('4.3 Gestión de Inventario', 'inventario'),
-            ('4.4 Reportes y Auditoría', 'reportes')
-        ]),
-        ('🛡️ SECCIÓN 5: SEGURIDAD Y CONFIABILIDAD', [
-            ('5.1 Seguridad', 'seguridad'),
-            ('5.2 Confiabilidad', 'confiabilidad')
-        ]),
-        ('📱 SECCIÓN 6: RESPONSIVIDAD Y ACCESIBILIDAD', [
-            ('6.1 Diseño Responsivo', 'responsivo'),
-            ('6.2 Accesibilidad', 'accesibilidad')
-        ]),
-        ('🚨 SECCIÓN 7: PROBLEMAS Y MEJORAS', [
-            ('7.1 Problemas Encontrados', 'problemas'),
-            ('7.2 Necesidades de Mejora', 'mejoras')
-        ]),
-        ('🎯 SECCIÓN 8: OBJETIVOS DE NEGOCIO', [
-            ('8.1 Impacto en el Trabajo', 'impacto'),
-            ('8.2 Cumplimiento de Objetivos', 'objetivos')
-        ])
-    ]
+    # Preguntas y secciones compartidas con el cuestionario HTML
+    preguntas = esquema['preguntas']
+    secciones = esquema['secciones']
     
     section_counter = 1
     for section_title, subsections in secciones:
@@ -390,13 +158,7 @@ def main():
     
     doc.add_paragraph('8.1 Comentarios Libres', style='Heading 3')
     
-    comentarios = [
-        ('¿Qué es lo que más le gusta del sistema LogicQP?', 'me_gusta'),
-        ('¿Qué es lo que menos le gusta del sistema?', 'no_gusta'),
-        ('¿Qué funcionalidades le gustaría que se agreguen?', 'funcionalidades_nuevas'),
-        ('¿Qué mejoras sugiere para el sistema?', 'mejoras_sugeridas'),
-        ('¿Alguna otra observación o comentario?', 'otras_observaciones')
-    ]
+    comentarios = esquema['comentarios']
     
     for pregunta, name in comentarios:
         create_text_area(doc, pregunta, name)
@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Contenido de la Guía de Observación de Procesos AS-IS
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Textos, listas y tablas de cada sección de la guía, separados del
+formato (generar_guia_observacion_docx.py). Cada sección se genera y se
+guarda en caché bajo la huella SHA-256 de sus datos: al cambiar un
+hallazgo solo se vuelve a generar su sección.
+"""
+
+PORTADA = {
+    'titulo': '📋 GUÍA DE OBSERVACIÓN: PROCESOS AS-IS',
+    'subtitulo': 'Sistema Farmacéutico LogicQP',
+    'autor': 'Grupo 6 - Cel@g - 2025',
+    'version': '1.0.0',
+    'tipo': 'Documento de Análisis de Procesos',
+    'indice': [
+        'Introducción',
+        'Metodología de Observación',
+        'Proceso de Ventas AS-IS',
+        'Proceso de Inventario AS-IS',
+        'Proceso de Auditoría AS-IS',
+        'Matriz de Procesos',
+        'Hallazgos y Oportunidades',
+        'Recomendaciones',
+        'Anexos'
+    ],
+}
+
+INTRODUCCION = {
+    'proposito': 'Esta guía de observación tiene como objetivo documentar el estado actual (AS-IS) de los procesos críticos del sistema LogicQP, específicamente en las áreas de:',
+    'areas': [
+        'Ventas y E-commerce',
+        'Gestión de Inventario',
+        'Auditoría y Control'
+    ],
+    'alcance': [
+        'Sistema: LogicQP - Sistema Farmacéutico Inteligente',
+        'Módulos: Ventas, Inventario, Auditoría',
+        'Usuarios: Administradores, Vendedores, Personal de Inventario',
+        'Período: Enero 2025'
+    ],
+    'objetivos': [
+        'Mapear los procesos actuales del sistema',
+        'Identificar puntos de mejora y optimización',
+        'Documentar flujos de trabajo existentes',
+        'Establecer baseline para futuras mejoras',
+        'Validar cumplimiento de requerimientos'
+    ],
+}
+
+METODOLOGIA = {
+    'enfoques': [
+        ('Observación Directa', [
+            'Técnica: Shadowing de usuarios',
+            'Duración: Sesiones de 2-4 horas por proceso',
+            'Frecuencia: 3 sesiones por proceso crítico',
+            'Herramientas: Grabación de pantalla, notas detalladas'
+        ]),
+        ('Entrevistas Estructuradas', [
+            'Participantes: Usuarios finales, administradores',
+            'Duración: 45-60 minutos por sesión',
+            'Formato: Preguntas abiertas y cerradas',
+            'Documentación: Grabación de audio + transcripción'
+        ]),
+        ('Análisis de Datos', [
+            'Logs del sistema: Comportamiento de usuarios',
+            'Métricas de rendimiento: Tiempos de respuesta',
+            'Reportes generados: Calidad y completitud',
+            'Errores registrados: Patrones y frecuencia'
+        ]),
+    ],
+    'herramientas': {
+        'encabezados': ['Herramienta', 'Propósito', 'Usuarios'],
+        'filas': [
+            ('Grabación de Pantalla', 'Capturar flujos de trabajo', 'Todos'),
+            ('Checklist de Procesos', 'Validar completitud', 'Observadores'),
+            ('Formularios de Entrevista', 'Recopilar feedback', 'Usuarios'),
+            ('Matriz de Tiempos', 'Medir eficiencia', 'Analistas'),
+            ('Mapas de Procesos', 'Visualizar flujos', 'Stakeholders')
+        ],
+    },
+}
+
+# Procesos observados: cada actividad tiene 'pasos' (lista numerada) o 'eventos' (viñetas) y sus hallazgos
+VENTAS = {
+    'titulo': '💰 PROCESO DE VENTAS AS-IS',
+    'descripcion': 'El proceso de ventas en LogicQP abarca desde la búsqueda de productos hasta la finalización de la compra, incluyendo gestión del carrito, checkout y confirmación.',
+    'actividades': [
+        {
+            'titulo': 'Búsqueda y Selección de Productos',
+            'actividad': 'Navegación del catálogo',
+            'tiempo': '3-5 minutos',
+            'usuarios': 'Clientes',
+            'pasos': [
+                'Acceso al catálogo (URL: /catalogo)',
+                'Carga inicial: 2-3 segundos',
+                'Productos mostrados: 12 por página',
+                'Aplicación de filtros por categoría, precio, marca',
+                'Tiempo de filtrado: 1-2 segundos',
+                'Visualización en grid de 4 columnas (desktop)'
+            ],
+            'hallazgos': [
+                '✅ Positivo: Filtros funcionan correctamente',
+                '⚠️ Mejora: Búsqueda por texto no implementada',
+                '⚠️ Mejora: No hay comparación de productos'
+            ],
+        },
+        {
+            'titulo': 'Gestión del Carrito',
+            'actividad': 'Agregar/remover productos del carrito',
+            'tiempo': '1-2 minutos',
+            'usuarios': 'Clientes',
+            'pasos': [
+                'Agregar producto con botón "Agregar al carrito"',
+                'Confirmación visual: Toast notification',
+                'Actualización automática del contador',
+                'Modificar cantidades con botones +/-',
+                'Input directo de cantidad',
+                'Validación: Mínimo 1, máximo stock disponible',
+                'Persistencia en LocalStorage',
+                'Sincronización en tiempo real'
+            ],
+            'hallazgos': [
+                '✅ Positivo: Carrito persistente funciona bien',
+                '✅ Positivo: Validación de stock en tiempo real',
+                '⚠️ Mejora: No hay guardado de carrito por usuario'
+            ],
+        },
+        {
+            'titulo': 'Proceso de Checkout',
+            'actividad': 'Finalización de la compra',
+            'tiempo': '5-8 minutos',
+            'usuarios': 'Clientes',
+            'pasos': [
+                'Revisión del carrito con lista de productos',
+                'Cálculo de totales y aplicación de descuentos',
+                'Formulario de datos de envío con validación',
+                'Campos: Nombre, dirección, teléfono, email',
+                'Selección de método de pago',
+                'Validación de datos de pago',
+                'Resumen de la compra y términos',
+                'Confirmación final de la compra'
+            ],
+            'hallazgos': [
+                '✅ Positivo: Formulario bien validado',
+                '⚠️ Mejora: No hay guardado de direcciones frecuentes',
+                '❌ Problema: Pasarela de pago no implementada'
+            ],
+        },
+    ],
+    'metricas': {
+        'encabezados': ['Métrica', 'Valor Actual', 'Objetivo', 'Estado'],
+        'filas': [
+            ('Tiempo promedio de compra', '12 minutos', '8 minutos', '⚠️'),
+            ('Tasa de abandono de carrito', '35%', '25%', '❌'),
+            ('Tiempo de carga del catálogo', '3.2 segundos', '2 segundos', '⚠️'),
+            ('Disponibilidad del sistema', '98.5%', '99.5%', '⚠️'),
+            ('Satisfacción del cliente', '4.2/5', '4.5/5', '⚠️')
+        ],
+    },
+}
+
+INVENTARIO = {
+    'titulo': '📦 PROCESO DE INVENTARIO AS-IS',
+    'descripcion': 'El proceso de inventario incluye la gestión de productos, control de stock, alertas de reposición y trazabilidad de lotes farmacéuticos.',
+    'actividades': [
+        {
+            'titulo': 'Gestión de Productos',
+            'actividad': 'Registro y actualización de productos',
+            'tiempo': '10-15 minutos por producto',
+            'usuarios': 'Administradores, Personal de Inventario',
+            'pasos': [
+                'Creación de producto con formulario completo',
+                'Campos: Nombre, descripción, precio, categoría',
+                'Subida de imagen del producto',
+                'Configuración de stock inicial',
+                'Asignación a categoría existente o creación nueva',
+                'Configuración de atributos específicos',
+                'Configuración de precios base y descuentos'
+            ],
+            'hallazgos': [
+                '✅ Positivo: Formulario completo y validado',
+                '✅ Positivo: Gestión de categorías flexible',
+                '⚠️ Mejora: No hay importación masiva de productos'
+            ],
+        },
+        {
+            'titulo': 'Control de Stock',
+            'actividad': 'Monitoreo y actualización de inventario',
+            'tiempo': '5-10 minutos por actualización',
+            'usuarios': 'Personal de Inventario',
+            'pasos': [
+                'Actualización manual de stock',
+                'Entrada de productos recibidos',
+                'Salida por ventas',
+                'Ajustes de inventario',
+                'Alertas automáticas por stock mínimo',
+                'Notificaciones por email/SMS',
+                'Dashboard con productos críticos',
+                'Registro de número de lote',
+                'Fecha de vencimiento',
+                'Proveedor y origen'
+            ],
+            'hallazgos': [
+                '✅ Positivo: Alertas automáticas funcionan',
+                '✅ Positivo: Trazabilidad de lotes implementada',
+                '❌ Problema: No hay integración con códigos de barras'
+            ],
+        },
+    ],
+}
+
+AUDITORIA = {
+    'titulo': '🔍 PROCESO DE AUDITORÍA AS-IS',
+    'descripcion': 'El proceso de auditoría incluye el seguimiento de actividades, generación de reportes, control de accesos y cumplimiento de normativas farmacéuticas.',
+    'actividades': [
+        {
+            'titulo': 'Registro de Actividades',
+            'actividad': 'Captura de eventos del sistema',
+            'tiempo': 'Automático',
+            'usuarios': 'Sistema, Administradores',
+            'eventos': [
+                'Autenticación: Login/logout de usuarios',
+                'Intentos fallidos de acceso',
+                'Cambios de contraseña',
+                'Operaciones de datos: Creación, modificación, eliminación',
+                'Usuario responsable y timestamp',
+                'Transacciones comerciales: Ventas, precios, inventario'
+            ],
+            'hallazgos': [
+                '✅ Positivo: Registro automático implementado',
+                '✅ Positivo: Información detallada capturada',
+                '⚠️ Mejora: No hay retención de logs configurada'
+            ],
+        },
+    ],
+}
+
+MATRIZ_PROCESOS = {
+    'encabezados': ['Proceso', 'Complejidad', 'Automatización', 'Eficiencia', 'Prioridad'],
+    'filas': [
+        ('Ventas', 'Media', '70%', '75%', 'Alta'),
+        ('Inventario', 'Alta', '60%', '80%', 'Alta'),
+        ('Auditoría', 'Alta', '50%', '70%', 'Media')
+    ],
+}
+
+# Grupos de hallazgos: (título, marca, hallazgos)
+HALLAZGOS = {
+    'grupos': [
+        ('Fortalezas Identificadas', '✅', [
+            'Arquitectura sólida: Sistema modular bien diseñado',
+            'Funcionalidades core completas: Gestión de productos funcional',
+            'Interfaz de usuario intuitiva: Diseño moderno y responsive'
+        ]),
+        ('Áreas de Mejora', '⚠️', [
+            'Automatización limitada: Procesos manuales en inventario',
+            'Reportes básicos: Análisis limitado de datos',
+            'Integración incompleta: Pasarela de pago no implementada'
+        ]),
+        ('Problemas Críticos', '❌', [
+            'Seguridad: No hay autenticación de dos factores',
+            'Rendimiento: Tiempos de respuesta lentos',
+            'Cumplimiento: No hay validación normativa automática'
+        ]),
+    ],
+}
+
+RECOMENDACIONES = {
+    'prioridades': [
+        ('Críticas (Implementar inmediatamente)', [
+            'Implementar autenticación de dos factores',
+            'Optimizar rendimiento del sistema',
+            'Implementar backup automático de logs'
+        ]),
+        ('Importantes (Implementar en 3 meses)', [
+            'Desarrollar motor de búsqueda',
+            'Implementar dashboards en tiempo real',
+            'Integrar códigos de barras'
+        ]),
+        ('Deseables (Implementar en 6 meses)', [
+            'Desarrollar análisis predictivo',
+            'Integrar con sistemas externos'
+        ]),
+    ],
+    'fases': [
+        ('Fase 1: Estabilización (Mes 1)', [
+            'Implementar autenticación 2FA',
+            'Optimizar rendimiento',
+            'Backup automático de logs'
+        ]),
+        ('Fase 2: Mejoras de Usuario (Mes 2-3)', [
+            'Motor de búsqueda',
+            'Dashboards en tiempo real',
+            'Mejoras en UX'
+        ]),
+        ('Fase 3: Automatización (Mes 4-6)', [
+            'Códigos de barras',
+            'Integración de pagos',
+            'Workflows automatizados'
+        ]),
+        ('Fase 4: Inteligencia (Mes 7-12)', [
+            'Análisis predictivo',
+            'Machine learning',
+            'Integración completa'
+        ]),
+    ],
+}
+
+# Anexo A: Checklist de Observación
+ANEXO_CHECKLIST = {
+    'procesos': [
+        ('Proceso de Ventas', [
+            'Tiempo de carga del catálogo',
+            'Funcionamiento de filtros',
+            'Proceso de agregar al carrito',
+            'Validación de formularios',
+            'Proceso de checkout',
+            'Confirmación de compra',
+            'Gestión de usuarios',
+            'Métodos de pago',
+            'Notificaciones al cliente',
+            'Manejo de errores'
+        ]),
+        ('Proceso de Inventario', [
+            'Creación de productos',
+            'Actualización de stock',
+            'Gestión de categorías',
+            'Alertas de reposición',
+            'Trazabilidad de lotes',
+            'Reportes de inventario',
+            'Control de vencimientos',
+            'Gestión de proveedores',
+            'Códigos de barras',
+            'Importación masiva'
+        ]),
+        ('Proceso de Auditoría', [
+            'Registro de actividades',
+            'Generación de reportes',
+            'Control de accesos',
+            'Gestión de roles',
+            'Detección de anomalías',
+            'Cumplimiento normativo',
+            'Retención de logs',
+            'Backup de datos',
+            'Seguridad de información',
+            'Análisis de patrones'
+        ]),
+    ],
+}
+
+# Anexo B: Formulario de Entrevista
+ANEXO_ENTREVISTA = {
+    'datos_usuario': [
+        'Nombre: _________________________',
+        'Rol: ____________________________',
+        'Experiencia con el sistema: _____ años/meses',
+        'Fecha de entrevista: _____________'
+    ],
+    'preguntas_generales': [
+        '¿Qué tan fácil es usar el sistema LogicQP? (Escala 1-5)',
+        '¿Cuáles son las funcionalidades que más utiliza?',
+        '¿Qué funcionalidades faltan o necesitan mejora?',
+        '¿Cuáles son los principales problemas que enfrenta?',
+        '¿Qué mejoras sugeriría para el sistema?',
+        '¿El sistema cumple con sus expectativas de trabajo?',
+        '¿Recomendaría el sistema a otros usuarios?'
+    ],
+    'preguntas_por_proceso': [
+        ('VENTAS:', [
+            '¿Qué tan fácil es encontrar productos en el catálogo?',
+            '¿El proceso de agregar al carrito es intuitivo?',
+            '¿El checkout es claro y fácil de completar?',
+            '¿Ha tenido problemas con el proceso de pago?',
+            '¿Las notificaciones son claras y útiles?'
+        ]),
+        ('INVENTARIO:', [
+            '¿La creación de productos es eficiente?',
+            '¿Las alertas de stock son útiles y oportunas?',
+            '¿La gestión de categorías es flexible?',
+            '¿Los reportes de inventario son completos?',
+            '¿Falta alguna funcionalidad importante?'
+        ]),
+        ('AUDITORÍA:', [
+            '¿Los reportes son fáciles de generar?',
+            '¿La información de auditoría es completa?',
+            '¿Los controles de acceso son adecuados?',
+            '¿Falta alguna funcionalidad de seguridad?',
+            '¿El sistema cumple con normativas?'
+        ]),
+    ],
+    'datos_administrador': [
+        'Nombre: _________________________',
+        'Cargo: __________________________',
+        'Experiencia: _____ años',
+        'Fecha de entrevista: _____________'
+    ],
+    'preguntas_administrador': [
+        '¿El sistema cumple con los requerimientos del negocio?',
+        '¿Qué procesos son más críticos para la operación?',
+        '¿Qué métricas son más importantes para el seguimiento?',
+        '¿Cuáles son los principales riesgos identificados?',
+        '¿Qué mejoras prioritarias recomendaría?',
+        '¿El sistema es escalable para el crecimiento?',
+        '¿La seguridad del sistema es adecuada?',
+        '¿El rendimiento cumple con las expectativas?'
+    ],
+}
+
+# Anexo C: Instrumento de Observación
+ANEXO_INSTRUMENTO = {
+    'introduccion': 'Este instrumento debe ser utilizado durante las sesiones de observación directa para documentar el comportamiento del sistema y los usuarios.',
+    'datos_sesion': [
+        'Fecha: _________________________',
+        'Hora de inicio: _________________',
+        'Hora de finalización: ___________',
+        'Observador: ____________________',
+        'Usuario observado: ______________',
+        'Proceso observado: ______________',
+        'Navegador utilizado: _____________',
+        'Dispositivo: ____________________'
+    ],
+    'checklist': [
+        ('1. NAVEGACIÓN Y ACCESO', [
+            'Tiempo de carga de la página principal',
+            'Acceso a diferentes secciones del sistema',
+            'Funcionamiento del menú de navegación',
+            'Responsive design en diferentes dispositivos',
+            'Manejo de errores de navegación'
+        ]),
+        ('2. AUTENTICACIÓN Y SEGURIDAD', [
+            'Proceso de login',
+            'Validación de credenciales',
+            'Gestión de sesiones',
+            'Logout y cierre de sesión',
+            'Control de accesos por rol',
+            'Timeout de sesión'
+        ]),
+        ('3. GESTIÓN DE PRODUCTOS', [
+            'Búsqueda de productos',
+            'Aplicación de filtros',
+            'Visualización de detalles',
+            'Agregar al carrito',
+            'Modificar cantidades',
+            'Persistencia del carrito'
+        ]),
+        ('4. PROCESO DE COMPRA', [
+            'Revisión del carrito',
+            'Llenado de formularios',
+            'Validación de datos',
+            'Selección de método de pago',
+            'Confirmación de compra',
+            'Notificaciones al usuario'
+        ]),
+        ('5. GESTIÓN DE INVENTARIO', [
+            'Creación de productos',
+            'Actualización de stock',
+            'Gestión de categorías',
+            'Alertas de reposición',
+            'Trazabilidad de lotes',
+            'Reportes de inventario'
+        ]),
+        ('6. REPORTES Y AUDITORÍA', [
+            'Generación de reportes',
+            'Filtros y parámetros',
+            'Exportación de datos',
+            'Visualización de gráficos',
+            'Registro de actividades',
+            'Control de accesos'
+        ]),
+        ('7. RENDIMIENTO Y USABILIDAD', [
+            'Tiempos de respuesta',
+            'Facilidad de uso',
+            'Claridad de mensajes',
+            'Manejo de errores',
+            'Feedback visual',
+            'Navegación intuitiva'
+        ]),
+        ('8. PROBLEMAS Y ERRORES', [
+            'Errores de validación',
+            'Errores de sistema',
+            'Problemas de conectividad',
+            'Errores de permisos',
+            'Problemas de rendimiento',
+            'Otros problemas identificados'
+        ]),
+        ('9. SUGERENCIAS Y MEJORAS', [
+            'Funcionalidades faltantes',
+            'Mejoras en la interfaz',
+            'Optimizaciones de proceso',
+            'Mejoras de seguridad',
+            'Mejoras de rendimiento',
+            'Otras sugerencias'
+        ]),
+    ],
+    'metricas': ('10. MÉTRICAS CUANTITATIVAS', [
+        'Tiempo total de la sesión: _______ minutos',
+        'Número de clics realizados: _______',
+        'Número de errores encontrados: _______',
+        'Tiempo promedio por tarea: _______ segundos',
+        'Número de pasos por proceso: _______',
+        'Satisfacción del usuario (1-5): _______'
+    ]),
+}
+
+# Anexo D: Matriz de Evaluación
+ANEXO_EVALUACION = {
+    'instrucciones': 'Utilice esta matriz para evaluar cada proceso observado en una escala de 1-5 (1=Muy malo, 5=Excelente)',
+    'encabezados': ['Criterio', 'Ventas', 'Inventario', 'Auditoría', 'Promedio', 'Comentarios'],
+    'criterios': [
+        'Facilidad de uso',
+        'Eficiencia del proceso',
+        'Calidad de la interfaz',
+        'Velocidad de respuesta',
+        'Manejo de errores',
+        'Funcionalidad completa',
+        'Seguridad',
+        'Escalabilidad',
+        'Mantenibilidad',
+        'Satisfacción del usuario'
+    ],
+}
+
+# Anexo E: Glosario de Términos
+ANEXO_GLOSARIO = {
+    'encabezados': ['Término', 'Definición'],
+    'terminos': [
+        ('AS-IS', 'Estado actual del proceso o sistema'),
+        ('TO-BE', 'Estado futuro deseado del proceso o sistema'),
+        ('KPI', 'Indicador clave de rendimiento (Key Performance Indicator)'),
+        ('SLA', 'Acuerdo de nivel de servicio (Service Level Agreement)'),
+        ('ROI', 'Retorno de inversión (Return on Investment)'),
+        ('UX', 'Experiencia de usuario (User Experience)'),
+        ('UI', 'Interfaz de usuario (User Interface)'),
+        ('API', 'Interfaz de programación de aplicaciones'),
+        ('JWT', 'Token web JSON para autenticación'),
+        ('CRUD', 'Crear, Leer, Actualizar, Eliminar (operaciones básicas)'),
+        ('FEFO', 'Primero en vencer, primero en salir (First Expired, First Out)'),
+        ('RLS', 'Seguridad a nivel de fila (Row Level Security)'),
+        ('SPA', 'Aplicación de página única (Single Page Application)'),
+        ('PWA', 'Aplicación web progresiva (Progressive Web App)'),
+        ('GDPR', 'Reglamento general de protección de datos'),
+        ('Farmacovigilancia', 'Monitoreo de efectos adversos de medicamentos'),
+        ('Trazabilidad', 'Seguimiento del historial de un producto'),
+        ('Lote', 'Conjunto de productos fabricados en las mismas condiciones'),
+        ('Stock mínimo', 'Cantidad mínima de inventario antes de reordenar'),
+        ('Lead time', 'Tiempo entre la orden y la recepción del producto')
+    ],
+}
+
+# Anexo F: Referencias
+ANEXO_REFERENCIAS = {
+    'referencias': [
+        'Manual de Usuario LogicQP v1.0',
+        'Manual Técnico LogicQP v1.0',
+        'Documentación de API LogicQP',
+        'Estándares de la industria farmacéutica (FDA, EMA)',
+        'Regulaciones locales de salud (MSP Ecuador)',
+        'Guías de buenas prácticas de software',
+        'Estándares de seguridad ISO 27001',
+        'Regulaciones de protección de datos (LOPD)',
+        'Normativas de farmacovigilancia',
+        'Estándares de trazabilidad farmacéutica'
+    ],
+}
+
+PIE = {
+    'derechos': '© 2025 Grupo 6 - Cel@g. Todos los derechos reservados.',
+    'confidencialidad': 'Este documento es confidencial y está destinado únicamente para uso interno del proyecto LogicQP.',
+}
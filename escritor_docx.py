@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Escritura en flujo de documentos Word muy grandes
+Sistema LogicQP - Grupo 6 - Cel@g
+
+python-docx mantiene todo el árbol del documento en memoria hasta
+doc.save(). EscritorDocx ofrece los mismos métodos que usan los
+generadores (add_heading, add_paragraph, add_table, add_page_break,
+add_picture y save) pero escribe word/document.xml directamente en el
+.docx a medida que se agregan bloques:
+
+  - cada bloque se arma con python-docx sobre un documento de trabajo
+    (con los estilos de plantilla_estilos.py) y se escribe comprimido en
+    el .docx en cuanto se agrega el siguiente; solo el último bloque
+    queda en memoria y puede modificarse hasta entonces
+  - las filas de las tablas Likert (tabla_likert_docx.py) y los
+    fragmentos de sección en caché (generar_guia_observacion_docx.py)
+    se escriben como texto XML, sin pasar por el árbol
+  - al guardar se agregan las demás partes del paquete (estilos,
+    relaciones, imágenes) desde el documento de trabajo
+
+La memoria no crece con el tamaño del documento. doc.paragraphs y
+doc.tables solo ven el bloque pendiente.
+
+Uso:
+    doc = EscritorDocx()
+    doc.add_heading('Título', 0)
+    doc.save('documento.docx')
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+
+from docx import Document
+from docx.oxml.ns import qn
+from lxml import etree
+
+from plantilla_estilos import contenido_plantilla
+
+PARTE_DOCUMENTO = 'word/document.xml'
+DECLARACION_XML = "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+SECCION = qn('w:sectPr')
+
+def declaraciones_raiz(raiz):
+    """Declaraciones xmlns de w:document (con prefijo), como las escribe lxml"""
+    return [f' xmlns:{prefijo}="{uri}"' for prefijo, uri in raiz.nsmap.items() if prefijo]
+
+def xml_bloque(elemento, declaraciones):
+    """XML de un bloque del cuerpo sin las `declaraciones` que ya están en w:document"""
+    texto = etree.tostring(elemento, encoding='unicode')
+    fin = texto.index('>')
+    etiqueta = texto[:fin]
+    for declaracion in declaraciones:
+        etiqueta = etiqueta.replace(declaracion, '')
+    return etiqueta + texto[fin:]
+
+class EscritorDocx:
+    """Documento Word que se escribe en disco bloque a bloque"""
+
+    def __init__(self, ruta=None, plantilla=None):
+        self._doc = Document(io.BytesIO(plantilla or contenido_plantilla()))
+        self._body = self._doc.element.body
+        self.ruta = ruta
+        fd, self._temporal = tempfile.mkstemp(suffix='.docx.tmp', dir=os.path.dirname(os.path.abspath(ruta)) if ruta else None)
+        self._archivo = os.fdopen(fd, 'wb')
+        self._zip = zipfile.ZipFile(self._archivo, 'w', zipfile.ZIP_DEFLATED)
+        self._salida = self._zip.open(PARTE_DOCUMENTO, 'w', force_zip64=True)
+
+        # Las declaraciones de espacios de nombres van una sola vez, en w:document
+        raiz = etree.tostring(self._doc.element, encoding='unicode')
+        self._declaraciones = declaraciones_raiz(self._doc.element)
+        self._escribir(DECLARACION_XML + raiz[:raiz.index('<w:body>') + len('<w:body>')])
+        self.bloques = 0
+
+    def _escribir(self, texto):
+        self._salida.write(texto.encode('utf-8'))
+
+    def _serializar(self, elemento):
+        return xml_bloque(elemento, self._declaraciones)
+
+    def _vaciar(self):
+        """Escribir y soltar los bloques pendientes (todo salvo w:sectPr)"""
+        for elemento in list(self._body):
+            if elemento.tag == SECCION:
+                continue
+            self._escribir(self._serializar(elemento))
+            self._body.remove(elemento)
+            self.bloques += 1
+
+    # Métodos de python-docx usados por los generadores
+
+    def add_heading(self, text='', level=1):
+        self._vaciar()
+        return self._doc.add_heading(text, level)
+
+    def add_paragraph(self, text='', style=None):
+        self._vaciar()
+        return self._doc.add_paragraph(text, style)
+
+    def add_table(self, rows, cols, style=None):
+        self._vaciar()
+        return self._doc.add_table(rows, cols, style)
+
+    def add_page_break(self):
+        self._vaciar()
+        return self._doc.add_page_break()
+
+    def add_picture(self, image_path_or_stream, width=None, height=None):
+        self._vaciar()
+        return self._doc.add_picture(image_path_or_stream, width, height)
+
+    def __getattr__(self, nombre):
+        # styles, sections, settings, core_properties, part...
+        return getattr(self._doc, nombre)
+
+    def escribir_filas(self, table, tramos):
+        """Escribir una tabla recién agregada con sus filas como texto XML (tramos de w:tr)"""
+        self._body.remove(table._tbl)
+        self._vaciar()
+        apertura = self._serializar(table._tbl)
+        self._escribir(apertura[:apertura.rindex('</w:tbl>')])
+        for tramo in tramos:
+            self._escribir(''.join(tramo))
+        self._escribir('</w:tbl>')
+        self.bloques += 1
+
+    def escribir_fragmento(self, xml):
+        """Escribir los bloques de un fragmento (<w:body ...>bloques</w:body>) como texto XML"""
+        self._vaciar()
+        apertura = xml[:xml.index('>') + 1]
+        if apertura != f'<w:body{"".join(self._declaraciones)}>':
+            # Espacios de nombres distintos de los de w:document: se reescriben bloque a bloque
+            for elemento in etree.fromstring(xml):
+                self._escribir(self._serializar(elemento))
+                self.bloques += 1
+            return
+        self._escribir(xml[len(apertura):xml.rindex('</w:body>')])
+        self.bloques += 1
+
+    # Cierre
+
+    def save(self, ruta=None):
+        """Terminar el documento y dejarlo en `ruta` (o en la ruta indicada al crearlo)"""
+        ruta = ruta or self.ruta
+        if ruta is None:
+            raise ValueError("Se requiere la ruta del documento")
+        try:
+            self._vaciar()
+            self._escribir(self._serializar(self._body.sectPr) + '</w:body></w:document>')
+            self._salida.close()
+
+            # Demás partes del paquete (estilos, relaciones, imágenes) desde el documento de trabajo
+            paquete = io.BytesIO()
+            self._doc.save(paquete)
+            with zipfile.ZipFile(paquete) as origen:
+                for info in origen.infolist():
+                    if info.filename != PARTE_DOCUMENTO:
+                        self._zip.writestr(info, origen.read(info), zipfile.ZIP_DEFLATED)
+            self._zip.close()
+            self._archivo.close()
+            shutil.move(self._temporal, ruta)
+        except BaseException:
+            self.descartar()
+            raise
+
+    def descartar(self):
+        """Abandonar el documento y borrar el archivo temporal"""
+        try:
+            self._salida.close()
+            self._zip.close()
+        except (OSError, ValueError):
+            pass
+        self._archivo.close()
+        if os.path.exists(self._temporal):
+            os.remove(self._temporal)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        if tipo is not None:
+            self.descartar()
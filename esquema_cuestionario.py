@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Esquema único del Cuestionario Likert
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Define una sola vez las preguntas, secciones, comentarios, datos del
+encuestado, evaluación general, puntuaciones compuestas y polaridad de
+los ítems que usan los generadores HTML, DOCX y Google Forms y el
+análisis de respuestas. El esquema se valida y se compila en una tabla plana de
+ítems indexada, que se guarda en disco (pickle) bajo la huella SHA-256
+de sus datos para que cada generador parta de la misma estructura
+precompilada.
+"""
+
+import hashlib
+import os
+import pickle
+
+# Incrementar al cambiar la forma del esquema compilado
+ESQUEMA_VERSION = 4
+
+CACHE_DIR = os.environ.get(
+    'LOGICQP_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.logicqp_cache')
+)
+
+ESCALA_LIKERT = (1, 2, 3, 4, 5)
+
+# Definir todas las preguntas por sección
+PREGUNTAS = {
+    'facilidad': [
+        'El sistema es fácil de usar',
+        'La interfaz es intuitiva y clara',
+        'Es fácil navegar por el sistema',
+        'Los menús son fáciles de encontrar',
+        'Las funciones están bien organizadas'
+    ],
+    'diseno': [
+        'El diseño visual es atractivo',
+        'Los colores son apropiados',
+        'Los textos son legibles',
+        'Los botones son fáciles de identificar',
+        'El diseño es consistente en todas las páginas'
+    ],
+    'navegacion': [
+        'Es fácil encontrar lo que busco',
+        'La estructura del menú es lógica',
+        'Es fácil regresar a páginas anteriores',
+        'Los enlaces funcionan correctamente',
+        'El sistema tiene un buen flujo de trabajo'
+    ],
+    'velocidad': [
+        'El sistema carga rápidamente',
+        'Las páginas se abren sin demoras',
+        'Las búsquedas son rápidas',
+        'Los reportes se generan rápidamente',
+        'El sistema responde bien a mis acciones'
+    ],
+    'productividad': [
+        'Puedo completar mis tareas rápidamente',
+        'El sistema me ayuda a ser más productivo',
+        'Puedo realizar múltiples tareas simultáneamente',
+        'El sistema me ahorra tiempo',
+        'Puedo trabajar de manera eficiente'
+    ],
+    'funcionalidades': [
+        'La búsqueda de productos es eficiente',
+        'El proceso de compra es rápido',
+        'La gestión de inventario es eficaz',
+        'Los reportes son útiles y completos',
+        'Las notificaciones son oportunas'
+    ],
+    'satisfaccion': [
+        'Estoy satisfecho con el sistema en general',
+        'El sistema cumple con mis expectativas',
+        'Recomendaría el sistema a otros',
+        'El sistema mejora mi experiencia de trabajo',
+        'Estoy contento con la calidad del sistema'
+    ],
+    'experiencia': [
+        'El sistema es agradable de usar',
+        'Me siento cómodo usando el sistema',
+        'El sistema me da confianza',
+        'Me siento apoyado por el sistema',
+        'El sistema es confiable'
+    ],
+    'valor': [
+        'El sistema aporta valor a mi trabajo',
+        'Las funcionalidades son útiles',
+        'El sistema resuelve mis necesidades',
+        'El sistema es indispensable para mi trabajo',
+        'El sistema supera a otros sistemas similares'
+    ],
+    'productos': [
+        'Es fácil buscar productos',
+        'Los filtros funcionan bien',
+        'La información de productos es clara',
+        'Es fácil agregar productos al carrito',
+        'La gestión de categorías es eficiente'
+    ],
+    'compra': [
+        'El carrito de compras es fácil de usar',
+        'El proceso de checkout es claro',
+        'Los formularios son fáciles de llenar',
+        'Las opciones de pago son claras',
+        'Las confirmaciones son útiles'
+    ],
+    'inventario': [
+        'Es fácil crear nuevos productos',
+        'La actualización de stock es sencilla',
+        'Las alertas de reposición son útiles',
+        'Los reportes de inventario son completos',
+        'La trazabilidad de lotes es efectiva'
+    ],
+    'reportes': [
+        'Es fácil generar reportes',
+        'Los filtros de reportes son útiles',
+        'La exportación de datos funciona bien',
+        'Los gráficos son claros y útiles',
+        'La información de auditoría es completa'
+    ],
+    'seguridad': [
+        'Me siento seguro usando el sistema',
+        'El sistema protege mi información',
+        'Los controles de acceso son adecuados',
+        'El sistema es seguro para transacciones',
+        'Confío en la seguridad del sistema'
+    ],
+    'confiabilidad': [
+        'El sistema funciona de manera consistente',
+        'Rara vez experimento errores',
+        'El sistema está disponible cuando lo necesito',
+        'Los datos se guardan correctamente',
+        'El sistema es estable y confiable'
+    ],
+    'responsivo': [
+        'El sistema funciona bien en mi dispositivo',
+        'La interfaz se adapta bien a diferentes tamaños',
+        'Es fácil usar el sistema en móvil',
+        'Los elementos son fáciles de tocar',
+        'El sistema es accesible desde cualquier lugar'
+    ],
+    'accesibilidad': [
+        'El sistema es fácil de usar para personas con discapacidades',
+        'Los textos tienen buen contraste',
+        'El sistema es compatible con lectores de pantalla',
+        'Los elementos son fáciles de identificar',
+        'El sistema es inclusivo'
+    ],
+    'problemas': [
+        'He experimentado errores en el sistema',
+        'El sistema a veces es lento',
+        'Algunas funciones no funcionan como esperaba',
+        'He tenido problemas de conectividad',
+        'El sistema a veces se cuelga'
+    ],
+    'mejoras': [
+        'Necesito más funcionalidades',
+        'El sistema necesita mejoras en la interfaz',
+        'Necesito mejor rendimiento',
+        'El sistema necesita mejor documentación',
+        'Necesito mejor soporte técnico'
+    ],
+    'impacto': [
+        'El sistema me ayuda a ser más productivo',
+        'El sistema mejora la calidad de mi trabajo',
+        'El sistema me ahorra tiempo',
+        'El sistema reduce errores en mi trabajo',
+        'El sistema mejora la comunicación'
+    ],
+    'objetivos': [
+        'El sistema cumple con los objetivos del negocio',
+        'El sistema es rentable para la organización',
+        'El sistema mejora la satisfacción del cliente',
+        'El sistema reduce costos operativos',
+        'El sistema mejora la competitividad'
+    ]
+}
+
+# Agrupación de subsecciones Likert por sección
+SECCIONES = [
+    ('🔍 SECCIÓN 1: USABILIDAD', [
+        ('1.1 Facilidad de Uso General', 'facilidad'),
+        ('1.2 Diseño de la Interfaz', 'diseno'),
+        ('1.3 Navegación y Estructura', 'navegacion')
+    ]),
+    ('⚡ SECCIÓN 2: EFICIENCIA', [
+        ('2.1 Velocidad y Rendimiento', 'velocidad'),
+        ('2.2 Productividad', 'productividad'),
+        ('2.3 Funcionalidades Específicas', 'funcionalidades')
+    ]),
+    ('😊 SECCIÓN 3: SATISFACCIÓN', [
+        ('3.1 Satisfacción General', 'satisfaccion'),
+        ('3.2 Experiencia de Usuario', 'experiencia'),
+        ('3.3 Valor y Utilidad', 'valor')
+    ]),
+    ('🔧 SECCIÓN 4: FUNCIONALIDADES ESPECÍFICAS', [
+        ('4.1 Gestión de Productos', 'productos'),
+        ('4.2 Proceso de Compra', 'compra'),
+        ('4.3 Gestión de Inventario', 'inventario'),
+        ('4.4 Reportes y Auditoría', 'reportes')
+    ]),
+    ('🛡️ SECCIÓN 5: SEGURIDAD Y CONFIABILIDAD', [
+        ('5.1 Seguridad', 'seguridad'),
+        ('5.2 Confiabilidad', 'confiabilidad')
+    ]),
+    ('📱 SECCIÓN 6: RESPONSIVIDAD Y ACCESIBILIDAD', [
+        ('6.1 Diseño Responsivo', 'responsivo'),
+        ('6.2 Accesibilidad', 'accesibilidad')
+    ]),
+    ('🚨 SECCIÓN 7: PROBLEMAS Y MEJORAS', [
+        ('7.1 Problemas Encontrados', 'problemas'),
+        ('7.2 Necesidades de Mejora', 'mejoras')
+    ]),
+    ('🎯 SECCIÓN 8: OBJETIVOS DE NEGOCIO', [
+        ('8.1 Impacto en el Trabajo', 'impacto'),
+        ('8.2 Cumplimiento de Objetivos', 'objetivos')
+    ])
+]
+
+# Preguntas abiertas de la sección de comentarios
+COMENTARIOS = [
+    ('¿Qué es lo que más le gusta del sistema LogicQP?', 'me_gusta'),
+    ('¿Qué es lo que menos le gusta del sistema?', 'no_gusta'),
+    ('¿Qué funcionalidades le gustaría que se agreguen?', 'funcionalidades_nuevas'),
+    ('¿Qué mejoras sugiere para el sistema?', 'mejoras_sugeridas'),
+    ('¿Alguna otra observación o comentario?', 'otras_observaciones')
+]
+
+# Datos del encuestado (Sección 0): campo -> (opciones válidas o None si es texto libre, requerido)
+CAMPOS_PERFIL = {
+    'nombre': (None, False),
+    'rol': (None, True),
+    'experiencia': (None, True),
+    'frecuencia': (('diario', 'semanal', 'mensual', 'ocasional'), True),
+    'navegador': (('chrome', 'firefox', 'safari', 'edge', 'otros'), True),
+    'dispositivo': (('escritorio', 'laptop', 'tablet', 'movil'), True),
+}
+
+# Evaluación general (Sección 10): campo -> opciones ordenadas de peor a mejor
+EVALUACION_GENERAL = {
+    'puntuacion_general': ('1', '2', '3', '4', '5'),
+    'comparacion': ('mucho_peor', 'peor', 'similar', 'mejor', 'mucho_mejor'),
+    'recomendacion': ('definitivamente_no', 'probablemente_no', 'neutral', 'probablemente_si', 'definitivamente_si'),
+}
+
+# Puntuaciones compuestas de calculateScores(): nombre -> grupos promediados
+COMPUESTOS = {
+    'usabilidad': ('facilidad', 'diseno', 'navegacion'),
+    'eficiencia': ('velocidad', 'productividad', 'funcionalidades'),
+    'satisfaccion': ('satisfaccion', 'experiencia', 'valor'),
+}
+
+# Ítems redactados en negativo ("El sistema a veces es lento"): se puntúan invertidos (1 <-> 5)
+ITEMS_INVERTIDOS = tuple(
+    f"{key}_{i}" for key in ('problemas', 'mejoras') for i in range(1, len(PREGUNTAS[key]) + 1)
+)
+
+_esquema_cargado = None
+
+def validar_esquema(preguntas, secciones, comentarios, perfil=None, evaluacion=None, compuestos=None,
+                    invertidos=()):
+    """Validar la consistencia del esquema y lanzar ValueError si falla"""
+    referenciados = []
+    for section_title, subsections in secciones:
+        if not subsections:
+            raise ValueError(f"La sección '{section_title}' no tiene subsecciones")
+        for subsection_title, question_key in subsections:
+            if question_key not in preguntas:
+                raise ValueError(f"La subsección '{subsection_title}' usa el grupo inexistente '{question_key}'")
+            referenciados.append(question_key)
+
+    duplicados = sorted({key for key in referenciados if referenciados.count(key) > 1})
+    if duplicados:
+        raise ValueError(f"Grupos usados en más de una subsección: {', '.join(duplicados)}")
+
+    sin_seccion = sorted(set(preguntas) - set(referenciados))
+    if sin_seccion:
+        raise ValueError(f"Grupos sin sección asignada: {', '.join(sin_seccion)}")
+
+    for question_key, questions in preguntas.items():
+        if not questions:
+            raise ValueError(f"El grupo '{question_key}' no tiene preguntas")
+        for question in questions:
+            if not isinstance(question, str) or not question.strip():
+                raise ValueError(f"El grupo '{question_key}' tiene una pregunta vacía")
+
+    nombres = [name for _, name in comentarios]
+    if len(set(nombres)) != len(nombres):
+        raise ValueError("Hay comentarios con nombres repetidos")
+    item_ids = {f"{key}_{i}" for key, questions in preguntas.items() for i in range(1, len(questions) + 1)}
+    conflictos = sorted(item_ids & set(nombres))
+    if conflictos:
+        raise ValueError(f"Comentarios con el mismo nombre que un ítem Likert: {', '.join(conflictos)}")
+
+    campos = list(perfil or {}) + list(evaluacion or {})
+    conflictos = sorted((item_ids | set(nombres)) & set(campos))
+    if conflictos or len(set(campos)) != len(campos):
+        raise ValueError(f"Campos de perfil o evaluación repetidos: {', '.join(conflictos) or 'perfil/evaluación'}")
+    for name, opciones in (evaluacion or {}).items():
+        if not opciones or len(set(opciones)) != len(opciones):
+            raise ValueError(f"El campo '{name}' necesita opciones distintas")
+
+    for name, grupos in (compuestos or {}).items():
+        desconocidos = [key for key in grupos if key not in preguntas]
+        if not grupos or desconocidos:
+            raise ValueError(f"El compuesto '{name}' usa grupos inexistentes: {', '.join(desconocidos) or '(vacío)'}")
+
+    desconocidos = sorted(set(invertidos) - item_ids)
+    if desconocidos:
+        raise ValueError(f"Ítems invertidos inexistentes: {', '.join(desconocidos)}")
+
+def huella_esquema(preguntas, secciones, comentarios, perfil=None, evaluacion=None, compuestos=None,
+                   invertidos=()):
+    """Huella SHA-256 de los datos del esquema"""
+    contenido = repr((ESQUEMA_VERSION, preguntas, secciones, comentarios, perfil, evaluacion, compuestos,
+                      tuple(invertidos)))
+    return hashlib.sha256(contenido.encode('utf-8')).hexdigest()
+
+def compilar_esquema(preguntas=PREGUNTAS, secciones=SECCIONES, comentarios=COMENTARIOS,
+                     perfil=CAMPOS_PERFIL, evaluacion=EVALUACION_GENERAL, compuestos=COMPUESTOS,
+                     invertidos=ITEMS_INVERTIDOS):
+    """Validar el esquema y compilarlo en una tabla plana de ítems"""
+    validar_esquema(preguntas, secciones, comentarios, perfil, evaluacion, compuestos, invertidos)
+
+    items = []
+    item_texto = []
+    item_grupo = []
+    item_seccion = []
+    grupos = []
+    grupo_rango = {}
+
+    # Los ítems siguen el orden de aparición en el cuestionario
+    for section_index, (section_title, subsections) in enumerate(secciones):
+        for subsection_title, question_key in subsections:
+            inicio = len(items)
+            for i, question in enumerate(preguntas[question_key], 1):
+                items.append(f"{question_key}_{i}")
+                item_texto.append(question)
+                item_grupo.append(question_key)
+                item_seccion.append(section_index)
+            grupos.append(question_key)
+            grupo_rango[question_key] = (inicio, len(items))
+
+    return {
+        'version': ESQUEMA_VERSION,
+        'huella': huella_esquema(preguntas, secciones, comentarios, perfil, evaluacion, compuestos, invertidos),
+        'preguntas': {key: tuple(questions) for key, questions in preguntas.items()},
+        'secciones': tuple(
+            (section_title, tuple(tuple(sub) for sub in subsections))
+            for section_title, subsections in secciones
+        ),
+        'comentarios': tuple(tuple(c) for c in comentarios),
+        'perfil': dict(perfil),
+        'evaluacion_general': dict(evaluacion),
+        'compuestos': {name: tuple(grupos) for name, grupos in compuestos.items()},
+        'items': tuple(items),
+        'item_texto': tuple(item_texto),
+        'item_grupo': tuple(item_grupo),
+        'item_seccion': tuple(item_seccion),
+        # Polaridad de cada ítem: 1 directo, -1 invertido
+        'item_polaridad': tuple(-1 if item_id in invertidos else 1 for item_id in items),
+        'grupos': tuple(grupos),
+        'grupo_rango': grupo_rango,
+        'indice': {item_id: i for i, item_id in enumerate(items)},
+    }
+
+def ruta_cache_esquema(huella):
+    """Ruta del esquema compilado en la caché de disco"""
+    return os.path.join(CACHE_DIR, f'esquema_v{ESQUEMA_VERSION}_{huella[:16]}.pickle')
+
+def cargar_esquema(usar_cache=True):
+    """Cargar el esquema compilado (una vez por proceso, desde disco si existe)"""
+    global _esquema_cargado
+    if _esquema_cargado is not None:
+        return _esquema_cargado
+
+    ruta = ruta_cache_esquema(huella_esquema(PREGUNTAS, SECCIONES, COMENTARIOS, CAMPOS_PERFIL,
+                                             EVALUACION_GENERAL, COMPUESTOS, ITEMS_INVERTIDOS))
+    if usar_cache and os.path.exists(ruta):
+        try:
+            with open(ruta, 'rb') as f:
+                _esquema_cargado = pickle.load(f)
+            return _esquema_cargado
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass  # Caché corrupta: recompilar
+
+    _esquema_cargado = compilar_esquema()
+    if usar_cache:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            temporal = f'{ruta}.{os.getpid()}.tmp'
+            with open(temporal, 'wb') as f:
+                pickle.dump(_esquema_cargado, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporal, ruta)
+        except OSError:
+            pass  # Sin caché escribible: el esquema se vuelve a compilar en el próximo proceso
+    return _esquema_cargado
+
+def main():
+    """Función principal"""
+    print("🚀 Compilando esquema del cuestionario...")
+    esquema = cargar_esquema()
+    print(f"✅ Esquema compilado: {ruta_cache_esquema(esquema['huella'])}")
+    print(f"📊 Total de secciones Likert: {len(esquema['secciones'])}")
+    print(f"📝 Total de ítems Likert: {len(esquema['items'])}")
+    print(f"🔄 Ítems invertidos: {esquema['item_polaridad'].count(-1)}")
+    print(f"💬 Total de comentarios: {len(esquema['comentarios'])}")
+
+if __name__ == "__main__":
+    main()
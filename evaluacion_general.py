@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Análisis de la evaluación general (Sección 10) del cuestionario
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Las tres preguntas de la Sección 10 (puntuacion_general, comparacion y
+recomendacion) tienen opciones ordenadas de peor a mejor en el esquema,
+así que cada respuesta es un código ordinal 1-5 (0 = sin respuesta).
+Para cada pregunta se mantiene, con actualizaciones por bloques:
+  - la distribución de respuestas, total y por día o semana
+  - la proporción de promotores (5), pasivos (4) y detractores (1-3) y
+    el índice neto (promotores - detractores), al estilo Net Promoter
+  - la correlación con cada puntuación compuesta y el total, con
+    co-momentos combinados por bloques (Chan et al.)
+
+Leer los resultados no recorre las respuestas; el estado se guarda en
+instantáneas .npz como en agregados_en_linea.py.
+
+Uso:
+    python evaluacion_general.py --almacen campana_2025 --periodo semana
+    python evaluacion_general.py --sintetico 1000000
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from agregados_en_linea import fusionar
+from esquema_cuestionario import cargar_esquema
+from puntuaciones import BLOQUE_FILAS, matriz_sintetica, puntuaciones_centesimas
+
+# Cortes en la escala ordinal 1-5
+PROMOTOR_MINIMO = 5
+DETRACTOR_MAXIMO = 3
+
+# Periodo -> (segundos, desplazamiento para que la semana empiece el lunes; el 1/1/1970 fue jueves)
+PERIODOS = {
+    'dia': (86400, 0),
+    'semana': (7 * 86400, 3 * 86400),
+}
+
+def codigos_ordinales(respuestas, esquema=None):
+    """Matriz encuestado × pregunta de la Sección 10 con códigos 1 = peor … 5 = mejor (0 = sin respuesta)"""
+    esquema = esquema or cargar_esquema()
+    respuestas = list(respuestas)
+    campos = esquema['evaluacion_general']
+    codigos = np.zeros((len(respuestas), len(campos)), dtype=np.uint8)
+    for j, (campo, opciones) in enumerate(campos.items()):
+        # Cada valor distinto se traduce una sola vez y se reparte con su índice inverso
+        valores = np.array([str(r.get(campo) or '') for r in respuestas], dtype=str)
+        distintos, inversa = np.unique(valores, return_inverse=True)
+        orden = {opcion: i for i, opcion in enumerate(opciones, 1)}
+        codigos[:, j] = np.array([orden.get(v, 0) for v in distintos], dtype=np.uint8)[inversa]
+    return codigos
+
+class AnaliticaEvaluacion:
+    """Distribuciones, promotores/detractores y correlaciones de la Sección 10, actualizados por bloques"""
+
+    def __init__(self, esquema=None, periodo='dia', desfase=None):
+        self.esquema = esquema or cargar_esquema()
+        self.campos = list(self.esquema['evaluacion_general'])
+        self.niveles = max(len(opciones) for opciones in self.esquema['evaluacion_general'].values()) + 1
+        self.puntuaciones = [*self.esquema['compuestos'], 'total']
+        self.periodo = periodo
+        self.segundos, self.origen = PERIODOS[periodo]
+        # Los periodos se cortan en la hora local (desfase respecto de UTC en segundos)
+        self.desfase = time.localtime().tm_gmtoff if desfase is None else desfase
+        self.filas = 0
+        self.histograma = np.zeros((len(self.campos), self.niveles), dtype=np.int64)
+        self.por_periodo = {}
+        # Co-momentos de cada par (pregunta, puntuación), aplanados: pregunta * puntuaciones + puntuación
+        pares = len(self.campos) * len(self.puntuaciones)
+        self.n = np.zeros(pares)
+        self.media_x = np.zeros(pares)
+        self.media_y = np.zeros(pares)
+        self.m2_x = np.zeros(pares)
+        self.m2_y = np.zeros(pares)
+        self.c_xy = np.zeros(pares)
+
+    # Actualización
+
+    def agregar_columnas(self, likert, categoricos=None, textos=None, recibido=None, duracion=None):
+        """Incorporar un bloque (mismo protocolo que AlmacenColumnar.agregar_columnas)"""
+        likert = np.asarray(likert)
+        filas = len(likert)
+        if not filas:
+            return 0
+        categoricos = categoricos or {}
+        codigos = np.zeros((filas, len(self.campos)), dtype=np.uint8)
+        for j, campo in enumerate(self.campos):
+            if campo in categoricos:
+                codigos[:, j] = np.asarray(categoricos[campo], dtype=np.uint8).reshape(filas)
+        if recibido is None:
+            recibido = np.full(filas, time.time())
+        for inicio in range(0, filas, BLOQUE_FILAS):
+            fin = inicio + BLOQUE_FILAS
+            self._agregar_bloque(likert[inicio:fin], codigos[inicio:fin], np.asarray(recibido)[inicio:fin])
+        self.filas += filas
+        return filas
+
+    def agregar_respuestas(self, respuestas, recibido=None):
+        """Incorporar envíos (objetos `data` o respuestas validadas)"""
+        from puntuaciones import matriz_respuestas
+        respuestas = list(respuestas)
+        codigos = codigos_ordinales(respuestas, self.esquema)
+        categoricos = {campo: codigos[:, j] for j, campo in enumerate(self.campos)}
+        return self.agregar_columnas(matriz_respuestas(respuestas, self.esquema), categoricos, recibido=recibido)
+
+    def _agregar_bloque(self, likert, codigos, recibido):
+        campos = len(self.campos)
+        # Histograma total y por periodo con un solo bincount: (periodo, pregunta, código)
+        periodos = np.floor((recibido + self.desfase + self.origen) / self.segundos).astype(np.int64)
+        distintos, inversa = np.unique(periodos, return_inverse=True)
+        celda = (inversa[:, None] * campos + np.arange(campos)) * self.niveles + codigos
+        conteos = np.bincount(celda.ravel(), minlength=len(distintos) * campos * self.niveles)
+        conteos = conteos.reshape(len(distintos), campos, self.niveles)
+        self.histograma += conteos.sum(axis=0)
+        for periodo, conteo in zip(distintos.tolist(), conteos):
+            if periodo in self.por_periodo:
+                self.por_periodo[periodo] += conteo
+            else:
+                self.por_periodo[periodo] = conteo.copy()
+
+        # Sumas de cada par sobre los casos con ambas respuestas, con matmuls contra las máscaras.
+        # Puntuaciones en centésimas enteras: las sumas del bloque son exactas en float64.
+        centesimas = puntuaciones_centesimas(likert, self.esquema)
+        y = np.stack([centesimas[name] for name in self.puntuaciones], axis=1).astype(np.float64)
+        x = codigos.astype(np.float64)
+        hay_x = (x > 0).astype(np.float64)
+        hay_y = (y > 0).astype(np.float64)
+        n = (hay_x.T @ hay_y).ravel()
+        suma_x = (x.T @ hay_y).ravel()
+        suma_y = (hay_x.T @ y).ravel()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            media_x = np.where(n > 0, suma_x / n, 0)
+            media_y = np.where(n > 0, suma_y / n, 0)
+        m2_x = ((x ** 2).T @ hay_y).ravel() - suma_x * media_x
+        m2_y = (hay_x.T @ y ** 2).ravel() - suma_y * media_y
+        c_xy = (x.T @ y).ravel() - suma_x * media_y
+
+        n_total = self.n + n
+        proporcion = np.divide(n, n_total, out=np.zeros(len(n)), where=n_total > 0)
+        self.c_xy = self.c_xy + c_xy + (media_x - self.media_x) * (media_y - self.media_y) * self.n * proporcion
+        _, self.media_y, self.m2_y = fusionar(self.n, self.media_y, self.m2_y, n, media_y, m2_y)
+        self.n, self.media_x, self.m2_x = fusionar(self.n, self.media_x, self.m2_x, n, media_x, m2_x)
+
+    def sincronizar(self, almacen, bloque=BLOQUE_FILAS):
+        """Procesar las respuestas del almacén columnar posteriores a las ya incluidas"""
+        if almacen.filas < self.filas:
+            raise ValueError("El almacén tiene menos respuestas que el análisis")
+        columnas = {campo: almacen.categorico(campo) for campo in self.campos if campo in almacen.categoricos}
+        recibido = almacen.recibido()
+        nuevas = 0
+        for inicio in range(self.filas, almacen.filas, bloque):
+            fin = inicio + bloque
+            categoricos = {campo: codigos[inicio:fin] for campo, codigos in columnas.items()}
+            nuevas += self.agregar_columnas(almacen.matriz(inicio=inicio, fin=fin), categoricos,
+                                            recibido=recibido[inicio:fin])
+        return nuevas
+
+    # Lectura
+
+    def _indicadores(self, conteo):
+        respondidas = conteo[1:]
+        n = int(respondidas.sum())
+        codigos = np.arange(1, self.niveles)
+        promotores = int(respondidas[codigos >= PROMOTOR_MINIMO].sum())
+        detractores = int(respondidas[codigos <= DETRACTOR_MAXIMO].sum())
+        proporcion = (lambda c: c / n) if n else (lambda c: 0.0)
+        return {
+            'n': n,
+            'media': float(respondidas @ codigos / n) if n else 0.0,
+            'distribucion': [int(c) for c in respondidas],
+            'promotores': proporcion(promotores),
+            'pasivos': proporcion(n - promotores - detractores),
+            'detractores': proporcion(detractores),
+            'neto': proporcion(promotores - detractores),
+        }
+
+    def indicadores(self, campo):
+        """Distribución, media e índices de promotores y detractores de una pregunta"""
+        return self._indicadores(self.histograma[self.campos.index(campo)])
+
+    def correlaciones(self, campo):
+        """Correlación de Pearson de una pregunta con cada puntuación (sobre los casos con ambas)"""
+        j = self.campos.index(campo)
+        pares = slice(j * len(self.puntuaciones), (j + 1) * len(self.puntuaciones))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r = self.c_xy[pares] / np.sqrt(self.m2_x[pares] * self.m2_y[pares])
+        return {name: float(valor) for name, valor in zip(self.puntuaciones, r)}
+
+    def etiqueta_periodo(self, periodo):
+        """Fecha de inicio de un periodo (AAAA-MM-DD)"""
+        return time.strftime('%Y-%m-%d', time.gmtime(periodo * self.segundos - self.origen))
+
+    def serie(self, campo):
+        """Indicadores de una pregunta en cada periodo, en orden cronológico"""
+        j = self.campos.index(campo)
+        return [dict(self._indicadores(self.por_periodo[p][j]), periodo=self.etiqueta_periodo(p))
+                for p in sorted(self.por_periodo)]
+
+    def resumen(self):
+        """Resultados actuales por pregunta, listos para JSON"""
+        return {
+            'respuestas': self.filas,
+            'periodo': self.periodo,
+            'preguntas': {
+                campo: dict(self.indicadores(campo), correlaciones=self.correlaciones(campo),
+                            serie=self.serie(campo))
+                for campo in self.campos
+            },
+        }
+
+    # Instantáneas
+
+    def guardar(self, ruta):
+        """Guardar el estado en un .npz (reemplazo atómico)"""
+        directorio = os.path.dirname(os.path.abspath(ruta))
+        os.makedirs(directorio, exist_ok=True)
+        periodos = sorted(self.por_periodo)
+        conteos = np.array([self.por_periodo[p] for p in periodos], dtype=np.int64).reshape(
+            len(periodos), len(self.campos), self.niveles)
+        temporal = f'{ruta}.{os.getpid()}.tmp'
+        with open(temporal, 'wb') as f:
+            np.savez(f, campos=np.array(self.campos), puntuaciones=np.array(self.puntuaciones),
+                     periodo=np.array(self.periodo), desfase=np.int64(self.desfase), filas=np.int64(self.filas),
+                     histograma=self.histograma, periodos=np.array(periodos, dtype=np.int64),
+                     conteos_periodo=conteos, n=self.n, media_x=self.media_x, media_y=self.media_y,
+                     m2_x=self.m2_x, m2_y=self.m2_y, c_xy=self.c_xy)
+        os.replace(temporal, ruta)
+
+    @classmethod
+    def cargar(cls, ruta, esquema=None):
+        """Estado guardado con guardar(); ValueError si corresponde a otro cuestionario"""
+        with np.load(ruta) as datos:
+            analitica = cls(esquema, str(datos['periodo']), int(datos['desfase']))
+            if (datos['campos'].tolist() != analitica.campos
+                    or datos['puntuaciones'].tolist() != analitica.puntuaciones):
+                raise ValueError("La instantánea corresponde a otra versión del cuestionario")
+            analitica.filas = int(datos['filas'])
+            analitica.histograma = datos['histograma']
+            analitica.por_periodo = dict(zip(datos['periodos'].tolist(), datos['conteos_periodo']))
+            for nombre in ('n', 'media_x', 'media_y', 'm2_x', 'm2_y', 'c_xy'):
+                setattr(analitica, nombre, datos[nombre])
+        return analitica
+
+def datos_sinteticos(total, semilla=0, esquema=None, dias=30):
+    """Respuestas aleatorias cuya Sección 10 acompaña al total, repartidas en `dias` días"""
+    esquema = esquema or cargar_esquema()
+    rng = np.random.default_rng(semilla)
+    likert = matriz_sintetica(total, semilla, esquema)
+    base = puntuaciones_centesimas(likert, esquema)['total'] / 100
+    categoricos = {}
+    for campo in esquema['evaluacion_general']:
+        codigos = np.clip(np.rint(base + rng.normal(0.5, 1.0, total)), 1, 5).astype(np.uint8)
+        codigos[rng.random(total) < 0.05] = 0
+        categoricos[campo] = codigos
+    recibido = time.time() - rng.random(total) * dias * 86400
+    return likert, categoricos, np.sort(recibido)
+
+def imprimir_resumen(analitica, periodos=8):
+    """Indicadores por pregunta y evolución de los últimos periodos"""
+    print(f"📊 Respuestas: {analitica.filas}")
+    for campo in analitica.campos:
+        r = analitica.indicadores(campo)
+        print()
+        print(f"🎯 {campo}: n={r['n']}  media {r['media']:.2f}  "
+              f"promotores {r['promotores']:.1%}  pasivos {r['pasivos']:.1%}  "
+              f"detractores {r['detractores']:.1%}  neto {r['neto'] * 100:+.1f}")
+        print("   Correlación: " + '  '.join(f"{name} {valor:.2f}" for name, valor in
+                                          analitica.correlaciones(campo).items()))
+        for punto in analitica.serie(campo)[-periodos:]:
+            print(f"   {punto['periodo']}  n={punto['n']:<8} neto {punto['neto'] * 100:+6.1f}  media {punto['media']:.2f}")
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Promotores, distribuciones y correlaciones de la Sección 10')
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument('--almacen', help='Directorio del almacén columnar')
+    grupo.add_argument('--sintetico', type=int, metavar='N', help='Medir con N respuestas aleatorias')
+    parser.add_argument('--periodo', choices=list(PERIODOS), default='dia', help='Agrupación en el tiempo')
+    parser.add_argument('--instantanea', help='Archivo .npz del estado (por defecto: evaluacion.npz en el almacén)')
+    args = parser.parse_args()
+
+    esquema = cargar_esquema()
+    inicio = time.perf_counter()
+    if args.almacen:
+        from almacen_columnar import AlmacenColumnar
+        almacen = AlmacenColumnar(args.almacen, esquema)
+        ruta = args.instantanea or os.path.join(args.almacen, f'evaluacion_{args.periodo}.npz')
+        print(f"🚀 Actualizando análisis de {args.almacen}...")
+        analitica = None
+        if os.path.exists(ruta):
+            try:
+                analitica = AnaliticaEvaluacion.cargar(ruta, esquema)
+            except (OSError, ValueError, KeyError):
+                analitica = None  # Instantánea dañada u obsoleta: recalcular
+        if analitica is None or analitica.periodo != args.periodo or analitica.filas > almacen.filas:
+            analitica = AnaliticaEvaluacion(esquema, args.periodo)
+        nuevas = analitica.sincronizar(almacen)
+        analitica.guardar(ruta)
+        print(f"✅ {nuevas} respuestas nuevas procesadas en {time.perf_counter() - inicio:.2f}s")
+        print(f"💾 Instantánea: {ruta}")
+    else:
+        print(f"🚀 Generando {args.sintetico} respuestas sintéticas...")
+        likert, categoricos, recibido = datos_sinteticos(args.sintetico, esquema=esquema)
+        inicio = time.perf_counter()
+        analitica = AnaliticaEvaluacion(esquema, args.periodo)
+        analitica.agregar_columnas(likert, categoricos, recibido=recibido)
+        print(f"⏱️ Análisis calculado en {time.perf_counter() - inicio:.2f}s")
+    imprimir_resumen(analitica)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Análisis de fiabilidad de las subsecciones Likert
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Cada subsección del cuestionario (facilidad, diseno, velocidad,
+seguridad…) es una escala de varios ítems. Para todas a la vez se
+calcula, sobre los encuestados que respondieron todos sus ítems:
+  - alfa de Cronbach
+  - alfa si se elimina cada ítem
+  - correlación ítem-total corregida (ítem contra la suma de los demás)
+
+Todo sale de la matriz de covarianzas de cada subsección, que se
+acumula en una sola pasada por bloques de filas: las subsecciones del
+mismo tamaño se apilan y sus conteos, sumas y productos cruzados se
+calculan con un único matmul por lotes.
+
+Uso:
+    python fiabilidad.py --almacen campana_2025
+    python fiabilidad.py --sintetico 1000000 --subsecciones 40
+"""
+
+import argparse
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from esquema_cuestionario import cargar_esquema
+
+# Filas por bloque: bloques chicos caben en caché; cada producto vale a lo sumo 25,
+# así que las sumas en float32 de un bloque son exactas (< 2**24)
+BLOQUE_FILAS = 4096
+
+# Umbrales habituales de interpretación
+ALFA_ACEPTABLE = 0.7
+CORRELACION_MINIMA = 0.3
+
+def acumular_momentos(matriz, grupos, bloque=BLOQUE_FILAS):
+    """Casos completos, sumas y productos cruzados de cada grupo de columnas {nombre: (inicio, fin)}"""
+    matriz = np.asarray(matriz)
+    por_tamano = defaultdict(list)
+    for nombre, (inicio, fin) in grupos.items():
+        por_tamano[fin - inicio].append((nombre, inicio))
+
+    momentos = {}
+    for k, lista in por_tamano.items():
+        columnas = np.concatenate([np.arange(inicio, inicio + k) for _, inicio in lista])
+        # Fila 0: indicador de caso completo; filas 1..k: ítems (anulados si el caso está incompleto).
+        # aumentada @ aumentada.T da en una sola operación n, las sumas y los productos cruzados.
+        acumulado = np.zeros((len(lista), k + 1, k + 1))
+        for inicio in range(0, matriz.shape[0], bloque):
+            # (G, k, filas) en uint8 antes de pasar a float32: la transposición es barata
+            x = np.ascontiguousarray(np.take(matriz[inicio:inicio + bloque], columnas, axis=1).T)
+            x = x.reshape(len(lista), k, -1)
+            completos = x.min(axis=1) > 0
+            aumentada = np.empty((len(lista), k + 1, x.shape[2]), dtype=np.float32)
+            aumentada[:, 0, :] = completos
+            np.multiply(x, completos[:, None, :], out=aumentada[:, 1:, :])
+            acumulado += np.matmul(aumentada, aumentada.transpose(0, 2, 1))
+        for g, (nombre, _) in enumerate(lista):
+            momentos[nombre] = (int(round(acumulado[g, 0, 0])), acumulado[g, 0, 1:], acumulado[g, 1:, 1:])
+    return momentos
+
+def covarianza(n, suma, productos):
+    """Matriz de covarianzas muestral a partir de los momentos"""
+    if n < 2:
+        return None
+    return (productos - np.outer(suma, suma) / n) / (n - 1)
+
+def fiabilidad_desde_covarianza(cov):
+    """Alfa, alfa sin cada ítem y correlación ítem-total corregida a partir de una covarianza k × k"""
+    k = cov.shape[0]
+    varianzas = np.diag(cov)
+    total = cov.sum()
+    filas = cov.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        alfa = k / (k - 1) * (1 - varianzas.sum() / total)
+        # Sin el ítem i: se quitan su fila, su columna y su varianza
+        total_sin = total - 2 * filas + varianzas
+        alfa_sin = (k - 1) / (k - 2) * (1 - (varianzas.sum() - varianzas) / total_sin) if k > 2 else np.full(k, np.nan)
+        # cov(x_i, T - x_i) / sqrt(var(x_i) · var(T - x_i))
+        correlacion = (filas - varianzas) / np.sqrt(varianzas * total_sin)
+    return float(alfa), alfa_sin, correlacion
+
+def analizar_fiabilidad(matriz, grupos=None, esquema=None, bloque=BLOQUE_FILAS):
+    """Fiabilidad de cada subsección; `grupos` por defecto son las del esquema"""
+    if grupos is None:
+        esquema = esquema or cargar_esquema()
+        grupos = esquema['grupo_rango']
+    resultados = {}
+    for nombre, (n, suma, productos) in acumular_momentos(matriz, grupos, bloque).items():
+        cov = covarianza(n, suma, productos)
+        if cov is None:
+            alfa, alfa_sin, correlacion = float('nan'), np.full(len(suma), np.nan), np.full(len(suma), np.nan)
+        else:
+            alfa, alfa_sin, correlacion = fiabilidad_desde_covarianza(cov)
+        resultados[nombre] = {
+            'n': n,
+            'alfa': alfa,
+            'alfa_sin_item': alfa_sin,
+            'correlacion_item_total': correlacion,
+        }
+    return {nombre: resultados[nombre] for nombre in grupos}
+
+def matriz_sintetica_escalas(total, subsecciones, items=5, semilla=0, bloque=1 << 16):
+    """Respuestas 1-5 con un factor latente por subsección y algunos ítems sin responder"""
+    rng = np.random.default_rng(semilla)
+    matriz = np.empty((total, subsecciones * items), dtype=np.uint8)
+    # Carga factorial distinta en cada subsección para obtener alfas variados
+    cargas = np.repeat(rng.uniform(0.2, 0.9, subsecciones), items).astype(np.float32)
+    for inicio in range(0, total, bloque):
+        filas = min(bloque, total - inicio)
+        latente = np.repeat(rng.standard_normal((filas, subsecciones), dtype=np.float32), items, axis=1)
+        ruido = rng.standard_normal((filas, subsecciones * items), dtype=np.float32)
+        valor = cargas * latente + np.sqrt(1 - cargas ** 2) * ruido
+        bloque_matriz = np.clip(np.rint(valor * 1.2 + 3), 1, 5).astype(np.uint8)
+        bloque_matriz[rng.random(bloque_matriz.shape, dtype=np.float32) < 0.02] = 0
+        matriz[inicio:inicio + filas] = bloque_matriz
+    grupos = {f'escala{g + 1}': (g * items, (g + 1) * items) for g in range(subsecciones)}
+    return matriz, grupos
+
+def imprimir_resultados(resultados, items_por_grupo=None):
+    """Tabla de alfas y advertencias por subsección"""
+    print(f"{'Subsección':<18} {'n':>9} {'α':>6}  α sin ítem / r ítem-total corregida")
+    for nombre, r in resultados.items():
+        estado = '✅' if r['alfa'] >= ALFA_ACEPTABLE else '⚠️'
+        detalle = '  '.join(f"{a:.2f}/{c:.2f}" for a, c in zip(r['alfa_sin_item'], r['correlacion_item_total']))
+        print(f"{estado} {nombre:<16} {r['n']:>9} {r['alfa']:>6.3f}  {detalle}")
+        # Ítems débiles: poca relación con el resto o que suben el alfa al quitarlos
+        for i, (a, c) in enumerate(zip(r['alfa_sin_item'], r['correlacion_item_total'])):
+            if c < CORRELACION_MINIMA or a > r['alfa']:
+                item = items_por_grupo[nombre][i] if items_por_grupo else f'ítem {i + 1}'
+                print(f"   ⚠️ {item}: r={c:.2f}, α sin él={a:.3f}")
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Fiabilidad (alfa de Cronbach) de las subsecciones Likert')
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument('--almacen', help='Directorio del almacén columnar')
+    grupo.add_argument('--sintetico', type=int, metavar='N', help='Medir con N respuestas sintéticas')
+    parser.add_argument('--subsecciones', type=int, default=40, help='Subsecciones de 5 ítems en --sintetico')
+    args = parser.parse_args()
+
+    items_por_grupo = None
+    if args.almacen:
+        from almacen_columnar import AlmacenColumnar
+        esquema = cargar_esquema()
+        print(f"🚀 Cargando respuestas de {args.almacen}...")
+        matriz = AlmacenColumnar(args.almacen, esquema).matriz()
+        grupos = esquema['grupo_rango']
+        items_por_grupo = {g: esquema['items'][i:f] for g, (i, f) in grupos.items()}
+    else:
+        print(f"🚀 Generando {args.sintetico} respuestas × {args.subsecciones} subsecciones...")
+        matriz, grupos = matriz_sintetica_escalas(args.sintetico, args.subsecciones)
+
+    inicio = time.perf_counter()
+    resultados = analizar_fiabilidad(matriz, grupos)
+    print(f"⏱️ Fiabilidad de {len(grupos)} subsecciones calculada en {time.perf_counter() - inicio:.2f}s")
+    imprimir_resultados(resultados, items_por_grupo)
+
+if __name__ == "__main__":
+    main()
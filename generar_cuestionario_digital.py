@@ -3,11 +3,20 @@
 """
 Generador de Cuestionario Digital Likert HTML
 Sistema LogicQP - Grupo 6 - Cel@g
+
+El HTML se escribe por secciones y filas directamente sobre el destino
+(archivo o cualquier objeto con método write), sin acumular la página
+completa en memoria.
 """
 
-def generate_likert_table(questions, section_name, question_prefix):
-    """Generar tabla de escala Likert"""
-    html = f"""
+import io
+import json
+
+from esquema_cuestionario import ESCALA_LIKERT, cargar_esquema
+
+def write_likert_table(out, questions, section_name, question_prefix):
+    """Escribir tabla de escala Likert fila por fila"""
+    out.write(f"""
                     <h3>{section_name}</h3>
                     <table class="likert-table">
                         <thead>
@@ -21,11 +30,11 @@ def generate_likert_table(questions, section_name, question_prefix):
                             </tr>
                         </thead>
                         <tbody>
-    """
+    """)
     
     for i, question in enumerate(questions, 1):
         question_name = f"{question_prefix}_{i}"
-        html += f"""
+        out.write(f"""
                             <tr>
                                 <td class="question-text">{question}</td>
                                 <td class="likert-options">
@@ -44,277 +53,140 @@ def generate_likert_table(questions, section_name, question_prefix):
                                     <input type="radio" name="{question_name}" value="5" required>
                                 </td>
                             </tr>
-        """
+        """)
     
-    html += """
+    out.write("""
                         </tbody>
                     </table>
-    """
-    return html
+    """)
 
-def generate_radio_question(question, name, options):
-    """Generar pregunta de opción múltiple"""
-    html = f"""
+def generate_likert_table(questions, section_name, question_prefix):
+    """Generar tabla de escala Likert"""
+    buffer = io.StringIO()
+    write_likert_table(buffer, questions, section_name, question_prefix)
+    return buffer.getvalue()
+
+def write_radio_question(out, question, name, options):
+    """Escribir pregunta de opción múltiple"""
+    out.write(f"""
                     <div class="form-group">
                         <label>{question}</label>
                         <div class="checkbox-group">
-    """
+    """)
     
     for i, option in enumerate(options):
         option_id = f"{name}_{i}"
-        html += f"""
+        out.write(f"""
                             <div class="checkbox-item">
                                 <input type="radio" id="{option_id}" name="{name}" value="{option.lower().replace(' ', '_')}" required>
                                 <label for="{option_id}">{option}</label>
                             </div>
-        """
+        """)
     
-    html += """
+    out.write("""
                         </div>
                     </div>
-    """
-    return html
+    """)
 
-def generate_text_area(question, name, required=True):
-    """Generar área de texto"""
+def generate_radio_question(question, name, options):
+    """Generar pregunta de opción múltiple"""
+    buffer = io.StringIO()
+    write_radio_question(buffer, question, name, options)
+    return buffer.getvalue()
+
+def write_text_area(out, question, name, required=True):
+    """Escribir área de texto"""
     required_attr = "required" if required else ""
-    html = f"""
+    out.write(f"""
                     <div class="form-group">
                         <label for="{name}">{question}</label>
                         <textarea id="{name}" name="{name}" class="text-area" {required_attr}></textarea>
                     </div>
-    """
-    return html
+    """)
 
-def main():
-    """Función principal"""
-    print("🚀 Generando Cuestionario Digital Likert HTML...")
-    
-    # Definir todas las preguntas por sección
-    preguntas = {
-        'facilidad': [
-            'El sistema es fácil de usar',
-            'La interfaz es intuitiva y clara',
-            'Es fácil navegar por el sistema',
-            'Los menús son fáciles de encontrar',
-            'Las funciones están bien organizadas'
-        ],
-        'diseno': [
-            'El diseño visual es atractivo',
-            'Los colores son apropiados',
-            'Los textos son legibles',
-            'Los botones son fáciles de identificar',
-            'El diseño es consistente en todas las páginas'
-        ],
-        'navegacion': [
-            'Es fácil encontrar lo que busco',
-            'La estructura del menú es lógica',
-            'Es fácil regresar a páginas anteriores',
-            'Los enlaces funcionan correctamente',
-            'El sistema tiene un buen flujo de trabajo'
-        ],
-        'velocidad': [
-            'El sistema carga rápidamente',
-            'Las páginas se abren sin demoras',
-            'Las búsquedas son rápidas',
-            'Los reportes se generan rápidamente',
-            'El sistema responde bien a mis acciones'
-        ],
-        'productividad': [
-            'Puedo completar mis tareas rápidamente',
-            'El sistema me ayuda a ser más productivo',
-            'Puedo realizar múltiples tareas simultáneamente',
-            'El sistema me ahorra tiempo',
-            'Puedo trabajar de manera eficiente'
-        ],
-        'funcionalidades': [
-            'La búsqueda de productos es eficiente',
-            'El proceso de compra es rápido',
-            'La gestión de inventario es eficaz',
-            'Los reportes son útiles y completos',
-            'Las notificaciones son oportunas'
-        ],
-        'satisfaccion': [
-            'Estoy satisfecho con el sistema en general',
-            'El sistema cumple con mis expectativas',
-            'Recomendaría el sistema a otros',
-            'El sistema mejora mi experiencia de trabajo',
-            'Estoy contento con la calidad del sistema'
-        ],
-        'experiencia': [
-            'El sistema es agradable de usar',
-            'Me siento cómodo usando el sistema',
-            'El sistema me da confianza',
-            'Me siento apoyado por el sistema',
-            'El sistema es confiable'
-        ],
-        'valor': [
-            'El sistema aporta valor a mi trabajo',
-            'Las funcionalidades son útiles',
-            'El sistema resuelve mis necesidades',
-            'El sistema es indispensable para mi trabajo',
-            'El sistema supera a otros sistemas similares'
-        ],
-        'productos': [
-            'Es fácil buscar productos',
-            'Los filtros funcionan bien',
-            'La información de productos es clara',
-            'Es fácil agregar productos al carrito',
-            'La gestión de categorías es eficiente'
-        ],
-        'compra': [
-            'El carrito de compras es fácil de usar',
-            'El proceso de checkout es claro',
-            'Los formularios son fáciles de llenar',
-            'Las opciones de pago son claras',
-            'Las confirmaciones son útiles'
-        ],
-        'inventario': [
-            'Es fácil crear nuevos productos',
-            'La actualización de stock es sencilla',
-            'Las alertas de reposición son útiles',
-            'Los reportes de inventario son completos',
-            'La trazabilidad de lotes es efectiva'
-        ],
-        'reportes': [
-            'Es fácil generar reportes',
-            'Los filtros de reportes son útiles',
-            'La exportación de datos funciona bien',
-            'Los gráficos son claros y útiles',
-            'La información de auditoría es completa'
-        ],
-        'seguridad': [
-            'Me siento seguro usando el sistema',
-            'El sistema protege mi información',
-            'Los controles de acceso son adecuados',
-            'El sistema es seguro para transacciones',
-            'Confío en la seguridad del sistema'
-        ],
-        'confiabilidad': [
-            'El sistema funciona de manera consistente',
-            'Rara vez experimento errores',
-            'El sistema está disponible cuando lo necesito',
-            'Los datos se guardan correctamente',
-            'El sistema es estable y confiable'
-        ],
-        'responsivo': [
-            'El sistema funciona bien en mi dispositivo',
-            'La interfaz se adapta bien a diferentes tamaños',
-            'Es fácil usar el sistema en móvil',
-            'Los elementos son fáciles de tocar',
-            'El sistema es accesible desde cualquier lugar'
-        ],
-        'accesibilidad': [
-            'El sistema es fácil de usar para personas con discapacidades',
-            'Los textos tienen buen contraste',
-            'El sistema es compatible con lectores de pantalla',
-            'Los elementos son fáciles de identificar',
-            'El sistema es inclusivo'
-        ],
-        'problemas': [
-            'He experimentado errores en el sistema',
-            'El sistema a veces es lento',
-            'Algunas funciones no funcionan como esperaba',
-            'He tenido problemas de conectividad',
-            'El sistema a veces se cuelga'
-        ],
-        'mejoras': [
-            'Necesito más funcionalidades',
-            'El sistema necesita mejoras en la interfaz',
-            'Necesito mejor rendimiento',
-            'El sistema necesita mejor documentación',
-            'Necesito mejor soporte técnico'
-        ],
-        'impacto': [
-            'El sistema me ayuda a ser más productivo',
-            'El sistema mejora la calidad de mi trabajo',
-            'El sistema me ahorra tiempo',
-            'El sistema reduce errores en mi trabajo',
-            'El sistema mejora la comunicación'
-        ],
-        'objetivos': [
-            'El sistema cumple con los objetivos del negocio',
-            'El sistema es rentable para la organización',
-            'El sistema mejora la satisfacción del cliente',
-            'El sistema reduce costos operativos',
-            'El sistema mejora la competitividad'
-        ]
-    }
-    
-    # Generar HTML completo
-    html_content = f"""<!DOCTYPE html>
+def generate_text_area(question, name, required=True):
+    """Generar área de texto"""
+    buffer = io.StringIO()
+    write_text_area(buffer, question, name, required)
+    return buffer.getvalue()
+
+# Servicio local de recepción de respuestas (ver servicio_respuestas.py)
+ENDPOINT_RESPUESTAS = 'http://localhost:8765/respuestas'
+
+# Fragmentos fijos de la página
+HTML_ENCABEZADO = """<!DOCTYPE html>
 <html lang="es">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Cuestionario de Evaluación LogicQP - Escala Likert</title>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             line-height: 1.6;
             color: #333;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 20px;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1000px;
             margin: 0 auto;
             background: white;
             border-radius: 15px;
             box-shadow: 0 20px 40px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #2c3e50 0%, #3498db 100%);
             color: white;
             padding: 30px;
             text-align: center;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 2.5em;
             margin-bottom: 10px;
-        }}
+        }
         
-        .header p {{
+        .header p {
             font-size: 1.2em;
             opacity: 0.9;
-        }}
+        }
         
-        .form-container {{
+        .form-container {
             padding: 40px;
-        }}
+        }
         
-        .section {{
+        .section {
             margin-bottom: 40px;
             padding: 30px;
             background: #f8f9fa;
             border-radius: 10px;
             border-left: 5px solid #3498db;
-        }}
+        }
         
-        .section h2 {{
+        .section h2 {
             color: #2c3e50;
             margin-bottom: 20px;
             font-size: 1.8em;
-        }}
+        }
         
-        .section h3 {{
+        .section h3 {
             color: #34495e;
             margin: 25px 0 15px 0;
             font-size: 1.4em;
-        }}
+        }
         
-        .likert-table {{
+        .likert-table {
             width: 100%;
             border-collapse: collapse;
             margin: 20px 0;
@@ -322,98 +194,98 @@ def main():
             border-radius: 8px;
             overflow: hidden;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
+        }
         
-        .likert-table th {{
+        .likert-table th {
             background: #34495e;
             color: white;
             padding: 15px;
             text-align: center;
             font-weight: bold;
-        }}
+        }
         
-        .likert-table td {{
+        .likert-table td {
             padding: 15px;
             border-bottom: 1px solid #ecf0f1;
             vertical-align: middle;
-        }}
+        }
         
-        .likert-table tr:nth-child(even) {{
+        .likert-table tr:nth-child(even) {
             background: #f8f9fa;
-        }}
+        }
         
-        .question-text {{
+        .question-text {
             font-weight: 500;
             color: #2c3e50;
-        }}
+        }
         
-        .likert-options {{
+        .likert-options {
             text-align: center;
-        }}
+        }
         
-        .likert-options input[type="radio"] {{
+        .likert-options input[type="radio"] {
             transform: scale(1.5);
             margin: 0 8px;
             cursor: pointer;
-        }}
+        }
         
-        .likert-options label {{
+        .likert-options label {
             display: inline-block;
             margin: 0 5px;
             cursor: pointer;
             font-size: 0.9em;
             color: #7f8c8d;
-        }}
+        }
         
-        .form-group {{
+        .form-group {
             margin-bottom: 20px;
-        }}
+        }
         
-        .form-group label {{
+        .form-group label {
             display: block;
             margin-bottom: 8px;
             font-weight: 600;
             color: #2c3e50;
-        }}
+        }
         
-        .form-group input, .form-group select, .form-group textarea {{
+        .form-group input, .form-group select, .form-group textarea {
             width: 100%;
             padding: 12px;
             border: 2px solid #ecf0f1;
             border-radius: 8px;
             font-size: 16px;
             transition: border-color 0.3s;
-        }}
+        }
         
-        .form-group input:focus, .form-group select:focus, .form-group textarea:focus {{
+        .form-group input:focus, .form-group select:focus, .form-group textarea:focus {
             outline: none;
             border-color: #3498db;
-        }}
+        }
         
-        .checkbox-group {{
+        .checkbox-group {
             display: flex;
             flex-wrap: wrap;
             gap: 15px;
             margin-top: 10px;
-        }}
+        }
         
-        .checkbox-item {{
+        .checkbox-item {
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
         
-        .checkbox-item input[type="checkbox"], .checkbox-item input[type="radio"] {{
+        .checkbox-item input[type="checkbox"], .checkbox-item input[type="radio"] {
             transform: scale(1.2);
             cursor: pointer;
-        }}
+        }
         
-        .text-area {{
+        .text-area {
             min-height: 100px;
             resize: vertical;
-        }}
+        }
         
-        .submit-btn {{
+        .submit-btn {
             background: linear-gradient(135deg, #27ae60 0%, #2ecc71 100%);
             color: white;
             padding: 15px 40px;
@@ -425,66 +297,66 @@ def main():
             transition: transform 0.3s;
             margin: 30px auto;
             display: block;
-        }}
+        }
         
-        .submit-btn:hover {{
+        .submit-btn:hover {
             transform: translateY(-2px);
             box-shadow: 0 5px 15px rgba(46, 204, 113, 0.4);
-        }}
+        }
         
-        .progress-bar {{
+        .progress-bar {
             width: 100%;
             height: 8px;
             background: #ecf0f1;
             border-radius: 4px;
             margin-bottom: 30px;
             overflow: hidden;
-        }}
+        }
         
-        .progress-fill {{
+        .progress-fill {
             height: 100%;
             background: linear-gradient(90deg, #3498db, #2ecc71);
             width: 0%;
             transition: width 0.3s;
-        }}
+        }
         
-        .required {{
+        .required {
             color: #e74c3c;
-        }}
+        }
         
-        .instructions {{
+        .instructions {
             background: #e8f4fd;
             border: 1px solid #3498db;
             border-radius: 8px;
             padding: 20px;
             margin-bottom: 30px;
-        }}
+        }
         
-        .instructions h3 {{
+        .instructions h3 {
             color: #2980b9;
             margin-bottom: 15px;
-        }}
+        }
         
-        .scale-info {{
+        .scale-info {
             background: #fff3cd;
             border: 1px solid #ffeaa7;
             border-radius: 8px;
             padding: 15px;
             margin: 20px 0;
-        }}
+        }
         
-        .scale-info h4 {{
+        .scale-info h4 {
             color: #856404;
             margin-bottom: 10px;
-        }}
+        }
         
-        .scale-item {{
+        .scale-item {
             display: flex;
             justify-content: space-between;
             margin: 5px 0;
-        }}
+        }
         
-        .section-counter {{
+        .section-counter {
             background: #3498db;
             color: white;
             padding: 5px 15px;
@@ -493,34 +365,34 @@ def main():
             font-weight: bold;
             display: inline-block;
             margin-bottom: 15px;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .container {{
+        @media (max-width: 768px) {
+            .container {
                 margin: 10px;
                 border-radius: 10px;
-            }}
+            }
             
-            .form-container {{
+            .form-container {
                 padding: 20px;
-            }}
+            }
             
-            .section {{
+            .section {
                 padding: 20px;
-            }}
+            }
             
-            .likert-table {{
+            .likert-table {
                 font-size: 0.9em;
-            }}
+            }
             
-            .likert-table th, .likert-table td {{
+            .likert-table th, .likert-table td {
                 padding: 10px 5px;
-            }}
+            }
             
-            .checkbox-group {{
+            .checkbox-group {
                 flex-direction: column;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
@@ -648,86 +520,16 @@ def main():
                     </div>
                 </div>
 """
-    
-    # Agregar todas las secciones de preguntas
-    secciones = [
-        ('🔍 SECCIÓN 1: USABILIDAD', [
-            ('1.1 Facilidad de Uso General', 'facilidad'),
-            ('1.2 Diseño de la Interfaz', 'diseno'),
-            ('1.3 Navegación y Estructura', 'navegacion')
-        ]),
-        ('⚡ SECCIÓN 2: EFICIENCIA', [
-            ('2.1 Velocidad y Rendimiento', 'velocidad'),
-            ('2.2 Productividad', 'productividad'),
-            ('2.3 Funcionalidades Específicas', 'funcionalidades')
-        ]),
-        ('😊 SECCIÓN 3: SATISFACCIÓN', [
-            ('3.1 Satisfacción General', 'satisfaccion'),
-            ('3.2 Experiencia de Usuario', 'experiencia'),
-            ('3.3 Valor y Utilidad', 'valor')
-        ]),
-        ('🔧 SECCIÓN 4: FUNCIONALIDADES ESPECÍFICAS', [
-            ('4.1 Gestión de Productos', 'productos'),
-            ('4.2 Proceso de Compra', 'compra'),
-            ('4.3 Gestión de Inventario', 'inventario'),
-            ('4.4 Reportes y Auditoría', 'reportes')
-        ]),
-        ('🛡️ SECCIÓN 5: SEGURIDAD Y CONFIABILIDAD', [
-            ('5.1 Seguridad', 'seguridad'),
-            ('5.2 Confiabilidad', 'confiabilidad')
-        ]),
-        ('📱 SECCIÓN 6: RESPONSIVIDAD Y ACCESIBILIDAD', [
-            ('6.1 Diseño Responsivo', 'responsivo'),
-            ('6.2 Accesibilidad', 'accesibilidad')
-        ]),
-        ('🚨 SECCIÓN 7: PROBLEMAS Y MEJORAS', [
-            ('7.1 Problemas Encontrados', 'problemas'),
-            ('7.2 Necesidades de Mejora', 'mejoras')
-        ]),
-        ('🎯 SECCIÓN 8: OBJETIVOS DE NEGOCIO', [
-            ('8.1 Impacto en el Trabajo', 'impacto'),
-            ('8.2 Cumplimiento de Objetivos', 'objetivos')
-        ])
-    ]
-    
-    section_counter = 1
-    for section_title, subsections in secciones:
-        html_content += f"""
-                <div class="section">
-                    <div class="section-counter">Sección {section_counter}</div>
-                    <h2>{section_title}</h2>
-"""
-        
-        for subsection_title, question_key in subsections:
-            html_content += generate_likert_table(preguntas[question_key], subsection_title, question_key)
-        
-        html_content += """
-                </div>
-"""
-        section_counter += 1
-    
-    # Agregar sección de comentarios
-    html_content += """
+
+HTML_COMENTARIOS = """
                 <div class="section">
                     <div class="section-counter">Sección 9</div>
                     <h2>💬 COMENTARIOS Y SUGERENCIAS</h2>
                     
                     <h3>8.1 Comentarios Libres</h3>
 """
-    
-    comentarios = [
-        ('¿Qué es lo que más le gusta del sistema LogicQP?', 'me_gusta'),
-        ('¿Qué es lo que menos le gusta del sistema?', 'no_gusta'),
-        ('¿Qué funcionalidades le gustaría que se agreguen?', 'funcionalidades_nuevas'),
-        ('¿Qué mejoras sugiere para el sistema?', 'mejoras_sugeridas'),
-        ('¿Alguna otra observación o comentario?', 'otras_observaciones')
-    ]
-    
-    for pregunta, name in comentarios:
-        html_content += generate_text_area(pregunta, name, required=False)
-    
-    # Agregar evaluación general
-    html_content += """
+
+HTML_EVALUACION_GENERAL = """
                 </div>
                 
                 <div class="section">
@@ -816,9 +618,8 @@ def main():
                     </div>
                 </div>
 """
-    
-    # Cerrar el formulario y agregar JavaScript
-    html_content += """
+
+HTML_FIN_FORMULARIO = """
                 <!-- Botón de envío -->
                 <button type="submit" class="submit-btn">📤 Enviar Encuesta</button>
             </form>
@@ -826,29 +627,104 @@ def main():
     </div>
     
     <script>
-        // Función para actualizar la barra de progreso
+"""
+
+JS_PROGRESO = """        // Progreso incremental: estado respondido/no respondido por grupo de pregunta
+        const progreso = { respondidas: 0, total: 0, grupos: new Map(), pendiente: false };
+        
+        function campoRespondido(element) {
+            if (element.type === 'radio' || element.type === 'checkbox') {
+                return element.checked;
+            }
+            return element.value.trim() !== '';
+        }
+        
+        function renderProgress() {
+            progreso.pendiente = false;
+            const porcentaje = progreso.total > 0 ? (progreso.respondidas / progreso.total) * 100 : 0;
+            document.getElementById('progressFill').style.width = porcentaje + '%';
+        }
+        
+        function scheduleProgress() {
+            if (!progreso.pendiente) {
+                progreso.pendiente = true;
+                requestAnimationFrame(renderProgress);
+            }
+        }
+        
+        // Recalcular todos los grupos (carga inicial y restauración de respuestas)
         function updateProgress() {
             const form = document.getElementById('likertForm');
-            const inputs = form.querySelectorAll('input[type="radio"]:checked, input[type="text"], input[type="email"], select, textarea');
-            const totalInputs = form.querySelectorAll('input[type="radio"], input[type="text"], input[type="email"], select, textarea').length;
-            const progress = (inputs.length / totalInputs) * 100;
-            document.getElementById('progressFill').style.width = progress + '%';
+            progreso.grupos.clear();
+            for (const element of form.elements) {
+                if (!element.name || element.type === 'submit') continue;
+                const respondido = campoRespondido(element);
+                progreso.grupos.set(element.name, progreso.grupos.get(element.name) || respondido);
+            }
+            progreso.total = progreso.grupos.size;
+            progreso.respondidas = 0;
+            progreso.grupos.forEach(respondido => { if (respondido) progreso.respondidas++; });
+            renderProgress();
         }
         
-        // Agregar event listeners para actualizar el progreso
+        // Actualizar solo el grupo del campo modificado
+        function onFieldEvent(event) {
+            const element = event.target;
+            if (!progreso.grupos.has(element.name)) return;
+            let respondido = campoRespondido(element);
+            if (element.type === 'radio' && !respondido) return;
+            if (element.type === 'checkbox') {
+                respondido = element.form.querySelector(`input[name="${element.name}"]:checked`) !== null;
+            }
+            if (progreso.grupos.get(element.name) !== respondido) {
+                progreso.grupos.set(element.name, respondido);
+                progreso.respondidas += respondido ? 1 : -1;
+                scheduleProgress();
+            }
+        }
+        
+        // Un único listener delegado en el formulario
         document.addEventListener('DOMContentLoaded', function() {
             const form = document.getElementById('likertForm');
-            const inputs = form.querySelectorAll('input, select, textarea');
-            
-            inputs.forEach(input => {
-                input.addEventListener('change', updateProgress);
-                input.addEventListener('input', updateProgress);
-            });
-            
+            form.addEventListener('change', onFieldEvent);
+            form.addEventListener('input', onFieldEvent);
             updateProgress();
         });
         
-        // Función para validar y enviar el formulario
+"""
+
+JS_TIEMPOS = """        // Tiempos de llenado por sección (control de calidad): primera y última interacción
+        const tiempos = { inicio: performance.now(), secciones: new Map() };
+        
+        function registrarTiempo(event) {
+            const seccion = event.target.closest('.section');
+            if (!seccion) return;
+            const ahora = performance.now();
+            const tramo = tiempos.secciones.get(seccion);
+            if (tramo) {
+                tramo[1] = ahora;
+            } else {
+                tiempos.secciones.set(seccion, [ahora, ahora]);
+            }
+        }
+        
+        // Milisegundos desde la carga y, por sección (en orden del formulario), entre su primera y última respuesta
+        function resumenTiempos() {
+            const resumen = { total_ms: Math.round(performance.now() - tiempos.inicio), secciones: {} };
+            document.querySelectorAll('#likertForm .section').forEach((seccion, indice) => {
+                const tramo = tiempos.secciones.get(seccion);
+                if (tramo) resumen.secciones[indice] = Math.round(tramo[1] - tramo[0]);
+            });
+            return resumen;
+        }
+        
+        document.addEventListener('DOMContentLoaded', function() {
+            document.getElementById('likertForm').addEventListener('change', registrarTiempo);
+        });
+        
+"""
+
+JS_ENVIO = """        // Función para validar y enviar el formulario
         function submitForm(event) {
             event.preventDefault();
             
@@ -891,87 +767,39 @@ def main():
             // Calcular puntuaciones por sección
             const scores = calculateScores(data);
             data.scores = scores;
+            data.tiempos = resumenTiempos();
             
             // Mostrar resumen de puntuaciones
             showScoreSummary(scores);
             
-            // Simular envío (aquí se conectaría con el backend)
-            console.log('Datos de la encuesta:', data);
-            
-            // Mostrar mensaje de confirmación
-            alert('¡Gracias por completar la encuesta! Sus respuestas han sido enviadas correctamente.');
-            
-            return false;
-        }
-        
-        // Función para calcular puntuaciones
-        function calculateScores(data) {
-            const scores = {
-                usabilidad: 0,
-                eficiencia: 0,
-                satisfaccion: 0,
-                total: 0
-            };
-            
-            // Calcular usabilidad (facilidad + diseno + navegacion)
-            const usabilidadKeys = ['facilidad', 'diseno', 'navegacion'];
-            let usabilidadSum = 0;
-            let usabilidadCount = 0;
-            
-            usabilidadKeys.forEach(key => {
-                for (let i = 1; i <= 5; i++) {
-                    const value = data[`${key}_${i}`];
-                    if (value) {
-                        usabilidadSum += parseInt(value);
-                        usabilidadCount++;
-                    }
-                }
-            });
-            
-            scores.usabilidad = usabilidadCount > 0 ? (usabilidadSum / usabilidadCount).toFixed(2) : 0;
-            
-            // Calcular eficiencia (velocidad + productividad + funcionalidades)
-            const eficienciaKeys = ['velocidad', 'productividad', 'funcionalidades'];
-            let eficienciaSum = 0;
-            let eficienciaCount = 0;
-            
-            eficienciaKeys.forEach(key => {
-                for (let i = 1; i <= 5; i++) {
-                    const value = data[`${key}_${i}`];
-                    if (value) {
-                        eficienciaSum += parseInt(value);
-                        eficienciaCount++;
-                    }
-                }
-            });
-            
-            scores.eficiencia = eficienciaCount > 0 ? (eficienciaSum / eficienciaCount).toFixed(2) : 0;
-            
-            // Calcular satisfacción (satisfaccion + experiencia + valor)
-            const satisfaccionKeys = ['satisfaccion', 'experiencia', 'valor'];
-            let satisfaccionSum = 0;
-            let satisfaccionCount = 0;
+            if (!ENDPOINT_RESPUESTAS) {
+                // Sin servicio configurado: solo registrar los datos
+                console.log('Datos de la encuesta:', data);
+                alert('¡Gracias por completar la encuesta! Sus respuestas han sido enviadas correctamente.');
+                return false;
+            }
             
-            satisfaccionKeys.forEach(key => {
-                for (let i = 1; i <= 5; i++) {
-                    const value = data[`${key}_${i}`];
-                    if (value) {
-                        satisfaccionSum += parseInt(value);
-                        satisfaccionCount++;
-                    }
+            // Enviar al servicio de respuestas (servicio_respuestas.py)
+            fetch(ENDPOINT_RESPUESTAS, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(data)
+            }).then(response => {
+                if (!response.ok) {
+                    return response.json().then(body => { throw new Error(body.error || response.statusText); });
                 }
+                alert('¡Gracias por completar la encuesta! Sus respuestas han sido enviadas correctamente.');
+            }).catch(error => {
+                console.error('Error al enviar la encuesta:', error);
+                alert('No se pudo enviar la encuesta. Sus respuestas siguen guardadas en este equipo; intente nuevamente.');
             });
             
-            scores.satisfaccion = satisfaccionCount > 0 ? (satisfaccionSum / satisfaccionCount).toFixed(2) : 0;
-            
-            // Calcular total
-            const totalSum = parseFloat(scores.usabilidad) + parseFloat(scores.eficiencia) + parseFloat(scores.satisfaccion);
-            scores.total = (totalSum / 3).toFixed(2);
-            
-            return scores;
+            return false;
         }
         
-        // Función para mostrar resumen de puntuaciones
+"""
+
+JS_RESUMEN_PUNTUACIONES = """        // Función para mostrar resumen de puntuaciones
         function showScoreSummary(scores) {
             const summary = `
                 📊 RESUMEN DE PUNTUACIONES:
@@ -991,7 +819,9 @@ def main():
             console.log(summary);
         }
         
-        // Función para guardar respuestas localmente (opcional)
+"""
+
+JS_AUTOGUARDADO_LOCALSTORAGE = """        // Función para guardar respuestas localmente (opcional)
         function saveToLocalStorage() {
             const formData = new FormData(document.getElementById('likertForm'));
             const data = {};
@@ -1025,20 +855,225 @@ def main():
                 updateProgress();
             }
         });
-    </script>
+"""
+
+JS_AUTOGUARDADO_INDEXEDDB = """        // Autoguardado incremental: solo los campos modificados, con debounce, en IndexedDB
+        const AUTOGUARDADO_DB = 'likertSurvey';
+        const AUTOGUARDADO_STORE = 'respuestas';
+        const AUTOGUARDADO_DEMORA_MS = 800;
+        const autoguardado = { db: null, cambios: new Map(), temporizador: null };
+        
+        function abrirAutoguardado() {
+            return new Promise((resolve, reject) => {
+                const request = indexedDB.open(AUTOGUARDADO_DB, 1);
+                request.onupgradeneeded = () => request.result.createObjectStore(AUTOGUARDADO_STORE);
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => reject(request.error);
+            });
+        }
+        
+        // Escribir en una sola transacción los campos cambiados desde el último guardado
+        function guardarCambios() {
+            clearTimeout(autoguardado.temporizador);
+            if (!autoguardado.db || autoguardado.cambios.size === 0) return;
+            const cambios = autoguardado.cambios;
+            autoguardado.cambios = new Map();
+            const store = autoguardado.db.transaction(AUTOGUARDADO_STORE, 'readwrite').objectStore(AUTOGUARDADO_STORE);
+            cambios.forEach((valor, nombre) => store.put(valor, nombre));
+        }
+        
+        function registrarCambio(event) {
+            const element = event.target;
+            if (!element.name || (element.type === 'radio' && !element.checked)) return;
+            autoguardado.cambios.set(element.name, element.value);
+            clearTimeout(autoguardado.temporizador);
+            autoguardado.temporizador = setTimeout(guardarCambios, AUTOGUARDADO_DEMORA_MS);
+        }
+        
+        // Restaurar con un solo recorrido de los campos del formulario
+        function restaurarRespuestas(form, guardadas) {
+            guardadas.forEach((valor, nombre) => {
+                if (autoguardado.cambios.has(nombre)) return;
+                const campo = form.elements[nombre];
+                if (!campo) return;
+                if (campo instanceof RadioNodeList) {
+                    campo.value = valor;
+                } else if (campo.type === 'checkbox' || campo.type === 'radio') {
+                    campo.checked = campo.value === valor;
+                } else {
+                    campo.value = valor;
+                }
+            });
+        }
+        
+        document.addEventListener('DOMContentLoaded', function() {
+            const form = document.getElementById('likertForm');
+            if (!window.indexedDB) {
+                console.warn('IndexedDB no disponible: autoguardado desactivado');
+                return;
+            }
+            form.addEventListener('change', registrarCambio);
+            form.addEventListener('input', registrarCambio);
+            document.addEventListener('visibilitychange', () => {
+                if (document.visibilityState === 'hidden') guardarCambios();
+            });
+            window.addEventListener('pagehide', guardarCambios);
+            
+            abrirAutoguardado().then(db => {
+                autoguardado.db = db;
+                const guardadas = new Map();
+                const cursor = db.transaction(AUTOGUARDADO_STORE, 'readonly').objectStore(AUTOGUARDADO_STORE).openCursor();
+                cursor.onsuccess = () => {
+                    const actual = cursor.result;
+                    if (actual) {
+                        guardadas.set(actual.key, actual.value);
+                        actual.continue();
+                        return;
+                    }
+                    if (guardadas.size > 0) {
+                        restaurarRespuestas(form, guardadas);
+                        updateProgress();
+                    }
+                    // Cambios hechos mientras se abría la base
+                    guardarCambios();
+                };
+            }).catch(error => console.warn('No se pudo abrir el autoguardado:', error));
+        });
+        
+"""
+
+# Modos de autoguardado disponibles en el HTML generado
+AUTOGUARDADO = {
+    'indexeddb': JS_AUTOGUARDADO_INDEXEDDB,
+    'localstorage': JS_AUTOGUARDADO_LOCALSTORAGE,
+}
+
+HTML_FIN = """    </script>
 </body>
 </html>"""
+
+def write_calculate_scores(out, esquema):
+    """Escribir calculateScores() a partir de los compuestos y la polaridad del esquema"""
+    compuestos = {
+        name: [item for key in grupos for item in esquema['items'][slice(*esquema['grupo_rango'][key])]]
+        for name, grupos in esquema['compuestos'].items()
+    }
+    invertidos = [item for item, polaridad in zip(esquema['items'], esquema['item_polaridad']) if polaridad < 0]
+    out.write(f"""        // Puntuaciones compuestas e ítems invertidos (generados desde esquema_cuestionario.py)
+        const COMPUESTOS = {json.dumps(compuestos)};
+        const ITEMS_INVERTIDOS = new Set({json.dumps(invertidos)});
+        
+        // Función para calcular puntuaciones
+        function calculateScores(data) {{
+            const scores = {{}};
+            let totalSum = 0;
+            
+            // Promedio de los ítems respondidos de cada compuesto
+            Object.entries(COMPUESTOS).forEach(([name, items]) => {{
+                let sum = 0;
+                let count = 0;
+                items.forEach(item => {{
+                    const value = data[item];
+                    if (value) {{
+                        // Los ítems redactados en negativo se invierten ({ESCALA_LIKERT[0]} <-> {ESCALA_LIKERT[-1]})
+                        sum += ITEMS_INVERTIDOS.has(item) ? {ESCALA_LIKERT[0] + ESCALA_LIKERT[-1]} - parseInt(value) : parseInt(value);
+                        count++;
+                    }}
+                }});
+                scores[name] = count > 0 ? (sum / count).toFixed(2) : 0;
+                totalSum += parseFloat(scores[name]);
+            }});
+            
+            // Calcular total
+            scores.total = (totalSum / Object.keys(COMPUESTOS).length).toFixed(2);
+            
+            return scores;
+        }}
+        
+""")
+
+def generate_calculate_scores(esquema):
+    """Generar calculateScores() como cadena"""
+    buffer = io.StringIO()
+    write_calculate_scores(buffer, esquema)
+    return buffer.getvalue()
+
+def write_cuestionario_html(out, preguntas=None, secciones=None, comentarios=None, autoguardado='indexeddb',
+                            endpoint_envio=ENDPOINT_RESPUESTAS):
+    """Escribir el cuestionario completo sección por sección en `out`"""
+    if autoguardado not in AUTOGUARDADO:
+        raise ValueError(f"Modo de autoguardado desconocido: {autoguardado} (opciones: {', '.join(AUTOGUARDADO)})")
+    esquema = cargar_esquema()
+    preguntas = esquema['preguntas'] if preguntas is None else preguntas
+    secciones = esquema['secciones'] if secciones is None else secciones
+    comentarios = esquema['comentarios'] if comentarios is None else comentarios
+    
+    out.write(HTML_ENCABEZADO)
+    
+    # Agregar todas las secciones de preguntas
+    section_counter = 1
+    for section_title, subsections in secciones:
+        out.write(f"""
+                <div class="section">
+                    <div class="section-counter">Sección {section_counter}</div>
+                    <h2>{section_title}</h2>
+""")
+        
+        for subsection_title, question_key in subsections:
+            write_likert_table(out, preguntas[question_key], subsection_title, question_key)
+        
+        out.write("""
+                </div>
+""")
+        section_counter += 1
+    
+    # Agregar sección de comentarios
+    out.write(HTML_COMENTARIOS)
+    
+    for pregunta, name in comentarios:
+        write_text_area(out, pregunta, name, required=False)
+    
+    # Agregar evaluación general, cerrar el formulario y agregar JavaScript
+    out.write(HTML_EVALUACION_GENERAL)
+    out.write(HTML_FIN_FORMULARIO)
+    out.write(JS_PROGRESO)
+    out.write(JS_TIEMPOS)
+    out.write(f"""        // Servicio que recibe las respuestas (null: solo registrar en consola)
+        const ENDPOINT_RESPUESTAS = {json.dumps(endpoint_envio)};
+        
+""")
+    out.write(JS_ENVIO)
+    write_calculate_scores(out, esquema)
+    out.write(JS_RESUMEN_PUNTUACIONES)
+    out.write(AUTOGUARDADO[autoguardado])
+    out.write(HTML_FIN)
+
+def render_cuestionario_html(preguntas=None, secciones=None, comentarios=None, autoguardado='indexeddb',
+                             endpoint_envio=ENDPOINT_RESPUESTAS):
+    """Generar el cuestionario completo como cadena"""
+    buffer = io.StringIO()
+    write_cuestionario_html(buffer, preguntas, secciones, comentarios, autoguardado, endpoint_envio)
+    return buffer.getvalue()
+
+def main(output_file='CUESTIONARIO_DIGITAL_LIKERT_LogicQP.html', autoguardado='indexeddb',
+         endpoint_envio=ENDPOINT_RESPUESTAS):
+    """Función principal"""
+    print("🚀 Generando Cuestionario Digital Likert HTML...")
     
-    # Guardar archivo
-    with open('CUESTIONARIO_DIGITAL_LIKERT_LogicQP.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Escribir el archivo a medida que se genera cada sección
+    with open(output_file, 'w', encoding='utf-8') as f:
+        write_cuestionario_html(f, autoguardado=autoguardado, endpoint_envio=endpoint_envio)
     
-    print("✅ Cuestionario digital HTML creado exitosamente: CUESTIONARIO_DIGITAL_LIKERT_LogicQP.html")
+    print(f"✅ Cuestionario digital HTML creado exitosamente: {output_file}")
     print("📊 Total de secciones: 10")
     print("📝 Total de preguntas Likert: 100+")
     print("⏱️ Tiempo estimado de llenado: 15-20 minutos")
     print("📱 Diseño responsivo para móviles y tablets")
-    print("💾 Guardado automático cada 30 segundos")
+    if autoguardado == 'indexeddb':
+        print("💾 Guardado automático de cada cambio en IndexedDB")
+    else:
+        print("💾 Guardado automático cada 30 segundos")
+    print(f"📤 Envío de respuestas: {endpoint_envio or 'solo consola'}")
     print("📈 Cálculo automático de puntuaciones")
     print("🎯 Validación en tiempo real")
 
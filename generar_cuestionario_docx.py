@@ -5,63 +5,28 @@ Generador de Cuestionario de Encuesta Likert en formato Word
 Sistema LogicQP - Grupo 6 - Cel@g
 """
 
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.shared import OxmlElement, qn
-import os
+import argparse
 import sys
 
-def add_checkbox_style(doc):
-    """Agregar estilo para checkboxes"""
-    styles = doc.styles
-    checkbox_style = styles.add_style('Checkbox', 1)  # 1 = paragraph style
-    checkbox_style.font.name = 'Arial'
-    checkbox_style.font.size = Pt(11)
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+from esquema_cuestionario import cargar_esquema
+from plantilla_estilos import documento_base
+from tabla_likert_docx import agregar_tabla_likert
 
-def create_likert_table(doc, title, questions):
-    """Crear tabla de escala Likert"""
+def create_likert_table(doc, title, questions, headers=('1', '2', '3', '4', '5'), rows=None,
+                        question_width=4.0, column_widths=None):
+    """Crear tabla de escala Likert (con `rows`, una fila de textos por pregunta en lugar de casillas)"""
     doc.add_heading(title, level=3)
     
-    # Crear tabla
-    table = doc.add_table(rows=1, cols=6)
-    table.style = 'Table Grid'
-    table.alignment = WD_TABLE_ALIGNMENT.CENTER
-    
-    # Encabezados
-    hdr_cells = table.rows[0].cells
-    hdr_cells[0].text = 'Pregunta'
-    hdr_cells[1].text = '1'
-    hdr_cells[2].text = '2'
-    hdr_cells[3].text = '3'
-    hdr_cells[4].text = '4'
-    hdr_cells[5].text = '5'
-    
-    # Estilo de encabezados
-    for cell in hdr_cells:
-        cell.paragraphs[0].runs[0].bold = True
-        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    # Agregar preguntas
-    for question in questions:
-        row_cells = table.add_row().cells
-        row_cells[0].text = question
-        row_cells[1].text = '☐'
-        row_cells[2].text = '☐'
-        row_cells[3].text = '☐'
-        row_cells[4].text = '☐'
-        row_cells[5].text = '☐'
-        
-        # Centrar checkboxes
-        for i in range(1, 6):
-            row_cells[i].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    # Ajustar ancho de columnas
-    for row in table.rows:
-        row.cells[0].width = Inches(4.0)  # Pregunta
-        for i in range(1, 6):
-            row.cells[i].width = Inches(0.5)  # Checkboxes
+    # Filas completas: pregunta y casillas (o los textos de `rows`)
+    if rows is None:
+        rows = [['☐'] * len(headers)] * len(questions)
+    table_rows = [[question, *values] for question, values in zip(questions, rows)]
+    
+    # Toda la tabla en una sola construcción XML, con los anchos de columna
+    widths = [question_width, *(column_widths or [0.5] * len(headers))]
+    return agregar_tabla_likert(doc, ['Pregunta', *headers], table_rows, widths)
 
 def create_simple_question(doc, question, options):
     """Crear pregunta simple con opciones"""
@@ -75,15 +40,18 @@ def create_text_area(doc, question, lines=3):
     for i in range(lines):
         doc.add_paragraph('_' * 50)
 
-def main():
-    """Función principal"""
-    print("🚀 Generando Cuestionario de Encuesta Likert en formato Word...")
-    
-    # Crear documento
-    doc = Document()
+def create_cuestionario_docx(encuestado=None, doc=None):
+    """Crear el documento del cuestionario; `encuestado` (nombre, rol, sucursal, id) prellena sus datos
+
+    `doc` permite escribir sobre otro documento base, p. ej. un EscritorDocx (escritor_docx.py).
+    """
+    # Preguntas compartidas con los generadores HTML y Google Forms
+    esquema = cargar_esquema()
+    preguntas = esquema['preguntas']
     
-    # Configurar estilos
-    add_checkbox_style(doc)
+    # Crear documento (con el estilo Checkbox de la plantilla compartida)
+    if doc is None:
+        doc = documento_base()
     
     # Título principal
     title = doc.add_heading('📊 CUESTIONARIO DE ENCUESTA LIKERT - SISTEMA LOGICQP', 0)
@@ -149,6 +117,13 @@ def main():
         'Fecha de la encuesta: _____________________',
         'Navegador utilizado: _____________________'
     ]
+    if encuestado is not None:
+        encuestado_data[:2] = [
+            f"Nombre: {encuestado['nombre']}",
+            f"Rol/Posición: {encuestado['rol']}",
+            f"Sucursal: {encuestado['sucursal']}",
+            f"ID de encuesta: {encuestado['id']}",
+        ]
     
     for data in encuestado_data:
         doc.add_paragraph(data)
@@ -169,34 +144,13 @@ def main():
     doc.add_heading('🔍 SECCIÓN 1: USABILIDAD', level=1)
     
     # 1.1 Facilidad de Uso General
-    preguntas_facilidad = [
-        'El sistema es fácil de usar',
-        'La interfaz es intuitiva y clara',
-        'Es fácil navegar por el sistema',
-        'Los menús son fáciles de encontrar',
-        'Las funciones están bien organizadas'
-    ]
-    create_likert_table(doc, '1.1 Facilidad de Uso General', preguntas_facilidad)
+    create_likert_table(doc, '1.1 Facilidad de Uso General', preguntas['facilidad'])
     
     # 1.2 Diseño de la Interfaz
-    preguntas_diseno = [
-        'El diseño visual es atractivo',
-        'Los colores son apropiados',
-        'Los textos son legibles',
-        'Los botones son fáciles de identificar',
-        'El diseño es consistente en todas las páginas'
-    ]
-    create_likert_table(doc, '1.2 Diseño de la Interfaz', preguntas_diseno)
+    create_likert_table(doc, '1.2 Diseño de la Interfaz', preguntas['diseno'])
     
     # 1.3 Navegación y Estructura
-    preguntas_navegacion = [
-        'Es fácil encontrar lo que busco',
-        'La estructura del menú es lógica',
-        'Es fácil regresar a páginas anteriores',
-        'Los enlaces funcionan correctamente',
-        'El sistema tiene un buen flujo de trabajo'
-    ]
-    create_likert_table(doc, '1.3 Navegación y Estructura', preguntas_navegacion)
+    create_likert_table(doc, '1.3 Navegación y Estructura', preguntas['navegacion'])
     
     doc.add_paragraph('─' * 80)
     
@@ -204,34 +158,13 @@ def main():
     doc.add_heading('⚡ SECCIÓN 2: EFICIENCIA', level=1)
     
     # 2.1 Velocidad y Rendimiento
-    preguntas_velocidad = [
-        'El sistema carga rápidamente',
-        'Las páginas se abren sin demoras',
-        'Las búsquedas son rápidas',
-        'Los reportes se generan rápidamente',
-        'El sistema responde bien a mis acciones'
-    ]
-    create_likert_table(doc, '2.1 Velocidad y Rendimiento', preguntas_velocidad)
+    create_likert_table(doc, '2.1 Velocidad y Rendimiento', preguntas['velocidad'])
     
     # 2.2 Productividad
-    preguntas_productividad = [
-        'Puedo completar mis tareas rápidamente',
-        'El sistema me ayuda a ser más productivo',
-        'Puedo realizar múltiples tareas simultáneamente',
-        'El sistema me ahorra tiempo',
-        'Puedo trabajar de manera eficiente'
-    ]
-    create_likert_table(doc, '2.2 Productividad', preguntas_productividad)
+    create_likert_table(doc, '2.2 Productividad', preguntas['productividad'])
     
     # 2.3 Funcionalidades Específicas
-    preguntas_funcionalidades = [
-        'La búsqueda de productos es eficiente',
-        'El proceso de compra es rápido',
-        'La gestión de inventario es eficaz',
-        'Los reportes son útiles y completos',
-        'Las notificaciones son oportunas'
-    ]
-    create_likert_table(doc, '2.3 Funcionalidades Específicas', preguntas_funcionalidades)
+    create_likert_table(doc, '2.3 Funcionalidades Específicas', preguntas['funcionalidades'])
     
     doc.add_paragraph('─' * 80)
     
@@ -239,34 +172,13 @@ def main():
     doc.add_heading('😊 SECCIÓN 3: SATISFACCIÓN', level=1)
     
     # 3.1 Satisfacción General
-    preguntas_satisfaccion = [
-        'Estoy satisfecho con el sistema en general',
-        'El sistema cumple con mis expectativas',
-        'Recomendaría el sistema a otros',
-        'El sistema mejora mi experiencia de trabajo',
-        'Estoy contento con la calidad del sistema'
-    ]
-    create_likert_table(doc, '3.1 Satisfacción General', preguntas_satisfaccion)
+    create_likert_table(doc, '3.1 Satisfacción General', preguntas['satisfaccion'])
     
     # 3.2 Experiencia de Usuario
-    preguntas_experiencia = [
-        'El sistema es agradable de usar',
-        'Me siento cómodo usando el sistema',
-        'El sistema me da confianza',
-        'Me siento apoyado por el sistema',
-        'El sistema es confiable'
-    ]
-    create_likert_table(doc, '3.2 Experiencia de Usuario', preguntas_experiencia)
+    create_likert_table(doc, '3.2 Experiencia de Usuario', preguntas['experiencia'])
     
     # 3.3 Valor y Utilidad
-    preguntas_valor = [
-        'El sistema aporta valor a mi trabajo',
-        'Las funcionalidades son útiles',
-        'El sistema resuelve mis necesidades',
-        'El sistema es indispensable para mi trabajo',
-        'El sistema supera a otros sistemas similares'
-    ]
-    create_likert_table(doc, '3.3 Valor y Utilidad', preguntas_valor)
+    create_likert_table(doc, '3.3 Valor y Utilidad', preguntas['valor'])
     
     doc.add_paragraph('─' * 80)
     
@@ -274,44 +186,16 @@ def main():
     doc.add_heading('🔧 SECCIÓN 4: FUNCIONALIDADES ESPECÍFICAS', level=1)
     
     # 4.1 Gestión de Productos
-    preguntas_productos = [
-        'Es fácil buscar productos',
-        'Los filtros funcionan bien',
-        'La información de productos es clara',
-        'Es fácil agregar productos al carrito',
-        'La gestión de categorías es eficiente'
-    ]
-    create_likert_table(doc, '4.1 Gestión de Productos', preguntas_productos)
+    create_likert_table(doc, '4.1 Gestión de Productos', preguntas['productos'])
     
     # 4.2 Proceso de Compra
-    preguntas_compra = [
-        'El carrito de compras es fácil de usar',
-        'El proceso de checkout es claro',
-        'Los formularios son fáciles de llenar',
-        'Las opciones de pago son claras',
-        'Las confirmaciones son útiles'
-    ]
-    create_likert_table(doc, '4.2 Proceso de Compra', preguntas_compra)
+    create_likert_table(doc, '4.2 Proceso de Compra', preguntas['compra'])
     
     # 4.3 Gestión de Inventario
-    preguntas_inventario = [
-        'Es fácil crear nuevos productos',
-        'La actualización de stock es sencilla',
-        'Las alertas de reposición son útiles',
-        'Los reportes de inventario son completos',
-        'La trazabilidad de lotes es efectiva'
-    ]
-    create_likert_table(doc, '4.3 Gestión de Inventario', preguntas_inventario)
+    create_likert_table(doc, '4.3 Gestión de Inventario', preguntas['inventario'])
     
     # 4.4 Reportes y Auditoría
-    preguntas_reportes = [
-        'Es fácil generar reportes',
-        'Los filtros de reportes son útiles',
-        'La exportación de datos funciona bien',
-        'Los gráficos son claros y útiles',
-        'La información de auditoría es completa'
-    ]
-    create_likert_table(doc, '4.4 Reportes y Auditoría', preguntas_reportes)
+    create_likert_table(doc, '4.4 Reportes y Auditoría', preguntas['reportes'])
     
     doc.add_paragraph('─' * 80)
     
@@ -319,24 +203,10 @@ def main():
     doc.add_heading('🛡️ SECCIÓN 5: SEGURIDAD Y CONFIABILIDAD', level=1)
     
     # 5.1 Seguridad
-    preguntas_seguridad = [
-        'Me siento seguro usando el sistema',
-        'El sistema protege mi información',
-        'Los controles de acceso son adecuados',
-        'El sistema es seguro para transacciones',
-        'Confío en la seguridad del sistema'
-    ]
-    create_likert_table(doc, '5.1 Seguridad', preguntas_seguridad)
+    create_likert_table(doc, '5.1 Seguridad', preguntas['seguridad'])
     
     # 5.2 Confiabilidad
-    preguntas_confiabilidad = [
-        'El sistema funciona de manera consistente',
-        'Rara vez experimento errores',
-        'El sistema está disponible cuando lo necesito',
-        'Los datos se guardan correctamente',
-        'El sistema es estable y confiable'
-    ]
-    create_likert_table(doc, '5.2 Confiabilidad', preguntas_confiabilidad)
+    create_likert_table(doc, '5.2 Confiabilidad', preguntas['confiabilidad'])
     
     doc.add_paragraph('─' * 80)
     
@@ -344,24 +214,10 @@ def main():
     doc.add_heading('📱 SECCIÓN 6: RESPONSIVIDAD Y ACCESIBILIDAD', level=1)
     
     # 6.1 Diseño Responsivo
-    preguntas_responsivo = [
-        'El sistema funciona bien en mi dispositivo',
-        'La interfaz se adapta bien a diferentes tamaños',
-        'Es fácil usar el sistema en móvil',
-        'Los elementos son fáciles de tocar',
-        'El sistema es accesible desde cualquier lugar'
-    ]
-    create_likert_table(doc, '6.1 Diseño Responsivo', preguntas_responsivo)
+    create_likert_table(doc, '6.1 Diseño Responsivo', preguntas['responsivo'])
     
     # 6.2 Accesibilidad
-    preguntas_accesibilidad = [
-        'El sistema es fácil de usar para personas con discapacidades',
-        'Los textos tienen buen contraste',
-        'El sistema es compatible con lectores de pantalla',
-        'Los elementos son fáciles de identificar',
-        'El sistema es inclusivo'
-    ]
-    create_likert_table(doc, '6.2 Accesibilidad', preguntas_accesibilidad)
+    create_likert_table(doc, '6.2 Accesibilidad', preguntas['accesibilidad'])
     
     doc.add_paragraph('─' * 80)
     
@@ -369,24 +225,10 @@ def main():
     doc.add_heading('🚨 SECCIÓN 7: PROBLEMAS Y MEJORAS', level=1)
     
     # 7.1 Problemas Encontrados
-    preguntas_problemas = [
-        'He experimentado errores en el sistema',
-        'El sistema a veces es lento',
-        'Algunas funciones no funcionan como esperaba',
-        'He tenido problemas de conectividad',
-        'El sistema a veces se cuelga'
-    ]
-    create_likert_table(doc, '7.1 Problemas Encontrados', preguntas_problemas)
+    create_likert_table(doc, '7.1 Problemas Encontrados', preguntas['problemas'])
     
     # 7.2 Necesidades de Mejora
-    preguntas_mejoras = [
-        'Necesito más funcionalidades',
-        'El sistema necesita mejoras en la interfaz',
-        'Necesito mejor rendimiento',
-        'El sistema necesita mejor documentación',
-        'Necesito mejor soporte técnico'
-    ]
-    create_likert_table(doc, '7.2 Necesidades de Mejora', preguntas_mejoras)
+    create_likert_table(doc, '7.2 Necesidades de Mejora', preguntas['mejoras'])
     
     doc.add_paragraph('─' * 80)
     
@@ -395,11 +237,8 @@ def main():
     
     doc.add_paragraph('8.1 Comentarios Libres', style='Heading 3')
     
-    create_text_area(doc, '¿Qué es lo que más le gusta del sistema LogicQP?')
-    create_text_area(doc, '¿Qué es lo que menos le gusta del sistema?')
-    create_text_area(doc, '¿Qué funcionalidades le gustaría que se agreguen?')
-    create_text_area(doc, '¿Qué mejoras sugiere para el sistema?')
-    create_text_area(doc, '¿Alguna otra observación o comentario?')
+    for pregunta, name in esquema['comentarios']:
+        create_text_area(doc, pregunta)
     
     doc.add_paragraph('─' * 80)
     
@@ -498,24 +337,10 @@ def main():
     doc.add_heading('🎯 SECCIÓN 11: OBJETIVOS DE NEGOCIO', level=1)
     
     # 11.1 Impacto en el Trabajo
-    preguntas_impacto = [
-        'El sistema me ayuda a ser más productivo',
-        'El sistema mejora la calidad de mi trabajo',
-        'El sistema me ahorra tiempo',
-        'El sistema reduce errores en mi trabajo',
-        'El sistema mejora la comunicación'
-    ]
-    create_likert_table(doc, '11.1 Impacto en el Trabajo', preguntas_impacto)
+    create_likert_table(doc, '11.1 Impacto en el Trabajo', preguntas['impacto'])
     
     # 11.2 Cumplimiento de Objetivos
-    preguntas_objetivos = [
-        'El sistema cumple con los objetivos del negocio',
-        'El sistema es rentable para la organización',
-        'El sistema mejora la satisfacción del cliente',
-        'El sistema reduce costos operativos',
-        'El sistema mejora la competitividad'
-    ]
-    create_likert_table(doc, '11.2 Cumplimiento de Objetivos', preguntas_objetivos)
+    create_likert_table(doc, '11.2 Cumplimiento de Objetivos', preguntas['objetivos'])
     
     doc.add_paragraph('─' * 80)
     
@@ -636,8 +461,23 @@ def main():
     doc.add_paragraph('© 2025 Grupo 6 - Cel@g. Todos los derechos reservados.')
     doc.add_paragraph('Este cuestionario es parte del proceso de evaluación continua del sistema LogicQP y contribuye al mejoramiento de la experiencia del usuario.')
     
+    return doc
+
+def main(argv=()):
+    """Función principal (`argv`: opciones de línea de comandos; construir_documentos.py no pasa ninguna)"""
+    parser = argparse.ArgumentParser(description='Cuestionario de Encuesta Likert en formato Word')
+    parser.add_argument('--flujo', action='store_true',
+                        help='Escribir el documento en disco a medida que se arma (escritor_docx.py)')
+    args = parser.parse_args(argv)
+    print("🚀 Generando Cuestionario de Encuesta Likert en formato Word...")
+    
     # Guardar documento
     output_file = 'CUESTIONARIO_ENCUESTA_LIKERT_LogicQP.docx'
+    if args.flujo:
+        from escritor_docx import EscritorDocx
+        doc = create_cuestionario_docx(doc=EscritorDocx(output_file))
+    else:
+        doc = create_cuestionario_docx()
     doc.save(output_file)
     
     print(f"✅ Cuestionario de encuesta Word creado exitosamente: {output_file}")
@@ -647,4 +487,4 @@ def main():
     print(f"📋 Incluye: Usabilidad, Eficiencia, Satisfacción, Funcionalidades, Seguridad, Accesibilidad")
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
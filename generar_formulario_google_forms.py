@@ -5,10 +5,22 @@ Generador de Formulario Google Forms para Cuestionario Likert
 Sistema LogicQP - Grupo 6 - Cel@g
 """
 
+from esquema_cuestionario import cargar_esquema
+
+def generate_scale_questions(questions, first_number):
+    """Generar la lista de preguntas de escala lineal numeradas"""
+    return '\n'.join(
+        f'- **Pregunta {number}:** {question} - Escala lineal (1-5)'
+        for number, question in enumerate(questions, first_number)
+    )
+
 def generate_google_forms_instructions():
     """Generar instrucciones para crear formulario en Google Forms"""
     
-    instructions = """# 📋 INSTRUCCIONES PARA CREAR FORMULARIO GOOGLE FORMS
+    # Preguntas compartidas con los cuestionarios HTML y DOCX
+    preguntas = cargar_esquema()['preguntas']
+    
+    instructions = f"""# 📋 INSTRUCCIONES PARA CREAR FORMULARIO GOOGLE FORMS
 
 ## 🎯 PASOS PARA CREAR EL FORMULARIO:
 
@@ -47,25 +59,13 @@ def generate_google_forms_instructions():
   - Móvil
 
 #### SECCIÓN 1: USABILIDAD
-- **Pregunta 7:** El sistema es fácil de usar - Escala lineal (1-5)
-- **Pregunta 8:** La interfaz es intuitiva y clara - Escala lineal (1-5)
-- **Pregunta 9:** Es fácil navegar por el sistema - Escala lineal (1-5)
-- **Pregunta 10:** Los menús son fáciles de encontrar - Escala lineal (1-5)
-- **Pregunta 11:** Las funciones están bien organizadas - Escala lineal (1-5)
+{generate_scale_questions(preguntas['facilidad'], 7)}
 
 #### SECCIÓN 2: EFICIENCIA
-- **Pregunta 12:** El sistema carga rápidamente - Escala lineal (1-5)
-- **Pregunta 13:** Las páginas se abren sin demoras - Escala lineal (1-5)
-- **Pregunta 14:** Las búsquedas son rápidas - Escala lineal (1-5)
-- **Pregunta 15:** Los reportes se generan rápidamente - Escala lineal (1-5)
-- **Pregunta 16:** El sistema responde bien a mis acciones - Escala lineal (1-5)
+{generate_scale_questions(preguntas['velocidad'], 12)}
 
 #### SECCIÓN 3: SATISFACCIÓN
-- **Pregunta 17:** Estoy satisfecho con el sistema en general - Escala lineal (1-5)
-- **Pregunta 18:** El sistema cumple con mis expectativas - Escala lineal (1-5)
-- **Pregunta 19:** Recomendaría el sistema a otros - Escala lineal (1-5)
-- **Pregunta 20:** El sistema mejora mi experiencia de trabajo - Escala lineal (1-5)
-- **Pregunta 21:** Estoy contento con la calidad del sistema - Escala lineal (1-5)
+{generate_scale_questions(preguntas['satisfaccion'], 17)}
 
 ### 4. Configuración de Escalas
 - Usar "Escala lineal" de 1 a 5
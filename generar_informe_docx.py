@@ -1,13 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.shared import OxmlElement, qn
 import datetime
 
+from plantilla_estilos import documento_base
+
 def add_hyperlink(paragraph, text, url):
     """Agregar un hipervínculo a un párrafo"""
     part = paragraph.part
@@ -40,41 +39,8 @@ def add_hyperlink(paragraph, text, url):
 def create_informe_docx():
     """Crear el informe en formato Word"""
     
-    # Crear documento
-    doc = Document()
-    
-    # Configurar estilos
-    styles = doc.styles
-    
-    # Estilo para títulos principales
-    title_style = styles.add_style('CustomTitle', WD_STYLE_TYPE.PARAGRAPH)
-    title_font = title_style.font
-    title_font.name = 'Calibri'
-    title_font.size = Pt(18)
-    title_font.bold = True
-    title_font.color.rgb = RGBColor(102, 126, 234)  # Azul corporativo
-    title_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title_style.paragraph_format.space_after = Pt(12)
-    
-    # Estilo para subtítulos
-    subtitle_style = styles.add_style('CustomSubtitle', WD_STYLE_TYPE.PARAGRAPH)
-    subtitle_font = subtitle_style.font
-    subtitle_font.name = 'Calibri'
-    subtitle_font.size = Pt(14)
-    subtitle_font.bold = True
-    subtitle_font.color.rgb = RGBColor(102, 126, 234)
-    subtitle_style.paragraph_format.space_before = Pt(12)
-    subtitle_style.paragraph_format.space_after = Pt(6)
-    
-    # Estilo para código
-    code_style = styles.add_style('CodeStyle', WD_STYLE_TYPE.PARAGRAPH)
-    code_font = code_style.font
-    code_font.name = 'Consolas'
-    code_font.size = Pt(10)
-    code_style.paragraph_format.left_indent = Inches(0.5)
-    code_style.paragraph_format.right_indent = Inches(0.5)
-    code_style.paragraph_format.space_before = Pt(6)
-    code_style.paragraph_format.space_after = Pt(6)
+    # Crear documento con los estilos compartidos (CustomTitle, CustomSubtitle, CodeStyle)
+    doc = documento_base()
     
     # Título principal
     title = doc.add_heading('📋 INFORME TÉCNICO: MANEJO DE SESIONES Y COOKIES', 0)
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Importador por bloques de respuestas exportadas
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Lee exportaciones CSV de Google Forms (o de Google Sheets) y volcados
+JSONL del objeto `data` del cuestionario HTML, bloque a bloque y con
+memoria constante, y entrega cada bloque en columnas a los destinos
+indicados: un almacén columnar (almacen_columnar.py) y los acumuladores
+de resultados.
+
+Los encabezados del CSV se asocian con los ítems del cuestionario por
+su texto (sin distinguir mayúsculas, tildes ni puntuación). Se aceptan
+también los identificadores (facilidad_1), las cuadrículas de Google
+Forms ("Sección [pregunta]") y los rótulos de los datos del encuestado,
+la evaluación general y los comentarios. Un texto repetido en el
+cuestionario se asigna por orden de aparición. Los archivos .gz se leen
+directamente. De los volcados JSONL se toma además la duración del
+llenado (`tiempos`), para el filtro de calidad de los destinos.
+
+Uso:
+    python importador_respuestas.py respuestas_forms.csv --almacen campana_2025
+    python importador_respuestas.py ola1.csv ola2.csv.gz volcado.jsonl --bloque 50000
+"""
+
+import argparse
+import csv
+import datetime
+import gzip
+import json
+import re
+import time
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+
+from almacen_columnar import AlmacenColumnar, campos_del_esquema
+from calidad_respuestas import duraciones, validar_tiempos
+from esquema_cuestionario import cargar_esquema
+from puntuaciones import ResumenPuntuaciones
+
+TAMANO_BLOQUE = 20_000
+
+# Rótulos de Google Forms y del cuestionario HTML para los campos que no son ítems Likert
+ROTULOS_CAMPOS = {
+    'nombre': ('Nombre', 'Nombre (opcional)'),
+    'rol': ('Rol', 'Rol/Posición'),
+    'experiencia': ('Experiencia con el sistema',),
+    'frecuencia': ('Frecuencia de uso',),
+    'navegador': ('Navegador utilizado', 'Navegador'),
+    'dispositivo': ('Dispositivo',),
+    'puntuacion_general': (
+        'Puntuación general del sistema',
+        'Puntuación general del sistema (1-5)',
+        'En una escala del 1 al 5, ¿cómo calificaría el sistema LogicQP en general?',
+    ),
+    'comparacion': (
+        'Comparación con otros sistemas',
+        '¿Cómo compara LogicQP con otros sistemas similares que ha usado?',
+    ),
+    'recomendacion': ('¿Recomendaría el sistema?', '¿Recomendaría el sistema LogicQP a otros usuarios?'),
+    'me_gusta': ('¿Qué es lo que más le gusta del sistema?',),
+    'no_gusta': ('¿Qué es lo que menos le gusta del sistema?',),
+}
+
+# Columna de fecha de Google Forms (español e inglés)
+ROTULOS_FECHA = ('Marca temporal', 'Timestamp')
+
+# "2025/01/15 10:23:45", "15/01/2025 10:23:45 a. m. GMT-5", "2025-01-15T10:23:45"
+PATRON_FECHA = re.compile(
+    r'^\s*(\d{1,4})[/.-](\d{1,2})[/.-](\d{1,4})[ T]+(\d{1,2}):(\d{2})(?::(\d{2}))?'
+    r'(?:\.\d+)?\s*(?:([ap])\.?\s*m\.?)?',
+    re.I
+)
+
+VALORES_LIKERT = {str(v): v for v in range(1, 6)}
+VALORES_LIKERT[''] = 0
+
+def normalizar(texto):
+    """Texto en minúsculas, sin tildes ni puntuación"""
+    texto = unicodedata.normalize('NFKD', texto.casefold())
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return ' '.join(re.findall(r'[a-z0-9]+', texto))
+
+def leer_fecha(valor):
+    """Fecha de la columna 'Marca temporal' como epoch (hora local), o None si no se reconoce"""
+    encontrado = PATRON_FECHA.match(valor)
+    if not encontrado:
+        return None
+    a, b, c, hora, minuto, segundo, meridiano = encontrado.groups()
+    if len(a) == 4:
+        anio, mes, dia = int(a), int(b), int(c)
+    else:
+        # Día primero (configuración regional en español) salvo que no pueda ser un mes
+        dia, mes, anio = int(a), int(b), int(c)
+        if mes > 12:
+            dia, mes = mes, dia
+    hora = int(hora)
+    if meridiano:
+        hora = hora % 12 + (12 if meridiano.lower() == 'p' else 0)
+    try:
+        return datetime.datetime(anio, mes, dia, hora, int(minuto), int(segundo or 0)).timestamp()
+    except ValueError:
+        return None
+
+def codigo_opcion(valor, opciones):
+    """Código 1..n de la opción que corresponde a un rótulo, 0 si está vacío, None si no coincide"""
+    normal = normalizar(valor)
+    if not normal:
+        return 0
+    clave = normal.replace(' ', '_')
+    if clave in opciones:
+        return opciones.index(clave) + 1
+    # "Google Chrome" -> chrome, "4 - Bueno" -> 4: la opción más específica contenida en el rótulo
+    palabras = set(normal.split())
+    candidatos = sorted(((len(o.split('_')), i) for i, o in enumerate(opciones, 1) if set(o.split('_')) <= palabras),
+                        reverse=True)
+    if not candidatos or (len(candidatos) > 1 and candidatos[0][0] == candidatos[1][0]):
+        return None
+    return candidatos[0][1]
+
+class MapeoEncabezados:
+    """Asociación entre columnas de una exportación y campos del cuestionario"""
+
+    def __init__(self, encabezados, esquema=None):
+        esquema = esquema or cargar_esquema()
+        self.categoricos, self.textos = campos_del_esquema(esquema)
+        self.items = esquema['items']
+        campos = set(self.items) | set(self.categoricos) | set(self.textos)
+
+        # Texto normalizado -> ítems con ese texto, en orden del cuestionario
+        por_texto = defaultdict(list)
+        for item_id, texto in zip(esquema['items'], esquema['item_texto']):
+            por_texto[normalizar(texto)].append(item_id)
+        rotulos = {}
+        for campo, textos in ROTULOS_CAMPOS.items():
+            rotulos.update((normalizar(t), campo) for t in textos)
+        rotulos.update((normalizar(texto), name) for texto, name in esquema['comentarios'])
+        fechas = {normalizar(t) for t in ROTULOS_FECHA}
+
+        self.columnas = {}
+        self.columna_fecha = None
+        self.ignorados = []
+        for columna, encabezado in enumerate(encabezados):
+            encabezado = encabezado.strip()
+            cuadricula = re.match(r'^.*\[(.+)\]$', encabezado)
+            normal = normalizar(cuadricula.group(1) if cuadricula else encabezado)
+            if encabezado in campos:
+                campo = encabezado
+            elif por_texto.get(normal):
+                campo = por_texto[normal].pop(0)
+            elif normal in rotulos:
+                campo = rotulos[normal]
+            elif normal in fechas and self.columna_fecha is None:
+                self.columna_fecha = columna
+                continue
+            else:
+                self.ignorados.append(encabezado)
+                continue
+            if campo in self.columnas:
+                self.ignorados.append(encabezado)
+                continue
+            self.columnas[campo] = columna
+
+        self.columnas_likert = [(self.items.index(c), col) for c, col in self.columnas.items() if c in self.items]
+        self._codigos = {campo: {} for campo in self.categoricos}
+
+    def convertir(self, filas, lineas=None, duracion=None):
+        """Convertir un bloque de filas (listas de textos) en columnas; devuelve (columnas, rechazos)
+
+        `duracion`: segundos de llenado de cada fila (NaN si no se registró; los CSV no la traen).
+        """
+        total = len(filas)
+        ancho = max(self.columnas.values(), default=-1) + 1
+        rechazos = {}
+
+        def celdas(columna):
+            return [fila[columna].strip() if columna < len(fila) else '' for fila in filas]
+
+        likert = np.zeros((total, len(self.items)), dtype=np.uint8)
+        for j, columna in self.columnas_likert:
+            valores = np.frombuffer(bytes(VALORES_LIKERT.get(v, 255) for v in celdas(columna)), dtype=np.uint8)
+            for fila in np.flatnonzero(valores == 255).tolist():
+                rechazos.setdefault(fila, f"valor Likert no válido en '{self.items[j]}': {filas[fila][columna]!r}")
+            likert[:, j] = valores
+
+        categoricos = {}
+        for campo, opciones in self.categoricos.items():
+            if campo not in self.columnas:
+                continue
+            memo = self._codigos[campo]
+            codigos = np.zeros(total, dtype=np.uint8)
+            for fila, valor in enumerate(celdas(self.columnas[campo])):
+                if valor not in memo:
+                    memo[valor] = codigo_opcion(valor, opciones)
+                if memo[valor] is None:
+                    rechazos.setdefault(fila, f"opción no válida en '{campo}': {valor!r}")
+                else:
+                    codigos[fila] = memo[valor]
+            categoricos[campo] = codigos
+
+        textos = {campo: celdas(self.columnas[campo]) for campo in self.textos if campo in self.columnas}
+
+        recibido = np.full(total, np.nan)
+        if self.columna_fecha is not None:
+            for fila, valor in enumerate(celdas(self.columna_fecha)):
+                fecha = leer_fecha(valor) if valor else None
+                if fecha is not None:
+                    recibido[fila] = fecha
+        recibido[np.isnan(recibido)] = time.time()
+        duracion = np.full(total, np.nan) if duracion is None else np.asarray(duracion, dtype=np.float64)
+
+        # Filas cortas (línea incompleta al final del archivo) también se rechazan
+        for fila, valores in enumerate(filas):
+            if len(valores) < ancho:
+                rechazos.setdefault(fila, f"se esperaban {ancho} columnas y hay {len(valores)}")
+
+        if rechazos:
+            validas = np.ones(total, dtype=bool)
+            validas[list(rechazos)] = False
+            likert = likert[validas]
+            categoricos = {campo: codigos[validas] for campo, codigos in categoricos.items()}
+            textos = {campo: [v for v, ok in zip(valores, validas) if ok] for campo, valores in textos.items()}
+            recibido = recibido[validas]
+            duracion = duracion[validas]
+
+        columnas = {'likert': likert, 'categoricos': categoricos, 'textos': textos, 'recibido': recibido,
+                    'duracion': duracion}
+        lineas = lineas or range(1, total + 1)
+        return columnas, [(lineas[fila], motivo) for fila, motivo in sorted(rechazos.items())]
+
+def abrir_texto(ruta):
+    """Abrir un archivo de texto UTF-8 (con o sin BOM), comprimido con gzip o no"""
+    if ruta.endswith('.gz'):
+        return gzip.open(ruta, 'rt', encoding='utf-8-sig', newline='')
+    return open(ruta, encoding='utf-8-sig', newline='')
+
+def leer_csv(ruta, esquema=None, tamano_bloque=TAMANO_BLOQUE):
+    """Bloques (mapeo, filas, número de línea de cada fila, rechazos de lectura, duración) de una exportación CSV"""
+    with abrir_texto(ruta) as f:
+        lector = csv.reader(f)
+        encabezados = next(lector, None)
+        if encabezados is None:
+            return
+        mapeo = MapeoEncabezados(encabezados, esquema)
+        bloque = []
+        lineas = []
+        for fila in lector:
+            if not any(fila):
+                continue
+            bloque.append(fila)
+            lineas.append(lector.line_num)
+            if len(bloque) >= tamano_bloque:
+                yield mapeo, bloque, lineas, [], None
+                bloque = []
+                lineas = []
+        if bloque:
+            yield mapeo, bloque, lineas, [], None
+
+def leer_jsonl(ruta, esquema=None, tamano_bloque=TAMANO_BLOQUE):
+    """Bloques (mapeo, filas, número de línea de cada fila, rechazos, duración) de un volcado JSONL del objeto `data`"""
+    esquema = esquema or cargar_esquema()
+    categoricos, textos = campos_del_esquema(esquema)
+    campos = [*esquema['items'], *categoricos, *textos]
+    mapeo = MapeoEncabezados(campos, esquema)
+    bloque = []
+    lineas = []
+    rechazos = []
+    tiempos = []
+    with abrir_texto(ruta) as f:
+        for linea, texto in enumerate(f, 1):
+            if not texto.strip():
+                continue
+            # Una línea mal formada se rechaza sin detener la importación
+            try:
+                data = json.loads(texto)
+            except json.JSONDecodeError as error:
+                rechazos.append((linea, f"JSON no válido: {error.msg}"))
+                continue
+            if not isinstance(data, dict):
+                rechazos.append((linea, f"se esperaba un objeto JSON y hay {type(data).__name__}"))
+                continue
+            try:
+                # Solo `tiempos` hace falta para la duración: no se guardan los objetos del bloque
+                tiempos.append({'tiempos': None if data.get('tiempos') is None else validar_tiempos(data['tiempos'])})
+            except ValueError as error:
+                rechazos.append((linea, str(error)))
+                continue
+            bloque.append(['' if data.get(campo) is None else str(data[campo]) for campo in campos])
+            lineas.append(linea)
+            if len(bloque) >= tamano_bloque:
+                yield mapeo, bloque, lineas, rechazos, duraciones(tiempos)
+                bloque = []
+                lineas = []
+                rechazos = []
+                tiempos = []
+    if bloque or rechazos:
+        yield mapeo, bloque, lineas, rechazos, duraciones(tiempos)
+
+def importar(rutas, destinos, esquema=None, tamano_bloque=TAMANO_BLOQUE, al_avanzar=None):
+    """Importar archivos CSV/JSONL y entregar cada bloque a los destinos; devuelve estadísticas"""
+    esquema = esquema or cargar_esquema()
+    estadisticas = {'archivos': 0, 'importadas': 0, 'rechazadas': 0, 'rechazos': [], 'ignorados': {}}
+    for ruta in rutas:
+        base = ruta[:-3] if ruta.endswith('.gz') else ruta
+        lector = leer_jsonl if base.endswith(('.jsonl', '.ndjson')) else leer_csv
+        for mapeo, filas, lineas, rechazos, duracion in lector(ruta, esquema, tamano_bloque):
+            if filas:
+                columnas, rechazos_filas = mapeo.convertir(filas, lineas, duracion)
+                rechazos = sorted(rechazos + rechazos_filas)
+                for destino in destinos:
+                    destino.agregar_columnas(**columnas)
+                estadisticas['importadas'] += len(columnas['recibido'])
+            estadisticas['rechazadas'] += len(rechazos)
+            estadisticas['rechazos'].extend((ruta, linea, motivo) for linea, motivo in rechazos[:100])
+            estadisticas['ignorados'][ruta] = mapeo.ignorados
+            if al_avanzar:
+                al_avanzar(ruta, estadisticas)
+        estadisticas['archivos'] += 1
+    return estadisticas
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Importar respuestas de Google Forms (CSV) y del cuestionario HTML (JSONL)')
+    parser.add_argument('archivos', nargs='+', help='Archivos .csv, .jsonl o .ndjson (opcionalmente .gz)')
+    parser.add_argument('--almacen', help='Agregar las respuestas a este almacén columnar')
+    parser.add_argument('--bloque', type=int, default=TAMANO_BLOQUE, help='Filas por bloque')
+    args = parser.parse_args()
+
+    esquema = cargar_esquema()
+    resumen = ResumenPuntuaciones(esquema)
+    destinos = [resumen]
+    if args.almacen:
+        destinos.append(AlmacenColumnar(args.almacen, esquema))
+
+    def avance(ruta, estadisticas):
+        print(f"⏳ {ruta}: {estadisticas['importadas']} importadas, {estadisticas['rechazadas']} rechazadas")
+
+    print(f"🚀 Importando {len(args.archivos)} archivos en bloques de {args.bloque} filas...")
+    inicio = time.perf_counter()
+    estadisticas = importar(args.archivos, destinos, esquema, args.bloque, avance)
+    duracion = time.perf_counter() - inicio
+
+    print(f"✅ {estadisticas['importadas']} respuestas importadas en {duracion:.2f}s")
+    for ruta, ignorados in estadisticas['ignorados'].items():
+        if ignorados:
+            print(f"⚠️ {ruta}: columnas sin asociar: {', '.join(ignorados)}")
+    if estadisticas['rechazadas']:
+        print(f"❌ {estadisticas['rechazadas']} filas rechazadas, por ejemplo:")
+        for ruta, linea, motivo in estadisticas['rechazos'][:10]:
+            print(f"   {ruta}:{linea}: {motivo}")
+    if args.almacen:
+        print(f"💾 Almacén {args.almacen}: {destinos[1].filas} respuestas")
+    resumen.imprimir()
+
+if __name__ == "__main__":
+    main()
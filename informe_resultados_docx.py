@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Informe de resultados del Cuestionario Likert en formato Word
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Escribe los resultados de la encuesta con la misma tabla Likert del
+cuestionario (create_likert_table de generar_cuestionario_docx.py): por
+cada ítem, la distribución 1-5, la media y su intervalo de confianza.
+
+El informe se genera desde los agregados precalculados
+(agregados_en_linea.py), nunca desde las respuestas: su costo depende
+del número de ítems y no del de encuestados. Los intervalos usan la
+aproximación normal con la varianza de los agregados: por ítem, la de
+las respuestas; por sección, la de la media de cada encuestado en la
+sección (sus respuestas a los distintos ítems no son independientes).
+Las secciones con ítems redactados en negativo informan la media con
+esos ítems invertidos (más alto = mejor) y se señalan como tales.
+
+Cada sección lleva un gráfico de barras apiladas dibujado con NumPy y
+guardado como PNG en la caché (CACHE_DIR/graficos), con el hash de su
+contenido como nombre: un gráfico con la misma distribución no se
+vuelve a dibujar.
+
+Uso:
+    python informe_resultados_docx.py --agregados campana_2025/agregados.npz
+    python informe_resultados_docx.py --almacen campana_2025
+    python informe_resultados_docx.py --sintetico 1000000
+"""
+
+import argparse
+import datetime
+import hashlib
+import os
+import statistics
+import struct
+import time
+import zlib
+
+import numpy as np
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Inches, Pt, RGBColor
+
+from agregados_en_linea import AgregadosEnLinea
+from esquema_cuestionario import CACHE_DIR, ESCALA_LIKERT, cargar_esquema
+from generar_cuestionario_docx import create_likert_table
+from intervalos_bootstrap import NIVEL_CONFIANZA
+from plantilla_estilos import documento_base
+from puntuaciones import BLOQUE_FILAS, matriz_sintetica
+
+# Cambiar si se modifica el dibujo: invalida los gráficos de la caché
+VERSION_GRAFICO = 1
+
+ETIQUETAS_ESCALA = ('Muy en desacuerdo', 'En desacuerdo', 'Neutral', 'De acuerdo', 'Muy de acuerdo')
+COLORES_ESCALA = ((215, 48, 39), (252, 141, 89), (224, 224, 224), (145, 207, 96), (26, 152, 80))
+
+ANCHO_GRAFICO = 1200
+ALTO_BARRA = 28
+SEPARACION_BARRAS = 10
+
+NOTA_INVERTIDA = '(ítems invertidos: más alto = mejor)'
+
+COLUMNAS_RESULTADO = (*(str(valor) for valor in ESCALA_LIKERT), 'Media', f'IC {NIVEL_CONFIANZA:.0%}')
+ANCHOS_RESULTADO = (*[0.55] * len(ESCALA_LIKERT), 0.6, 0.9)
+
+def intervalo_media(estadisticas, nivel=NIVEL_CONFIANZA):
+    """Intervalo (inferior, superior) de la media con la aproximación normal; None sin datos suficientes"""
+    n = estadisticas['n']
+    if n < 2:
+        return None
+    z = statistics.NormalDist().inv_cdf((1 + nivel) / 2)
+    margen = z * estadisticas['desviacion'] / n ** 0.5
+    return estadisticas['media'] - margen, estadisticas['media'] + margen
+
+def proporciones(estadisticas):
+    """Proporción de respuestas de cada valor de la escala"""
+    histograma = np.asarray(estadisticas['histograma'], dtype=np.float64)
+    return histograma / histograma.sum() if histograma.sum() else histograma
+
+def codificar_png(imagen):
+    """PNG RGB de 8 bits de una matriz alto × ancho × 3 (uint8)"""
+    alto, ancho, _ = imagen.shape
+    # Filtro 0 (ninguno) al inicio de cada fila
+    crudo = np.concatenate([np.zeros((alto, 1), dtype=np.uint8), imagen.reshape(alto, -1)], axis=1)
+
+    def bloque(tipo, datos):
+        return struct.pack('>I', len(datos)) + tipo + datos + struct.pack('>I', zlib.crc32(tipo + datos))
+
+    return (b'\x89PNG\r\n\x1a\n'
+            + bloque(b'IHDR', struct.pack('>IIBBBBB', ancho, alto, 8, 2, 0, 0, 0))
+            + bloque(b'IDAT', zlib.compress(crudo.tobytes(), 6))
+            + bloque(b'IEND', b''))
+
+def dibujar_distribucion(distribucion, ancho=ANCHO_GRAFICO):
+    """Barras apiladas al 100%, una por fila de `distribucion` (filas × valores de la escala)"""
+    distribucion = np.asarray(distribucion, dtype=np.float64)
+    paleta = np.array([*COLORES_ESCALA, (255, 255, 255)], dtype=np.uint8)
+    # Límite derecho de cada tramo en píxeles; el color de cada columna es el tramo que la contiene
+    limites = np.rint(np.cumsum(distribucion, axis=1) * ancho)
+    columnas = np.arange(ancho) + 0.5
+    tramo = (columnas[None, :, None] >= limites[:, None, :]).sum(axis=2)
+    tramo[distribucion.sum(axis=1) == 0] = len(COLORES_ESCALA)  # Sin respuestas: barra vacía
+    barras = paleta[tramo]  # filas × ancho × 3
+
+    # Cada barra ocupa ALTO_BARRA píxeles, con separaciones blancas y guías grises al 25/50/75%
+    alto_fila = ALTO_BARRA + SEPARACION_BARRAS
+    imagen = np.full((len(distribucion) * alto_fila + SEPARACION_BARRAS, ancho, 3), 255, dtype=np.uint8)
+    for i in range(ALTO_BARRA):
+        imagen[SEPARACION_BARRAS + i::alto_fila][:len(barras)] = barras
+    guias = (np.array([0.25, 0.5, 0.75]) * ancho).astype(int)
+    fondo = (imagen == 255).all(axis=2)
+    fondo[:, np.setdiff1d(np.arange(ancho), guias)] = False
+    imagen[fondo] = 190
+    return imagen
+
+def grafico_en_cache(distribucion, ancho=ANCHO_GRAFICO, directorio=None):
+    """Ruta del PNG de `distribucion`, dibujado solo si no está en la caché"""
+    directorio = directorio or os.path.join(CACHE_DIR, 'graficos')
+    # Proporciones redondeadas: diferencias invisibles en el dibujo no generan otro archivo
+    contenido = np.round(np.asarray(distribucion, dtype=np.float64), 4).astype('<f8')
+    h = hashlib.sha256(f'{VERSION_GRAFICO}:{ancho}:{contenido.shape}'.encode('utf-8'))
+    h.update(contenido.tobytes())
+    ruta = os.path.join(directorio, f'{h.hexdigest()}.png')
+    if not os.path.exists(ruta):
+        os.makedirs(directorio, exist_ok=True)
+        temporal = f'{ruta}.{os.getpid()}.tmp'
+        with open(temporal, 'wb') as f:
+            f.write(codificar_png(dibujar_distribucion(contenido, ancho)))
+        os.replace(temporal, ruta)
+    return ruta
+
+def agregar_leyenda(doc):
+    """Leyenda de colores de la escala"""
+    p = doc.add_paragraph()
+    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    for valor, etiqueta, color in zip(ESCALA_LIKERT, ETIQUETAS_ESCALA, COLORES_ESCALA):
+        marca = p.add_run('■ ')
+        marca.font.color.rgb = RGBColor(*color)
+        texto = p.add_run(f'{valor} = {etiqueta}   ')
+        texto.font.size = Pt(9)
+
+def formato_intervalo(intervalo):
+    """Texto de un intervalo"""
+    return f'{intervalo[0]:.2f}–{intervalo[1]:.2f}' if intervalo else '-'
+
+def filas_resultado(estadisticas):
+    """Textos de la tabla Likert de resultados: % de cada valor, media e intervalo"""
+    filas = []
+    for e in estadisticas:
+        porcentajes = [f'{p:.1%}' for p in proporciones(e)] if e['n'] else ['-'] * len(ESCALA_LIKERT)
+        media = f"{e['media']:.2f}" if e['n'] else '-'
+        filas.append([*porcentajes, media, formato_intervalo(intervalo_media(e))])
+    return filas
+
+def tabla_secciones(doc, resumen):
+    """Tabla resumen con una fila por sección"""
+    table = doc.add_table(rows=1, cols=4)
+    table.style = 'Table Grid'
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    for cell, texto in zip(table.rows[0].cells, ('Sección', 'Encuestados', 'Media', f'IC {NIVEL_CONFIANZA:.0%}')):
+        cell.text = texto
+        cell.paragraphs[0].runs[0].bold = True
+        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+    for seccion in resumen['secciones']:
+        cells = table.add_row().cells
+        cells[0].text = seccion['titulo'] + (f' {NOTA_INVERTIDA}' if seccion.get('invertida') else '')
+        cells[1].text = f"{seccion['n']:,}"
+        cells[2].text = f"{seccion['media']:.2f}" if seccion['n'] else '-'
+        cells[3].text = formato_intervalo(intervalo_media(seccion))
+        for cell in cells[1:]:
+            cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+    return table
+
+def crear_informe_resultados(resumen, esquema=None, titulo='Resultados de la encuesta', graficos=True):
+    """Documento con los resultados de `resumen` (AgregadosEnLinea.resumen())"""
+    esquema = esquema or cargar_esquema()
+    doc = documento_base()
+
+    title = doc.add_heading('📊 INFORME DE RESULTADOS - CUESTIONARIO LIKERT LOGICQP', 0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    subtitle = doc.add_paragraph(titulo)
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    subtitle.runs[0].bold = True
+
+    doc.add_heading('📋 INFORMACIÓN GENERAL', level=1)
+    info_data = [
+        ('Respuestas incluidas:', f"{resumen['respuestas']:,}"),
+        ('Excluidas por calidad:', f"{resumen.get('excluidas', 0):,}"),
+        ('Fecha:', datetime.date.today().strftime('%d/%m/%Y')),
+        ('Intervalos:', f'{NIVEL_CONFIANZA:.0%} de confianza para la media (aproximación normal; '
+                        'por sección, sobre la media de cada encuestado)'),
+    ]
+    for label, value in info_data:
+        p = doc.add_paragraph()
+        p.add_run(f'{label} ').bold = True
+        p.add_run(value)
+
+    doc.add_heading('📈 RESUMEN POR SECCIÓN', level=1)
+    tabla_secciones(doc, resumen)
+
+    items = resumen['items']
+    for s, (section_title, subsections) in enumerate(esquema['secciones']):
+        doc.add_page_break()
+        doc.add_heading(section_title, level=1)
+        seccion = resumen['secciones'][s]
+        p = doc.add_paragraph()
+        p.add_run('Media de la sección: ').bold = True
+        p.add_run(f"{seccion['media']:.2f} (IC {formato_intervalo(intervalo_media(seccion))}, "
+                  f"{seccion['n']:,} encuestados)" if seccion['n'] else 'sin respuestas')
+        if seccion.get('invertida') and seccion['n']:
+            p.add_run(f" {NOTA_INVERTIDA}; la distribución y las tablas muestran las respuestas sin invertir").italic = True
+
+        if graficos:
+            ids = [item for item, indice in zip(esquema['items'], esquema['item_seccion']) if indice == s]
+            distribucion = np.array([proporciones(items[item]) for item in ids])
+            doc.add_picture(grafico_en_cache(distribucion), width=Inches(6.0))
+            agregar_leyenda(doc)
+
+        for subsection_title, question_key in subsections:
+            inicio, fin = esquema['grupo_rango'][question_key]
+            estadisticas = [items[item] for item in esquema['items'][inicio:fin]]
+            preguntas = [f"{texto} (n = {e['n']:,})" for texto, e in zip(esquema['item_texto'][inicio:fin],
+                                                                            estadisticas)]
+            create_likert_table(doc, subsection_title, preguntas, headers=COLUMNAS_RESULTADO,
+                                rows=filas_resultado(estadisticas), question_width=2.25,
+                                column_widths=ANCHOS_RESULTADO)
+    return doc
+
+def agregados_sinteticos(total, esquema=None, bloque=BLOQUE_FILAS):
+    """Agregados de `total` respuestas aleatorias, generadas por bloques"""
+    esquema = esquema or cargar_esquema()
+    agregados = AgregadosEnLinea(esquema, filtrar_calidad=False)
+    for inicio in range(0, total, bloque):
+        agregados.agregar_columnas(matriz_sintetica(min(bloque, total - inicio), inicio, esquema))
+    return agregados
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Informe Word de resultados desde los agregados precalculados')
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument('--agregados', help='Instantánea .npz de agregados_en_linea.py')
+    grupo.add_argument('--almacen', help='Directorio del almacén columnar (actualiza su instantánea)')
+    grupo.add_argument('--sintetico', type=int, metavar='N', help='Medir con N respuestas aleatorias')
+    parser.add_argument('--salida', default='INFORME_RESULTADOS_LIKERT_LogicQP.docx', help='Archivo .docx')
+    parser.add_argument('--titulo', default='Resultados de la encuesta', help='Subtítulo del informe')
+    parser.add_argument('--sin-graficos', action='store_true', help='No incluir gráficos')
+    args = parser.parse_args()
+
+    esquema = cargar_esquema()
+    if args.agregados:
+        with np.load(args.agregados) as datos:
+            filtrar_calidad = bool(datos['filtrar_calidad'])
+        agregados = AgregadosEnLinea.cargar(args.agregados, esquema, filtrar_calidad)
+    elif args.almacen:
+        from almacen_columnar import AlmacenColumnar
+        print(f"🚀 Actualizando agregados de {args.almacen}...")
+        ruta = os.path.join(args.almacen, 'agregados.npz')
+        agregados = AgregadosEnLinea.restaurar(AlmacenColumnar(args.almacen, esquema), ruta, esquema)
+        agregados.guardar(ruta)
+    else:
+        print(f"🚀 Generando agregados de {args.sintetico} respuestas sintéticas...")
+        agregados = agregados_sinteticos(args.sintetico, esquema)
+
+    print("📝 Generando informe de resultados...")
+    inicio = time.perf_counter()
+    doc = crear_informe_resultados(agregados.resumen(), esquema, args.titulo, not args.sin_graficos)
+    doc.save(args.salida)
+    print(f"✅ Informe generado en {time.perf_counter() - inicio:.2f}s: {args.salida}")
+    print(f"📊 Respuestas: {agregados.filas - agregados.excluidas:,} en {len(esquema['secciones'])} secciones")
+
+if __name__ == "__main__":
+    main()
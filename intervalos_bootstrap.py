@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Intervalos de confianza bootstrap de las puntuaciones del cuestionario
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Para cada segmento de encuestados (por ejemplo, la frecuencia de uso)
+y para el total, estima la media y su intervalo percentil de los
+compuestos (usabilidad, eficiencia, satisfacción) y de cada subsección
+Likert.
+
+Las réplicas no copian la matriz de respuestas: cada bloque de réplicas
+sortea sus índices y los convierte con bincount en una matriz de pesos
+réplica × encuestado (cuántas veces salió cada uno). Un solo matmul
+contra [valor · respondido | respondido] da las sumas y los
+conteos de todas las réplicas del bloque. El remuestreo es estratificado:
+cada segmento se remuestrea dentro de sí mismo, sobre un tramo contiguo
+de las filas ordenadas por segmento.
+
+Cada bloque tiene su propia semilla derivada con SeedSequence.spawn, así
+que el resultado es el mismo con uno o varios procesos. Los procesos
+leen los datos desde un .npy por memory-map.
+
+Uso:
+    python intervalos_bootstrap.py --almacen campana_2025 --segmento frecuencia
+    python intervalos_bootstrap.py --sintetico 100000 --remuestras 10000 --procesos 4
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from esquema_cuestionario import cargar_esquema
+from puntuaciones import matriz_sintetica, puntuaciones_centesimas
+
+# Réplicas por bloque (unidad de trabajo y de semilla)
+BLOQUE_REMUESTRAS = 64
+
+# Celdas réplica × encuestado por matmul (acota la memoria temporal) y por bincount
+# (su tabla de conteos debe caber en caché: el acceso es aleatorio)
+CELDAS_TRAMO = 1 << 22
+CELDAS_CONTEO = 1 << 17
+
+NIVEL_CONFIANZA = 0.95
+
+# Datos de cada proceso del pool, abiertos una sola vez por memory-map
+_datos_proceso = None
+
+def estadisticos_por_encuestado(likert, esquema=None):
+    """Nombres (tipo, nombre) y matriz [valor · respondido | respondido] (float32) de compuestos y subsecciones"""
+    esquema = esquema or cargar_esquema()
+    likert = np.asarray(likert)
+    centesimas = puntuaciones_centesimas(likert, esquema)
+    # Un compuesto y una subsección pueden llamarse igual (p. ej. 'satisfaccion'): el tipo los distingue
+    nombres = [*(('compuestos', name) for name in esquema['compuestos']),
+               *(('subsecciones', grupo) for grupo in esquema['grupos'])]
+    assert len(set(nombres)) == len(nombres), "Estadísticos repetidos en el esquema"
+    m = len(nombres)
+    datos = np.zeros((len(likert), 2 * m), dtype=np.float32)
+    for j, name in enumerate(esquema['compuestos']):
+        # Un compuesto sin respuestas vale 0, así que su valor ya está anulado
+        datos[:, j] = centesimas[name] / 100
+        datos[:, m + j] = centesimas[name] > 0
+    # Subsecciones en la escala de sus propios ítems (sin invertir)
+    for j, grupo in enumerate(esquema['grupos'], len(esquema['compuestos'])):
+        inicio, fin = esquema['grupo_rango'][grupo]
+        valores = likert[:, inicio:fin]
+        cuenta = np.count_nonzero(valores, axis=1)
+        datos[:, j] = valores.sum(axis=1, dtype=np.int32) / np.maximum(cuenta, 1)
+        datos[:, m + j] = cuenta > 0
+    return nombres, datos
+
+def remuestrear(datos, estratos, semilla, remuestras):
+    """Sumas de `datos` en `remuestras` réplicas de cada estrato (inicio, fin): estrato × réplica × columna"""
+    rng = np.random.default_rng(semilla)
+    resultado = np.empty((len(estratos), remuestras, datos.shape[1]), dtype=np.float32)
+    for e, (inicio, fin) in enumerate(estratos):
+        n = fin - inicio
+        tramo = max(1, min(remuestras, CELDAS_TRAMO // n))
+        conteo = max(1, min(tramo, CELDAS_CONTEO // n))
+        pesos = np.empty((tramo, n), dtype=np.float32)
+        for r in range(0, remuestras, tramo):
+            filas = min(tramo, remuestras - r)
+            for c in range(0, filas, conteo):
+                k = min(conteo, filas - c)
+                # Índice de cada sorteo desplazado por su réplica: un bincount cuenta varias réplicas juntas
+                indices = rng.integers(0, n, size=(k, n), dtype=np.int64)
+                indices += np.arange(0, k * n, n)[:, None]
+                pesos[c:c + k] = np.bincount(indices.ravel(), minlength=k * n).reshape(k, n)
+            resultado[e, r:r + filas] = pesos[:filas] @ datos[inicio:fin]
+    return resultado
+
+def _iniciar_proceso(ruta):
+    global _datos_proceso
+    _datos_proceso = np.load(ruta, mmap_mode='r')
+
+def _remuestrear_en_proceso(estratos, semilla, remuestras):
+    return remuestrear(_datos_proceso, estratos, semilla, remuestras)
+
+def sumas_bootstrap(datos, estratos, remuestras, semilla=0, procesos=1, bloque=BLOQUE_REMUESTRAS):
+    """Sumas de todas las réplicas (estrato × réplica × columna), reproducibles para una misma semilla"""
+    tamanos = [min(bloque, remuestras - r) for r in range(0, remuestras, bloque)]
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamanos))
+    if procesos <= 1 or len(tamanos) == 1:
+        partes = [remuestrear(datos, estratos, s, t) for s, t in zip(semillas, tamanos)]
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            ruta = os.path.join(tmp, 'datos.npy')
+            np.save(ruta, datos)
+            with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_proceso,
+                                     initargs=(ruta,)) as pool:
+                partes = list(pool.map(_remuestrear_en_proceso, [estratos] * len(tamanos), semillas, tamanos))
+    return np.concatenate(partes, axis=1)
+
+def intervalos_bootstrap(likert, segmento=None, etiquetas=None, esquema=None, remuestras=10_000,
+                         nivel=NIVEL_CONFIANZA, semilla=0, procesos=1):
+    """{estrato: {'compuestos'|'subsecciones': {nombre: {n, media, inferior, superior}}}} para el total
+    y cada código de `segmento`"""
+    esquema = esquema or cargar_esquema()
+    nombres, datos = estadisticos_por_encuestado(likert, esquema)
+    m = len(nombres)
+
+    # Filas ordenadas por segmento: cada estrato es un tramo contiguo (una vista, sin copias)
+    estratos = {'Todos': (0, len(datos))}
+    if segmento is not None:
+        segmento = np.asarray(segmento)
+        orden = np.argsort(segmento, kind='stable')
+        datos = datos[orden]
+        cuentas = np.bincount(segmento, minlength=len(etiquetas) if etiquetas else 0)
+        limites = np.concatenate([[0], np.cumsum(cuentas)])
+        for codigo, cantidad in enumerate(cuentas):
+            if cantidad:
+                etiqueta = etiquetas[codigo] if etiquetas else str(codigo)
+                estratos[etiqueta] = (int(limites[codigo]), int(limites[codigo + 1]))
+    estratos = {e: rango for e, rango in estratos.items() if rango[1] > rango[0]}
+    rangos = list(estratos.values())
+
+    sumas = sumas_bootstrap(datos, rangos, remuestras, semilla, procesos)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        medias = sumas[:, :, :m] / sumas[:, :, m:]
+    cola = (1 - nivel) / 2
+    inferior, superior = np.nanquantile(medias, [cola, 1 - cola], axis=1)
+
+    resultados = {}
+    for e, (estrato, (inicio, fin)) in enumerate(estratos.items()):
+        tramo = datos[inicio:fin].sum(axis=0, dtype=np.float64)
+        resultados[estrato] = {'compuestos': {}, 'subsecciones': {}}
+        for j, (tipo, nombre) in enumerate(nombres):
+            resultados[estrato][tipo][nombre] = {
+                'n': int(tramo[m + j]),
+                'media': float(tramo[j] / tramo[m + j]) if tramo[m + j] else float('nan'),
+                'inferior': float(inferior[e, j]),
+                'superior': float(superior[e, j]),
+            }
+    return resultados
+
+def imprimir_intervalos(resultados, nivel=NIVEL_CONFIANZA):
+    """Tabla de medias e intervalos por estrato"""
+    for estrato, estadisticos in resultados.items():
+        print()
+        print(f"📊 {estrato}")
+        print(f"   {'Estadístico':<16} {'n':>9} {'Media':>6}  IC {nivel:.0%}")
+        for tipo, grupo in estadisticos.items():
+            print(f"   {tipo.capitalize()}")
+            for nombre, r in grupo.items():
+                print(f"   {nombre:<16} {r['n']:>9} {r['media']:>6.2f}  [{r['inferior']:.2f}, {r['superior']:.2f}]")
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Intervalos de confianza bootstrap por segmento de encuestados')
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument('--almacen', help='Directorio del almacén columnar')
+    grupo.add_argument('--sintetico', type=int, metavar='N', help='Medir con N respuestas aleatorias')
+    parser.add_argument('--segmento', default='frecuencia', help='Campo categórico que define los segmentos')
+    parser.add_argument('--remuestras', type=int, default=10_000, help='Réplicas bootstrap')
+    parser.add_argument('--nivel', type=float, default=NIVEL_CONFIANZA, help='Nivel de confianza')
+    parser.add_argument('--semilla', type=int, default=0, help='Semilla del remuestreo')
+    parser.add_argument('--procesos', type=int, default=1, help='Procesos en paralelo')
+    args = parser.parse_args()
+
+    from almacen_columnar import campos_del_esquema
+    esquema = cargar_esquema()
+    categoricos, _ = campos_del_esquema(esquema)
+    if args.segmento not in categoricos:
+        parser.error(f"--segmento debe ser uno de: {', '.join(categoricos)}")
+    etiquetas = ('sin dato', *categoricos[args.segmento])
+
+    if args.almacen:
+        from almacen_columnar import AlmacenColumnar
+        print(f"🚀 Cargando respuestas de {args.almacen}...")
+        almacen = AlmacenColumnar(args.almacen, esquema)
+        likert = almacen.matriz()
+        segmento = np.array(almacen.categorico(args.segmento))
+    else:
+        print(f"🚀 Generando {args.sintetico} respuestas sintéticas...")
+        likert = matriz_sintetica(args.sintetico, esquema=esquema)
+        segmento = np.random.default_rng(1).integers(0, len(etiquetas), args.sintetico).astype(np.uint8)
+
+    print(f"🔁 {args.remuestras} réplicas con {args.procesos} proceso(s)...")
+    inicio = time.perf_counter()
+    resultados = intervalos_bootstrap(likert, segmento, etiquetas, esquema, args.remuestras, args.nivel,
+                                      args.semilla, args.procesos)
+    print(f"⏱️ Intervalos calculados en {time.perf_counter() - inicio:.2f}s")
+    imprimir_intervalos(resultados, args.nivel)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Análisis de los comentarios abiertos del Cuestionario Likert
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Para cada pregunta abierta (me_gusta, no_gusta, funcionalidades_nuevas,
+mejoras_sugeridas, otras_observaciones):
+  - separa el texto en palabras en español (minúsculas, sin tildes pero
+    conservando la ñ, sin palabras vacías) y forma bigramas
+  - informa las palabras y bigramas más frecuentes
+  - construye la matriz TF-IDF dispersa (CSR en NumPy) de los
+    comentarios y los agrupa por temas con k-medias por mini-lotes
+    sobre vectores normalizados (similitud coseno)
+
+Los comentarios se leen por bloques desde el almacén columnar o la base
+SQLite, sin cargarlos todos en memoria. El vocabulario (frecuencias de
+documento de cada término) se guarda en la caché de disco junto con el
+número de respuestas leídas y el id (o la fecha) de la última: en la
+siguiente ejecución solo se procesan las respuestas nuevas, y si la
+fuente ya no tiene esas mismas respuestas se vuelve a contar todo.
+
+Uso:
+    python mineria_comentarios.py --almacen campana_2025
+    python mineria_comentarios.py --db respuestas.sqlite3 --campo mejoras_sugeridas --grupos 6
+    python mineria_comentarios.py --sintetico 500000
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import pickle
+import re
+import sqlite3
+import time
+from collections import Counter
+
+import numpy as np
+
+from esquema_cuestionario import CACHE_DIR, cargar_esquema
+
+# Incrementar al cambiar la tokenización (invalida los vocabularios en caché)
+VERSION_VOCABULARIO = 2
+
+BLOQUE_COMENTARIOS = 20_000
+MINIMO_DOCUMENTOS = 2
+MAXIMO_TERMINOS = 20_000
+GRUPOS = 8
+TAMANO_LOTE = 2048
+ITERACIONES = 200
+
+# Tildes y diéresis fuera; la ñ se conserva
+SIN_TILDES = str.maketrans('áéíóúüàèìòù', 'aeiouuaeiou')
+PATRON_PALABRA = re.compile(r'[a-zñ]+')
+
+PALABRAS_VACIAS = frozenset("""
+a al algo algun alguna algunas alguno algunos ante antes asi aun aunque bien cada casi como con contra
+cual cuales cuando de del desde donde dos el ella ellas ello ellos en entre era eran es esa esas ese eso
+esos esta estaba estado estan estar estas este esto estos etc fue fueron ha hace hacer hacia han hasta hay
+la las le les lo los mas me mi mis mismo mucho muchos muy nada ni no nos nosotros nuestro nuestra o otra
+otras otro otros para pero poco por porque puede pueden que quien se sea ser si sido sin sobre solo son
+su sus tambien tan tanto te tener tiene tienen todo todos tu tus un una unas uno unos usted ustedes ya yo
+""".split())
+
+def tokenizar(texto):
+    """Palabras de un comentario: minúsculas, sin tildes (salvo la ñ) y sin palabras vacías"""
+    palabras = PATRON_PALABRA.findall(texto.casefold().translate(SIN_TILDES))
+    return [p for p in palabras if len(p) > 2 and p not in PALABRAS_VACIAS]
+
+def terminos(palabras):
+    """Palabras y bigramas de palabras consecutivas (ya sin palabras vacías)"""
+    return palabras + [f'{a} {b}' for a, b in zip(palabras, palabras[1:])]
+
+class Vocabulario:
+    """Frecuencias de término y de documento, actualizables con respuestas nuevas"""
+
+    def __init__(self):
+        self.version = VERSION_VOCABULARIO
+        self.filas = 0
+        self.marca = None
+        self.documentos = 0
+        self.frecuencia = Counter()
+        self.documentos_termino = Counter()
+
+    def actualizar(self, textos):
+        """Contar los términos de los textos (una fila por respuesta; '' = sin comentario)"""
+        for texto in textos:
+            self.filas += 1
+            palabras = tokenizar(texto) if texto else None
+            if not palabras:
+                continue
+            encontrados = terminos(palabras)
+            self.frecuencia.update(encontrados)
+            self.documentos_termino.update(set(encontrados))
+            self.documentos += 1
+
+    def mas_frecuentes(self, cantidad=15, bigramas=False):
+        """Términos más frecuentes: palabras o bigramas"""
+        return [(t, c) for t, c in self.frecuencia.most_common() if (' ' in t) == bigramas][:cantidad]
+
+    def indice(self, minimo_documentos=MINIMO_DOCUMENTOS, maximo_terminos=MAXIMO_TERMINOS):
+        """Términos retenidos, {término: columna} e IDF suavizado de cada columna"""
+        candidatos = [(c, t) for t, c in self.documentos_termino.items() if c >= minimo_documentos]
+        candidatos.sort(key=lambda par: (-par[0], par[1]))
+        retenidos = [t for _, t in candidatos[:maximo_terminos]]
+        documentos = np.array([self.documentos_termino[t] for t in retenidos], dtype=np.float64)
+        idf = np.log((1 + self.documentos) / (1 + documentos)) + 1
+        return retenidos, {t: j for j, t in enumerate(retenidos)}, idf
+
+    def guardar(self, ruta):
+        """Guardar en disco (reemplazo atómico)"""
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        temporal = f'{ruta}.{os.getpid()}.tmp'
+        with open(temporal, 'wb') as f:
+            pickle.dump(vars(self), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, ruta)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Vocabulario guardado, o None si no existe o es de otra versión"""
+        try:
+            with open(ruta, 'rb') as f:
+                estado = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        if not isinstance(estado, dict) or estado.get('version') != VERSION_VOCABULARIO:
+            return None
+        vocabulario = cls()
+        vars(vocabulario).update(estado)
+        return vocabulario
+
+def ruta_cache_vocabulario(origen, campo):
+    """Ruta del vocabulario de un campo de un origen de respuestas en la caché de disco"""
+    clave = json.dumps([os.path.abspath(origen), campo, VERSION_VOCABULARIO])
+    return os.path.join(CACHE_DIR, 'comentarios', f'{hashlib.sha256(clave.encode()).hexdigest()}.pkl')
+
+class MatrizDispersa:
+    """Matriz CSR (indptr, indices, datos) con lo necesario para TF-IDF y k-medias"""
+
+    def __init__(self, indptr, indices, datos, columnas):
+        self.indptr = indptr
+        self.indices = indices
+        self.datos = datos
+        self.columnas = columnas
+
+    @property
+    def filas(self):
+        return len(self.indptr) - 1
+
+    def submatriz(self, filas):
+        """Filas seleccionadas (en ese orden) como una nueva matriz CSR"""
+        inicios = self.indptr[filas]
+        largos = self.indptr[np.asarray(filas) + 1] - inicios
+        indptr = np.concatenate([[0], np.cumsum(largos)])
+        # Posición de cada no nulo: inicio de su fila + desplazamiento dentro de ella
+        posiciones = np.repeat(inicios - indptr[:-1], largos) + np.arange(indptr[-1])
+        return MatrizDispersa(indptr, self.indices[posiciones], self.datos[posiciones], self.columnas)
+
+    def tramo(self, inicio, fin):
+        """Filas [inicio, fin) sin copiar los no nulos"""
+        a, b = self.indptr[inicio], self.indptr[fin]
+        return MatrizDispersa(self.indptr[inicio:fin + 1] - a, self.indices[a:b], self.datos[a:b], self.columnas)
+
+    def producto(self, densa):
+        """self @ densa, con densa de columnas × k"""
+        contribucion = self.datos[:, None] * densa[self.indices]
+        # Suma por fila como diferencia de acumulados (admite filas vacías)
+        acumulado = np.zeros((len(contribucion) + 1, densa.shape[1]))
+        np.cumsum(contribucion, axis=0, out=acumulado[1:])
+        return acumulado[self.indptr[1:]] - acumulado[self.indptr[:-1]]
+
+def construir_tfidf(textos, indice, idf, bloque=BLOQUE_COMENTARIOS):
+    """Matriz TF-IDF (filas normalizadas L2) de los comentarios no vacíos y la fila de origen de cada uno"""
+    partes_indices, partes_datos, partes_largos, partes_filas = [], [], [], []
+    textos = iter(textos)
+    fila = 0
+    while True:
+        tramo = list(itertools.islice(textos, bloque))
+        if not tramo:
+            break
+        documentos, columnas, filas_origen = [], [], []
+        for desplazamiento, texto in enumerate(tramo):
+            ids = [indice[t] for t in terminos(tokenizar(texto)) if t in indice] if texto else None
+            if ids:
+                documentos.extend([len(filas_origen)] * len(ids))
+                columnas.extend(ids)
+                filas_origen.append(fila + desplazamiento)
+        fila += len(tramo)
+        if not filas_origen:
+            continue
+        # Conteo (documento, término) con un solo np.unique sobre el código combinado
+        codigos, tf = np.unique(np.array(documentos, dtype=np.int64) * len(idf) + np.array(columnas),
+                                return_counts=True)
+        doc, col = np.divmod(codigos, len(idf))
+        peso = tf * idf[col]
+        norma = np.sqrt(np.bincount(doc, weights=peso ** 2, minlength=len(filas_origen)))
+        partes_indices.append(col.astype(np.int32))
+        partes_datos.append((peso / norma[doc]).astype(np.float32))
+        partes_largos.append(np.bincount(doc, minlength=len(filas_origen)))
+        partes_filas.append(np.array(filas_origen, dtype=np.int64))
+
+    if not partes_filas:
+        vacia = MatrizDispersa(np.zeros(1, dtype=np.int64), np.zeros(0, np.int32), np.zeros(0, np.float32), len(idf))
+        return vacia, np.zeros(0, dtype=np.int64)
+    indptr = np.concatenate([[0], np.cumsum(np.concatenate(partes_largos))])
+    matriz = MatrizDispersa(indptr, np.concatenate(partes_indices), np.concatenate(partes_datos), len(idf))
+    return matriz, np.concatenate(partes_filas)
+
+def _normalizar_filas(centroides):
+    normas = np.linalg.norm(centroides, axis=1, keepdims=True)
+    return np.divide(centroides, normas, out=np.zeros_like(centroides), where=normas > 0)
+
+def iniciar_centroides(matriz, grupos, rng, muestra=4096):
+    """k-means++ sobre una muestra de comentarios"""
+    candidatos = matriz.submatriz(rng.choice(matriz.filas, min(muestra, matriz.filas), replace=False))
+    centroides = np.zeros((grupos, matriz.columnas))
+    distancia = np.ones(candidatos.filas)
+    for g in range(grupos):
+        probabilidad = distancia / distancia.sum() if distancia.sum() > 0 else None
+        elegido = candidatos.submatriz([rng.choice(candidatos.filas, p=probabilidad)])
+        centroides[g, elegido.indices] = elegido.datos
+        # Distancia coseno al centroide más cercano elegido hasta ahora
+        distancia = np.minimum(distancia, np.clip(1 - candidatos.producto(centroides[g:g + 1].T)[:, 0], 0, None))
+    return centroides
+
+def kmedias_minilotes(matriz, grupos=GRUPOS, lote=TAMANO_LOTE, iteraciones=ITERACIONES, semilla=0,
+                      tolerancia=1e-4):
+    """Centroides (normalizados) y grupo de cada fila con k-medias por mini-lotes (Sculley, 2010)"""
+    rng = np.random.default_rng(semilla)
+    grupos = min(grupos, matriz.filas)
+    centroides = iniciar_centroides(matriz, grupos, rng)
+    conteos = np.zeros(grupos)
+    for _ in range(iteraciones):
+        muestra = matriz.submatriz(rng.integers(0, matriz.filas, min(lote, matriz.filas)))
+        asignacion = muestra.producto(centroides.T).argmax(axis=1)
+        # Suma de los vectores asignados a cada grupo con un bincount sobre (grupo, término)
+        fila_de = np.repeat(asignacion, np.diff(muestra.indptr))
+        sumas = np.bincount(fila_de * matriz.columnas + muestra.indices, weights=muestra.datos,
+                            minlength=grupos * matriz.columnas).reshape(grupos, matriz.columnas)
+        en_lote = np.bincount(asignacion, minlength=grupos)
+        conteos += en_lote
+        # Tasa de aprendizaje por centro: 1 / comentarios vistos por ese centro
+        tasa = np.divide(en_lote, conteos, out=np.zeros(grupos), where=conteos > 0)
+        media_lote = np.divide(sumas, en_lote[:, None], out=np.zeros_like(sumas), where=en_lote[:, None] > 0)
+        nuevos = _normalizar_filas(centroides + tasa[:, None] * (media_lote - centroides) * (en_lote[:, None] > 0))
+        cambio = np.abs(nuevos - centroides).max()
+        centroides = nuevos
+        if cambio < tolerancia:
+            break
+
+    asignacion = np.empty(matriz.filas, dtype=np.int32)
+    similitud = np.empty(matriz.filas)
+    for inicio in range(0, matriz.filas, BLOQUE_COMENTARIOS):
+        fin = min(inicio + BLOQUE_COMENTARIOS, matriz.filas)
+        s = matriz.tramo(inicio, fin).producto(centroides.T)
+        asignacion[inicio:fin] = s.argmax(axis=1)
+        similitud[inicio:fin] = s.max(axis=1)
+    return centroides, asignacion, similitud
+
+class FuenteAlmacen:
+    """Comentarios de un almacén columnar"""
+
+    def __init__(self, directorio):
+        from almacen_columnar import AlmacenColumnar
+        self.origen = directorio
+        self.almacen = AlmacenColumnar(directorio)
+
+    def contar(self):
+        return self.almacen.filas
+
+    def marca(self, filas):
+        """Identidad de las primeras `filas` respuestas: cantidad y fecha de la última"""
+        return [filas, float(self.almacen.recibido()[filas - 1])] if filas else [0, None]
+
+    def textos(self, campo, inicio=0):
+        return self.almacen.iterar_textos(campo, inicio)
+
+    def texto(self, campo, fila):
+        return self.almacen.texto(campo, fila)
+
+class FuenteSqlite:
+    """Comentarios guardados por servicio_respuestas.py"""
+
+    def __init__(self, ruta):
+        self.origen = ruta
+
+    def _consultar(self, sql, *parametros):
+        conexion = sqlite3.connect(self.origen)
+        try:
+            yield from conexion.execute(sql, parametros)
+        finally:
+            conexion.close()
+
+    def contar(self):
+        return next(self._consultar('SELECT COUNT(*) FROM respuestas'))[0]
+
+    def marca(self, filas):
+        """Identidad de las primeras `filas` respuestas: cantidad e id de la última"""
+        if not filas:
+            return [0, None]
+        fila = next(self._consultar('SELECT id FROM respuestas ORDER BY recibido, id LIMIT 1 OFFSET ?', filas - 1), None)
+        return [filas, fila[0] if fila else None]
+
+    def textos(self, campo, inicio=0):
+        # El id desempata las respuestas recibidas en el mismo instante: el orden es estable entre ejecuciones
+        for (datos,) in self._consultar('SELECT datos FROM respuestas ORDER BY recibido, id LIMIT -1 OFFSET ?', inicio):
+            yield json.loads(datos).get(campo, '')
+
+    def texto(self, campo, fila):
+        return next(self.textos(campo, fila), '')
+
+class FuenteSintetica:
+    """Comentarios generados con frases de ejemplo por tema"""
+
+    TEMAS = [
+        ('el sistema es lento', 'las búsquedas tardan demasiado', 'los reportes se demoran mucho',
+         'la página carga lento en las mañanas'),
+        ('me gusta el diseño', 'la interfaz es clara y ordenada', 'los colores son agradables',
+         'el diseño es moderno'),
+        ('agregar reportes de ventas por sucursal', 'exportar reportes a Excel',
+         'reportes de inventario más detallados', 'gráficos en los reportes'),
+        ('la gestión de inventario es muy útil', 'el control de stock ahorra tiempo',
+         'las alertas de inventario bajo funcionan bien', 'el inventario siempre está al día'),
+        ('capacitación para los usuarios nuevos', 'un manual de usuario en español',
+         'más capacitación sobre el módulo de compras', 'videos de capacitación cortos'),
+    ]
+
+    def __init__(self, total, semilla=0):
+        self.origen = None
+        self.total = total
+        self.semilla = semilla
+
+    def contar(self):
+        return self.total
+
+    def textos(self, campo, inicio=0):
+        rng = np.random.default_rng(self.semilla)
+        temas = rng.integers(0, len(self.TEMAS), self.total)
+        frases = rng.integers(0, 4, (self.total, 2))
+        vacios = rng.random(self.total) < 0.3
+        for fila in range(inicio, self.total):
+            if vacios[fila]:
+                yield ''
+            else:
+                tema = self.TEMAS[temas[fila]]
+                yield f'{tema[frases[fila, 0]].capitalize()}, y también {tema[frases[fila, 1]]}.'
+
+    def texto(self, campo, fila):
+        return next(self.textos(campo, fila), '')
+
+def vocabulario_actualizado(fuente, campo, usar_cache=True):
+    """Vocabulario del campo: el de la caché más las respuestas nuevas de la fuente"""
+    ruta = ruta_cache_vocabulario(fuente.origen, campo) if usar_cache and fuente.origen else None
+    vocabulario = Vocabulario.cargar(ruta) if ruta else None
+    total = fuente.contar()
+    # La caché vale si la fuente aún tiene las mismas filas leídas (misma cantidad y última fila);
+    # si la base se reemplazó o se borraron respuestas se vuelve a contar desde cero
+    if vocabulario is None or vocabulario.filas > total or vocabulario.marca != fuente.marca(vocabulario.filas):
+        vocabulario = Vocabulario()
+    nuevas = total - vocabulario.filas
+    if nuevas:
+        vocabulario.actualizar(itertools.islice(fuente.textos(campo, vocabulario.filas), nuevas))
+        if ruta:
+            vocabulario.marca = fuente.marca(vocabulario.filas)
+            vocabulario.guardar(ruta)
+    return vocabulario, nuevas
+
+def analizar_campo(fuente, campo, grupos=GRUPOS, semilla=0, usar_cache=True):
+    """Frecuencias, matriz TF-IDF y temas de un campo de comentarios"""
+    vocabulario, nuevas = vocabulario_actualizado(fuente, campo, usar_cache)
+    retenidos, indice, idf = vocabulario.indice()
+    resultado = {
+        'campo': campo,
+        'respuestas': vocabulario.filas,
+        'nuevas': nuevas,
+        'documentos': vocabulario.documentos,
+        'palabras': vocabulario.mas_frecuentes(),
+        'bigramas': vocabulario.mas_frecuentes(bigramas=True),
+        'temas': [],
+    }
+    if not retenidos:
+        return resultado
+
+    matriz, filas = construir_tfidf(itertools.islice(fuente.textos(campo), vocabulario.filas), indice, idf)
+    if not matriz.filas:
+        return resultado
+    centroides, asignacion, similitud = kmedias_minilotes(matriz, grupos, semilla=semilla)
+    tamanos = np.bincount(asignacion, minlength=len(centroides))
+    for g in np.argsort(-tamanos):
+        if not tamanos[g]:
+            continue
+        miembros = np.flatnonzero(asignacion == g)
+        representativo = filas[miembros[similitud[miembros].argmax()]]
+        resultado['temas'].append({
+            'comentarios': int(tamanos[g]),
+            'terminos': [retenidos[j] for j in np.argsort(-centroides[g])[:6] if centroides[g, j] > 0],
+            'ejemplo': fuente.texto(campo, int(representativo)),
+        })
+    return resultado
+
+def imprimir_resultado(resultado):
+    """Frecuencias y temas de un campo"""
+    print()
+    print(f"💬 {resultado['campo']}: {resultado['documentos']} comentarios en {resultado['respuestas']} respuestas"
+          f" ({resultado['nuevas']} nuevas)")
+    if not resultado['documentos']:
+        return
+    print("   🔤 Palabras: " + ', '.join(f'{t} ({c})' for t, c in resultado['palabras']))
+    if resultado['bigramas']:
+        print("   🔗 Bigramas: " + ', '.join(f'{t} ({c})' for t, c in resultado['bigramas']))
+    for tema in resultado['temas']:
+        proporcion = tema['comentarios'] / resultado['documentos']
+        print(f"   📌 {tema['comentarios']:>8} ({proporcion:.1%})  {', '.join(tema['terminos'])}")
+        print(f"      «{tema['ejemplo']}»")
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Palabras frecuentes y temas de los comentarios abiertos')
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument('--almacen', help='Directorio del almacén columnar')
+    grupo.add_argument('--db', help='Base SQLite de servicio_respuestas.py')
+    grupo.add_argument('--sintetico', type=int, metavar='N', help='Medir con N comentarios generados')
+    parser.add_argument('--campo', action='append', help='Pregunta abierta a analizar (por defecto: todas)')
+    parser.add_argument('--grupos', type=int, default=GRUPOS, help='Cantidad de temas')
+    parser.add_argument('--sin-cache', action='store_true', help='Recalcular el vocabulario desde cero')
+    args = parser.parse_args()
+
+    campos = [name for _, name in cargar_esquema()['comentarios']]
+    if args.almacen:
+        fuente = FuenteAlmacen(args.almacen)
+    elif args.db:
+        fuente = FuenteSqlite(args.db)
+    else:
+        fuente = FuenteSintetica(args.sintetico)
+        campos = campos[:1]
+    for campo in args.campo or []:
+        if campo not in campos:
+            parser.error(f"--campo debe ser uno de: {', '.join(campos)}")
+
+    for campo in args.campo or campos:
+        inicio = time.perf_counter()
+        resultado = analizar_campo(fuente, campo, args.grupos, usar_cache=not args.sin_cache)
+        imprimir_resultado(resultado)
+        print(f"   ⏱️ {time.perf_counter() - inicio:.2f}s")
+
+if __name__ == "__main__":
+    main()
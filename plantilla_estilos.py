@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Plantilla de estilos compartida por los generadores Word
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Define una sola vez los estilos propios de los documentos (CustomTitle,
+CustomSubtitle, CodeStyle y Checkbox) sobre el documento por defecto de
+python-docx y guarda el resultado en la caché (CACHE_DIR). Cada
+generador abre esa plantilla como documento base en lugar de crear los
+estilos en cada ejecución, así todos comparten exactamente el mismo
+formato.
+
+La plantilla se guarda como .docx (python-docx no abre .dotx) y su
+nombre incluye VERSION_ESTILOS y las versiones de las bibliotecas:
+cambiar un estilo requiere subir VERSION_ESTILOS.
+
+Uso:
+    from plantilla_estilos import documento_base
+    doc = documento_base()
+"""
+
+import hashlib
+import io
+import json
+import os
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Inches, Pt, RGBColor
+
+from cache_construccion import versiones_bibliotecas
+from esquema_cuestionario import CACHE_DIR
+
+VERSION_ESTILOS = 1
+
+COLOR_CORPORATIVO = RGBColor(102, 126, 234)  # Azul corporativo
+
+# Contenido de la plantilla leído en este proceso
+_contenido = None
+
+def definir_estilos(doc):
+    """Agregar los estilos propios de los documentos de LogicQP"""
+    styles = doc.styles
+
+    # Estilo para títulos principales
+    title_style = styles.add_style('CustomTitle', WD_STYLE_TYPE.PARAGRAPH)
+    title_font = title_style.font
+    title_font.name = 'Calibri'
+    title_font.size = Pt(18)
+    title_font.bold = True
+    title_font.color.rgb = COLOR_CORPORATIVO
+    title_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    title_style.paragraph_format.space_after = Pt(12)
+
+    # Estilo para subtítulos
+    subtitle_style = styles.add_style('CustomSubtitle', WD_STYLE_TYPE.PARAGRAPH)
+    subtitle_font = subtitle_style.font
+    subtitle_font.name = 'Calibri'
+    subtitle_font.size = Pt(14)
+    subtitle_font.bold = True
+    subtitle_font.color.rgb = COLOR_CORPORATIVO
+    subtitle_style.paragraph_format.space_before = Pt(12)
+    subtitle_style.paragraph_format.space_after = Pt(6)
+
+    # Estilo para código
+    code_style = styles.add_style('CodeStyle', WD_STYLE_TYPE.PARAGRAPH)
+    code_font = code_style.font
+    code_font.name = 'Consolas'
+    code_font.size = Pt(10)
+    code_style.paragraph_format.left_indent = Inches(0.5)
+    code_style.paragraph_format.right_indent = Inches(0.5)
+    code_style.paragraph_format.space_before = Pt(6)
+    code_style.paragraph_format.space_after = Pt(6)
+
+    # Estilo para checkboxes
+    checkbox_style = styles.add_style('Checkbox', WD_STYLE_TYPE.PARAGRAPH)
+    checkbox_style.font.name = 'Arial'
+    checkbox_style.font.size = Pt(11)
+
+def ruta_plantilla():
+    """Ruta de la plantilla en la caché para esta versión de estilos y de bibliotecas"""
+    contenido = json.dumps({'version': VERSION_ESTILOS, 'bibliotecas': versiones_bibliotecas()}, sort_keys=True)
+    huella = hashlib.sha256(contenido.encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, f'estilos_v{VERSION_ESTILOS}_{huella[:16]}.docx')
+
+def contenido_plantilla():
+    """Bytes de la plantilla (se genera una vez y luego se lee de la caché)"""
+    global _contenido
+    if _contenido is not None:
+        return _contenido
+    ruta = ruta_plantilla()
+    try:
+        with open(ruta, 'rb') as f:
+            _contenido = f.read()
+    except OSError:
+        doc = Document()
+        definir_estilos(doc)
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        _contenido = buffer.getvalue()
+        try:
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+            temporal = f'{ruta}.{os.getpid()}.tmp'
+            with open(temporal, 'wb') as f:
+                f.write(_contenido)
+            os.replace(temporal, ruta)
+        except OSError:
+            pass  # Sin caché escribible: la plantilla se usa solo en memoria
+    return _contenido
+
+def documento_base():
+    """Documento vacío con los estilos de LogicQP"""
+    return Document(io.BytesIO(contenido_plantilla()))
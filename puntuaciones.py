@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor vectorizado de puntuaciones del Cuestionario Likert
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Carga las respuestas en una matriz encuestado × ítem (uint8, 0 = sin
+respuesta) y calcula con NumPy las mismas puntuaciones que
+calculateScores() en el navegador: la media de cada compuesto del
+esquema (usabilidad, eficiencia, satisfacción) y el total. Los ítems
+redactados en negativo (polaridad -1 en el esquema) se invierten antes
+de promediar (1 <-> 5), con una tabla de búsqueda sobre toda la matriz.
+
+Para coincidir exactamente con el JavaScript, que redondea con
+toFixed(2), las puntuaciones se calculan en centésimas:
+  - compuesto = media de los ítems respondidos, redondeada al centésimo
+    con empates hacia arriba (aritmética entera); 0 si no se respondió
+    ninguno
+  - total = suma en coma flotante de los compuestos ya redondeados,
+    dividida por su cantidad y redondeada como toFixed(2)
+
+Uso:
+    python puntuaciones.py --db respuestas.sqlite3
+    python puntuaciones.py --almacen campana_2025
+    python puntuaciones.py --sintetico 1000000
+    python puntuaciones.py --verificar-paridad 20000
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from esquema_cuestionario import ESCALA_LIKERT, cargar_esquema
+
+# Filas procesadas por bloque (acota la memoria temporal)
+BLOQUE_FILAS = 1 << 16
+
+# Fila 0: ítem directo; fila 1: ítem invertido. El 0 (sin respuesta) se conserva
+TABLA_ORIENTACION = np.array([
+    [0, *ESCALA_LIKERT],
+    [0, *reversed(ESCALA_LIKERT)],
+], dtype=np.uint8)
+
+# Umbrales de showScoreSummary() en centésimas
+CATEGORIAS = [
+    (450, '🌟 Excelente'),
+    (350, '👍 Bueno'),
+    (250, '👌 Regular'),
+    (150, '⚠️ Malo'),
+    (0, '❌ Muy malo'),
+]
+
+def columnas_compuesto(nombre, esquema=None):
+    """Índices de columna de los ítems que forman un compuesto"""
+    esquema = esquema or cargar_esquema()
+    columnas = []
+    for key in esquema['compuestos'][nombre]:
+        inicio, fin = esquema['grupo_rango'][key]
+        columnas.extend(range(inicio, fin))
+    return np.array(columnas, dtype=np.intp)
+
+def invertidos_en(columnas, esquema):
+    """Máscara de ítems invertidos para las columnas indicadas"""
+    return np.array(esquema['item_polaridad'], dtype=np.int8)[columnas] < 0
+
+def orientar(matriz, esquema=None, columnas=None):
+    """Copia de la matriz (o de sus `columnas`) con los ítems invertidos ya dados vuelta"""
+    esquema = esquema or cargar_esquema()
+    columnas = np.arange(len(esquema['items'])) if columnas is None else columnas
+    valores = np.asarray(matriz)[:, columnas]
+    # Sin ramas por fila: cada celda se busca en la fila de la tabla que le corresponde a su columna
+    return TABLA_ORIENTACION[invertidos_en(columnas, esquema).astype(np.intp), valores]
+
+def matriz_respuestas(respuestas, esquema=None):
+    """Matriz encuestado × ítem (uint8, 0 = sin respuesta) a partir de objetos `data`"""
+    esquema = esquema or cargar_esquema()
+    items = esquema['items']
+    # Igual que `if (value)` en el navegador: valores vacíos cuentan como sin respuesta
+    filas = [bytes(int(r.get(item) or 0) for item in items) for r in respuestas]
+    matriz = np.frombuffer(b''.join(filas), dtype=np.uint8).reshape(len(filas), len(items))
+    if matriz.size and matriz.max() > 5:
+        raise ValueError("La matriz contiene valores fuera de la escala Likert")
+    return matriz
+
+def leer_respuestas_sqlite(ruta):
+    """Objetos `data` guardados por servicio_respuestas.py"""
+    conexion = sqlite3.connect(ruta)
+    try:
+        for (datos,) in conexion.execute('SELECT datos FROM respuestas ORDER BY recibido'):
+            yield json.loads(datos)
+    finally:
+        conexion.close()
+
+def centesimas_tofixed(x):
+    """Centésimas que produce Number.prototype.toFixed(2) para cada double x >= 0"""
+    # x * 100 exacto como p + error (Dekker): 100 tiene 7 bits, así que alto*100 y bajo*100 son exactos
+    p = x * 100
+    alto = x * 134217729.0  # 2**27 + 1
+    alto = alto - (alto - x)
+    bajo = x - alto
+    error = (alto * 100 - p) + bajo * 100
+    # toFixed toma la centésima más cercana al valor exacto y, en un empate, la mayor
+    n = np.floor(p)
+    return (n + (p - n - 0.5 >= -error)).astype(np.int16)
+
+def puntuaciones_centesimas(matriz, esquema=None, bloque=BLOQUE_FILAS):
+    """Compuestos y total de cada encuestado, en centésimas enteras"""
+    esquema = esquema or cargar_esquema()
+    matriz = np.asarray(matriz)
+    if matriz.ndim != 2 or matriz.shape[1] != len(esquema['items']):
+        raise ValueError(f"Se esperaba una matriz de N × {len(esquema['items'])} ítems")
+
+    columnas = {name: columnas_compuesto(name, esquema) for name in esquema['compuestos']}
+    invertidos = {name: invertidos_en(cols, esquema) for name, cols in columnas.items()}
+    total_filas = matriz.shape[0]
+    resultado = {name: np.zeros(total_filas, dtype=np.int16) for name in [*columnas, 'total']}
+
+    for inicio in range(0, total_filas, bloque):
+        filas = slice(inicio, inicio + bloque)
+        suma_compuestos = 0.0
+        for name, cols in columnas.items():
+            valores = matriz[filas, cols]
+            if invertidos[name].any():
+                valores = TABLA_ORIENTACION[invertidos[name].astype(np.intp), valores]
+            suma = valores.sum(axis=1, dtype=np.int32)
+            cuenta = np.count_nonzero(valores, axis=1).astype(np.int32)
+            # round(suma / cuenta, 2) con empates hacia arriba; sin respuestas suma = 0 y da 0
+            centesimas = (200 * suma + cuenta) // np.maximum(2 * cuenta, 1)
+            resultado[name][filas] = centesimas
+            # parseFloat(scores[name]) es el double más cercano a centésimas / 100, igual que en NumPy
+            suma_compuestos = suma_compuestos + centesimas / 100
+        resultado['total'][filas] = centesimas_tofixed(suma_compuestos / len(columnas))
+
+    return resultado
+
+def puntuaciones(matriz, esquema=None):
+    """Compuestos y total de cada encuestado en la escala 1-5 (0 = sin respuestas)"""
+    return {name: valores / 100 for name, valores in puntuaciones_centesimas(matriz, esquema).items()}
+
+def valores_js(centesimas, fila):
+    """Puntuaciones de una fila con los mismos tipos que devuelve calculateScores()"""
+    scores = {}
+    for name, valores in centesimas.items():
+        valor = int(valores[fila])
+        # El navegador deja el número 0 cuando un compuesto no tiene respuestas
+        scores[name] = f'{valor / 100:.2f}' if valor or name == 'total' else 0
+    return scores
+
+def indice_categoria(centesimas_total):
+    """Posición en CATEGORIAS de la categoría de showScoreSummary() de cada total"""
+    umbrales = np.array([umbral for umbral, _ in reversed(CATEGORIAS)])
+    return len(CATEGORIAS) - np.searchsorted(umbrales, centesimas_total, side='right')
+
+class ResumenPuntuaciones:
+    """Acumulador de puntuaciones por bloques (mismo protocolo que AlmacenColumnar.agregar_columnas)"""
+
+    def __init__(self, esquema=None):
+        self.esquema = esquema or cargar_esquema()
+        self.nombres = [*self.esquema['compuestos'], 'total']
+        self.filas = 0
+        self.suma = dict.fromkeys(self.nombres, 0)
+        self.respondidos = dict.fromkeys(self.nombres, 0)
+        self.categorias = np.zeros(len(CATEGORIAS), dtype=np.int64)
+
+    def agregar_columnas(self, likert, categoricos=None, textos=None, recibido=None, duracion=None):
+        centesimas = puntuaciones_centesimas(likert, self.esquema)
+        self.filas += len(centesimas['total'])
+        for name, valores in centesimas.items():
+            self.suma[name] += int(valores.sum(dtype=np.int64))
+            self.respondidos[name] += int(np.count_nonzero(valores))
+        self.categorias += np.bincount(indice_categoria(centesimas['total']), minlength=len(CATEGORIAS))
+        return len(centesimas['total'])
+
+    def medias(self):
+        """Media de cada puntuación entre los encuestados con respuestas"""
+        return {name: self.suma[name] / self.respondidos[name] / 100 if self.respondidos[name] else 0
+                for name in self.nombres}
+
+    def imprimir(self):
+        """Medias por compuesto y distribución de categorías"""
+        print(f"📊 Encuestados: {self.filas}")
+        if not self.filas:
+            return
+        for name, media in self.medias().items():
+            print(f"   {name:<14} media {media:.2f}/5 ({self.respondidos[name]} con respuestas)")
+        for (_, etiqueta), cantidad in zip(CATEGORIAS, self.categorias):
+            print(f"   {etiqueta:<14} {cantidad:>9} ({cantidad / self.filas:.1%})")
+
+def matriz_sintetica(total, semilla=0, esquema=None):
+    """Respuestas aleatorias con una proporción variable de ítems sin responder"""
+    esquema = esquema or cargar_esquema()
+    rng = np.random.default_rng(semilla)
+    matriz = rng.integers(1, 6, size=(total, len(esquema['items'])), dtype=np.uint8)
+    faltantes = rng.random(matriz.shape, dtype=np.float32) < rng.random((total, 1), dtype=np.float32)
+    matriz[faltantes] = 0
+    return matriz
+
+def verificar_paridad(total=20_000, semilla=1, node='node', esquema=None):
+    """Comparar las puntuaciones con calculateScores() ejecutado en Node.js; devuelve las diferencias"""
+    import generar_cuestionario_digital as gcd
+    esquema = esquema or cargar_esquema()
+    matriz = matriz_sintetica(total, semilla, esquema)
+    centesimas = puntuaciones_centesimas(matriz, esquema)
+    items = esquema['items']
+
+    # El mismo código que se publica en el HTML, generado desde el mismo esquema
+    script = gcd.generate_calculate_scores(esquema) + """
+const respuestas = JSON.parse(require('fs').readFileSync(0, 'utf-8'));
+process.stdout.write(JSON.stringify(respuestas.map(calculateScores)));
+"""
+    # FormData entrega los valores como texto y omite los ítems sin marcar
+    datos = [{item: str(v) for item, v in zip(items, fila.tolist()) if v} for fila in matriz]
+    with tempfile.NamedTemporaryFile('w', suffix='.js', delete=False, encoding='utf-8') as f:
+        f.write(script)
+    try:
+        salida = subprocess.run([node, f.name], input=json.dumps(datos), capture_output=True,
+                                text=True, check=True).stdout
+    finally:
+        os.unlink(f.name)
+
+    diferencias = []
+    for fila, esperado in enumerate(json.loads(salida)):
+        obtenido = valores_js(centesimas, fila)
+        if obtenido != esperado:
+            diferencias.append((fila, esperado, obtenido))
+    return diferencias
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Puntuaciones vectorizadas del cuestionario Likert')
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument('--db', help='Base SQLite de servicio_respuestas.py')
+    grupo.add_argument('--almacen', help='Directorio de un almacén columnar (almacen_columnar.py)')
+    grupo.add_argument('--sintetico', type=int, metavar='N', help='Medir con N respuestas aleatorias')
+    grupo.add_argument('--verificar-paridad', type=int, metavar='N',
+                       help='Comparar N respuestas aleatorias con calculateScores() en Node.js')
+    args = parser.parse_args()
+
+    esquema = cargar_esquema()
+
+    if args.verificar_paridad:
+        variantes = {
+            'compuestos publicados': esquema,
+            # Compuesto adicional que mezcla ítems directos e invertidos para probar la inversión
+            'con ítems invertidos': dict(esquema, compuestos=dict(
+                esquema['compuestos'], problemas=('problemas', 'mejoras', 'impacto'))),
+        }
+        fallidas = 0
+        for nombre, variante in variantes.items():
+            print(f"🚀 Verificando paridad con calculateScores(), {nombre} ({args.verificar_paridad} respuestas)...")
+            diferencias = verificar_paridad(args.verificar_paridad, esquema=variante)
+            for fila, esperado, obtenido in diferencias[:10]:
+                print(f"❌ Fila {fila}: JS {esperado} / Python {obtenido}")
+            if diferencias:
+                print(f"❌ {len(diferencias)} respuestas con puntuaciones distintas")
+                fallidas += 1
+            else:
+                print("✅ Todas las puntuaciones coinciden con el navegador")
+        if fallidas:
+            sys.exit(1)
+        return
+
+    if args.sintetico:
+        print(f"🚀 Generando {args.sintetico} respuestas sintéticas...")
+        matriz = matriz_sintetica(args.sintetico, esquema=esquema)
+    elif args.almacen:
+        from almacen_columnar import AlmacenColumnar
+        print(f"🚀 Cargando respuestas de {args.almacen}...")
+        matriz = AlmacenColumnar(args.almacen, esquema).matriz()
+    else:
+        print(f"🚀 Cargando respuestas de {args.db}...")
+        matriz = matriz_respuestas(leer_respuestas_sqlite(args.db), esquema)
+
+    inicio = time.perf_counter()
+    resumen = ResumenPuntuaciones(esquema)
+    resumen.agregar_columnas(matriz)
+    duracion = time.perf_counter() - inicio
+    print(f"⏱️ Puntuaciones calculadas en {duracion:.3f}s")
+    resumen.imprimir()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Servicio local de recepción de respuestas del Cuestionario Digital
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Servidor HTTP mínimo sobre asyncio que recibe el objeto `data` enviado
+por submitForm(), lo valida contra el esquema del cuestionario y lo
+encola. Una única tarea escritora agrupa las respuestas pendientes y las
+confirma en lote (una transacción por lote) en SQLite o en cualquier
+base DB-API compatible con PostgreSQL. Cada petición recibe su respuesta
+HTTP cuando el lote que la contiene queda confirmado. Los agregados por
+ítem y sección (agregados_en_linea.py) se actualizan con cada lote,
+sin las respuestas que no pasan el control de calidad, y se consultan en
+GET /resultados.
+
+Uso:
+    python servicio_respuestas.py --puerto 8765 --db respuestas.sqlite3
+    python servicio_respuestas.py --puerto 8765 --columnar campana_2025
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from agregados_en_linea import AgregadosEnLinea
+from calidad_respuestas import validar_tiempos
+from esquema_cuestionario import ESCALA_LIKERT, cargar_esquema
+
+PUERTO_POR_DEFECTO = 8765
+RUTA_RESPUESTAS = '/respuestas'
+TAMANO_MAXIMO_CUERPO = 1 << 20
+LARGO_MAXIMO_COMENTARIO = 5000
+
+# Campos calculados por el navegador que se aceptan pero no se guardan
+CAMPOS_IGNORADOS = ('scores',)
+
+ESTADOS_HTTP = {
+    200: 'OK',
+    201: 'Created',
+    204: 'No Content',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    422: 'Unprocessable Entity',
+    503: 'Service Unavailable',
+}
+
+class RespuestaInvalida(ValueError):
+    """Respuesta que no cumple el esquema del cuestionario (HTTP 422)"""
+
+def validar_respuesta(payload, esquema=None):
+    """Validar y normalizar una respuesta; lanza RespuestaInvalida si no es válida"""
+    esquema = esquema or cargar_esquema()
+    if not isinstance(payload, dict):
+        raise RespuestaInvalida("La respuesta debe ser un objeto JSON")
+
+    comentarios = {name for _, name in esquema['comentarios']}
+    datos = {}
+    for key, value in payload.items():
+        if key in CAMPOS_IGNORADOS:
+            continue
+        if isinstance(value, list):
+            raise RespuestaInvalida(f"El campo '{key}' tiene varios valores")
+
+        if key in esquema['indice']:
+            # Solo enteros (no bool ni decimales como 3.9) o texto de dígitos
+            if isinstance(value, int) and not isinstance(value, bool):
+                valor = value
+            elif isinstance(value, str) and value.strip().isascii() and value.strip().isdigit():
+                valor = int(value)
+            else:
+                raise RespuestaInvalida(f"Valor Likert no entero en '{key}': {value!r}")
+            if valor not in ESCALA_LIKERT:
+                raise RespuestaInvalida(f"Valor Likert fuera de escala en '{key}': {valor}")
+            datos[key] = valor
+        elif key in comentarios:
+            if not isinstance(value, str):
+                raise RespuestaInvalida(f"El comentario '{key}' debe ser texto")
+            if len(value) > LARGO_MAXIMO_COMENTARIO:
+                raise RespuestaInvalida(f"El comentario '{key}' supera {LARGO_MAXIMO_COMENTARIO} caracteres")
+            if value.strip():
+                datos[key] = value.strip()
+        elif key in esquema['perfil']:
+            opciones, _ = esquema['perfil'][key]
+            if not isinstance(value, str):
+                raise RespuestaInvalida(f"El campo '{key}' debe ser texto")
+            if opciones is not None and value not in opciones:
+                raise RespuestaInvalida(f"Opción no válida en '{key}': {value!r}")
+            if value.strip():
+                datos[key] = value.strip()
+        elif key == 'tiempos':
+            # Tiempos de llenado registrados por el cuestionario (control de calidad)
+            try:
+                datos[key] = validar_tiempos(value)
+            except ValueError as error:
+                raise RespuestaInvalida(str(error)) from error
+        elif key in esquema['evaluacion_general']:
+            if str(value) not in esquema['evaluacion_general'][key]:
+                raise RespuestaInvalida(f"Opción no válida en '{key}': {value!r}")
+            datos[key] = str(value)
+        else:
+            raise RespuestaInvalida(f"Campo desconocido: '{key}'")
+
+    faltantes = [item_id for item_id in esquema['items'] if item_id not in datos]
+    faltantes += [key for key, (_, requerido) in esquema['perfil'].items() if requerido and key not in datos]
+    faltantes += [key for key in esquema['evaluacion_general'] if key not in datos]
+    if faltantes:
+        raise RespuestaInvalida(f"Faltan {len(faltantes)} campos requeridos: {', '.join(faltantes[:10])}")
+
+    return datos
+
+class AlmacenRespuestas:
+    """Almacén DB-API de respuestas (SQLite por defecto, compatible con PostgreSQL)"""
+
+    def __init__(self, conectar, marcador='?'):
+        # `conectar` crea la conexión en el hilo escritor; `marcador` es '?' (sqlite3) o '%s' (psycopg)
+        self.conectar = conectar
+        self.marcador = marcador
+        self.conexion = None
+
+    @classmethod
+    def sqlite(cls, ruta=':memory:'):
+        """Almacén SQLite local (':memory:' sirve como base de prueba)"""
+        def conectar():
+            conexion = sqlite3.connect(ruta)
+            conexion.execute('PRAGMA journal_mode=WAL')
+            conexion.execute('PRAGMA synchronous=NORMAL')
+            return conexion
+        return cls(conectar)
+
+    def abrir(self):
+        self.conexion = self.conectar()
+        cursor = self.conexion.cursor()
+        cursor.execute(
+            'CREATE TABLE IF NOT EXISTS respuestas ('
+            ' id VARCHAR(32) PRIMARY KEY,'
+            ' recibido DOUBLE PRECISION NOT NULL,'
+            ' datos TEXT NOT NULL)'
+        )
+        self.conexion.commit()
+
+    def escribir_lote(self, filas):
+        """Insertar un lote de (id, recibido, datos_json) en una sola transacción"""
+        m = self.marcador
+        cursor = self.conexion.cursor()
+        try:
+            cursor.executemany(f'INSERT INTO respuestas (id, recibido, datos) VALUES ({m}, {m}, {m})', filas)
+            self.conexion.commit()
+        except Exception:
+            self.conexion.rollback()
+            raise
+
+    def contar(self):
+        cursor = self.conexion.cursor()
+        cursor.execute('SELECT COUNT(*) FROM respuestas')
+        return cursor.fetchone()[0]
+
+    def iterar_datos(self, lote=10_000):
+        """Respuestas guardadas, en listas de hasta `lote` diccionarios"""
+        cursor = self.conexion.cursor()
+        cursor.execute('SELECT datos FROM respuestas ORDER BY recibido, id')
+        while True:
+            filas = cursor.fetchmany(lote)
+            if not filas:
+                break
+            yield [json.loads(datos) for (datos,) in filas]
+
+    def cerrar(self):
+        if self.conexion is not None:
+            self.conexion.close()
+            self.conexion = None
+
+class ServicioRespuestas:
+    """Recepción asíncrona con escritura agrupada (group commit)"""
+
+    def __init__(self, almacen, tamano_lote=500, espera_lote=0.05, capacidad_cola=50_000,
+                 ruta_instantanea=None, intervalo_instantanea=1.0):
+        self.almacen = almacen
+        self.tamano_lote = tamano_lote
+        self.espera_lote = espera_lote
+        self.capacidad_cola = capacidad_cola
+        self.ruta_instantanea = ruta_instantanea
+        self.intervalo_instantanea = intervalo_instantanea
+        self.esquema = cargar_esquema()
+        self.agregados = None
+        self._ultima_instantanea = 0.0
+        self._instantaneas_suspendidas = False
+        self.estadisticas = {'recibidas': 0, 'rechazadas': 0, 'lotes': 0, 'guardadas': 0, 'errores_agregados': 0}
+        self._cola = None
+        self._escritor = None
+        self._servidor = None
+        # Un solo hilo: la conexión DB-API siempre se usa desde el mismo hilo
+        self._hilo_db = ThreadPoolExecutor(max_workers=1, thread_name_prefix='respuestas-db')
+
+    async def _en_hilo_db(self, funcion, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._hilo_db, funcion, *args)
+
+    async def iniciar(self, host='127.0.0.1', puerto=PUERTO_POR_DEFECTO):
+        """Abrir el almacén, lanzar el escritor y (si hay puerto) el servidor HTTP"""
+        await self._en_hilo_db(self.almacen.abrir)
+        self.agregados = await self._en_hilo_db(AgregadosEnLinea.restaurar, self.almacen,
+                                                self.ruta_instantanea, self.esquema)
+        self._cola = asyncio.Queue(maxsize=self.capacidad_cola)
+        self._escritor = asyncio.create_task(self._escribir_lotes())
+        if puerto is not None:
+            self._servidor = await asyncio.start_server(self._atender_conexion, host, puerto, backlog=1024)
+        return self._servidor
+
+    async def detener(self):
+        """Dejar de aceptar conexiones, vaciar la cola y cerrar el almacén"""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+        if self._escritor is not None:
+            await self._cola.put(None)
+            await self._escritor
+        await self._guardar_instantanea(forzar=True)
+        await self._en_hilo_db(self.almacen.cerrar)
+        self._hilo_db.shutdown()
+
+    async def recibir(self, payload):
+        """Validar, encolar y esperar la confirmación; devuelve el id asignado"""
+        try:
+            datos = validar_respuesta(payload, self.esquema)
+        except RespuestaInvalida:
+            self.estadisticas['rechazadas'] += 1
+            raise
+        self.estadisticas['recibidas'] += 1
+        fila = (uuid.uuid4().hex, time.time(), json.dumps(datos, ensure_ascii=False, separators=(',', ':')))
+        confirmado = asyncio.get_running_loop().create_future()
+        await self._cola.put((fila, datos, confirmado))
+        await confirmado
+        return fila[0]
+
+    async def _escribir_lotes(self):
+        """Tarea escritora: junta hasta `tamano_lote` filas o espera `espera_lote` s"""
+        loop = asyncio.get_running_loop()
+        terminar = False
+        while not terminar:
+            primero = await self._cola.get()
+            if primero is None:
+                break
+            lote = [primero]
+            limite = loop.time() + self.espera_lote
+            while len(lote) < self.tamano_lote:
+                restante = limite - loop.time()
+                try:
+                    elemento = self._cola.get_nowait() if restante <= 0 else await asyncio.wait_for(self._cola.get(), restante)
+                except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                    break
+                if elemento is None:
+                    terminar = True
+                    break
+                lote.append(elemento)
+
+            try:
+                await self._en_hilo_db(self.almacen.escribir_lote, [fila for fila, _, _ in lote])
+            except Exception as error:
+                self._confirmar(lote, error)
+                continue
+            try:
+                self.estadisticas['lotes'] += 1
+                self.estadisticas['guardadas'] += len(lote)
+                await self._actualizar_agregados([datos for _, datos, _ in lote])
+            finally:
+                # Las respuestas ya están confirmadas en el almacén
+                self._confirmar(lote)
+
+    @staticmethod
+    def _confirmar(lote, error=None):
+        """Resolver las peticiones de un lote (con `error` si no se guardó)"""
+        for _, _, confirmado in lote:
+            if not confirmado.done():
+                if error is None:
+                    confirmado.set_result(True)
+                else:
+                    confirmado.set_exception(error)
+
+    async def _actualizar_agregados(self, respuestas):
+        """Incorporar un lote confirmado a los agregados sin detener la tarea escritora"""
+        try:
+            self.agregados.agregar_respuestas(respuestas)
+        except Exception as error:
+            # Sin más instantáneas: al reiniciar, los agregados se completan desde el almacén
+            self.estadisticas['errores_agregados'] += 1
+            self._instantaneas_suspendidas = True
+            print(f"⚠️ No se pudieron actualizar los agregados: {error!r}")
+            return
+        await self._guardar_instantanea()
+
+    async def _guardar_instantanea(self, forzar=False):
+        """Guardar los agregados (fuera del event loop) como mucho una vez cada `intervalo_instantanea` s"""
+        if not self.ruta_instantanea or self.agregados is None or self._instantaneas_suspendidas:
+            return
+        ahora = time.monotonic()
+        if forzar or ahora - self._ultima_instantanea >= self.intervalo_instantanea:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self.agregados.guardar, self.ruta_instantanea)
+            except Exception as error:
+                print(f"⚠️ No se pudo guardar la instantánea de agregados: {error!r}")
+            self._ultima_instantanea = ahora
+
+    async def _atender_conexion(self, reader, writer):
+        """Atender peticiones HTTP/1.1 (con keep-alive) en una conexión"""
+        try:
+            while True:
+                peticion = await self._leer_peticion(reader)
+                if peticion is None:
+                    break
+                metodo, ruta, cabeceras, cuerpo = peticion
+                estado, respuesta = await self._despachar(metodo, ruta, cuerpo)
+                # Un cuerpo demasiado grande queda sin leer: la conexión no se puede reutilizar
+                mantener = cuerpo is not None and cabeceras.get('connection', '').lower() != 'close'
+                self._escribir_respuesta(writer, estado, respuesta, mantener)
+                await writer.drain()
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _leer_peticion(self, reader):
+        linea = await reader.readline()
+        if not linea:
+            return None
+        metodo, ruta, _ = linea.decode('latin-1').split(' ', 2)
+        cabeceras = {}
+        while True:
+            linea = await reader.readline()
+            if linea in (b'\r\n', b'\n', b''):
+                break
+            nombre, _, valor = linea.decode('latin-1').partition(':')
+            cabeceras[nombre.strip().lower()] = valor.strip()
+        largo = int(cabeceras.get('content-length', 0))
+        if largo > TAMANO_MAXIMO_CUERPO:
+            # Sin leer el cuerpo; se responde 413 con 'Connection: close'
+            return metodo, ruta, cabeceras, None
+        cuerpo = await reader.readexactly(largo) if largo else b''
+        return metodo, ruta, cabeceras, cuerpo
+
+    async def _despachar(self, metodo, ruta, cuerpo):
+        ruta = ruta.split('?', 1)[0]
+        if metodo == 'OPTIONS':
+            return 204, None
+        if ruta == '/salud' and metodo == 'GET':
+            return 200, dict(self.estadisticas, pendientes=self._cola.qsize())
+        if ruta == '/resultados' and metodo == 'GET':
+            return 200, self.agregados.resumen()
+        if ruta != RUTA_RESPUESTAS:
+            return 404, {'error': 'Ruta no encontrada'}
+        if metodo != 'POST':
+            return 405, {'error': 'Use POST'}
+        if cuerpo is None:
+            return 413, {'error': 'Cuerpo demasiado grande'}
+        try:
+            payload = json.loads(cuerpo.decode('utf-8'))
+            id_respuesta = await self.recibir(payload)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return 400, {'error': 'JSON no válido'}
+        except RespuestaInvalida as error:
+            # JSON bien formado que no cumple el esquema del cuestionario
+            return 422, {'error': str(error)}
+        except Exception:
+            # Falla del almacén (también sus ValueError): la respuesta no se guardó
+            return 503, {'error': 'No se pudo guardar la respuesta'}
+        return 201, {'id': id_respuesta}
+
+    def _escribir_respuesta(self, writer, estado, respuesta, mantener):
+        cuerpo = b'' if respuesta is None else json.dumps(respuesta, ensure_ascii=False).encode('utf-8')
+        cabeceras = [
+            f'HTTP/1.1 {estado} {ESTADOS_HTTP[estado]}',
+            'Content-Type: application/json; charset=utf-8',
+            f'Content-Length: {len(cuerpo)}',
+            # El cuestionario se abre desde file:// u otro origen
+            'Access-Control-Allow-Origin: *',
+            'Access-Control-Allow-Methods: POST, GET, OPTIONS',
+            'Access-Control-Allow-Headers: Content-Type',
+            f"Connection: {'keep-alive' if mantener else 'close'}",
+        ]
+        writer.write(('\r\n'.join(cabeceras) + '\r\n\r\n').encode('latin-1') + cuerpo)
+
+async def ejecutar(host, puerto, ruta_db, tamano_lote, espera_lote, columnar=None):
+    if columnar:
+        from almacen_columnar import AlmacenColumnar
+        almacen, destino = AlmacenColumnar(columnar, cargar_esquema()), f"{columnar} (columnar)"
+        instantanea = os.path.join(columnar, 'agregados.npz')
+    else:
+        almacen, destino = AlmacenRespuestas.sqlite(ruta_db), ruta_db
+        instantanea = f'{ruta_db}.agregados.npz'
+    servicio = ServicioRespuestas(almacen, tamano_lote, espera_lote, ruta_instantanea=instantanea)
+    servidor = await servicio.iniciar(host, puerto)
+    print(f"✅ Recibiendo respuestas en http://{host}:{puerto}{RUTA_RESPUESTAS}")
+    print(f"💾 Base de datos: {destino} (lotes de hasta {tamano_lote}, espera {espera_lote * 1000:.0f} ms)")
+    print(f"📊 Resultados en vivo: http://{host}:{puerto}/resultados ({servicio.agregados.filas} respuestas)")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        await servicio.detener()
+        print(f"📊 Guardadas: {servicio.estadisticas['guardadas']} en {servicio.estadisticas['lotes']} lotes")
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Servicio local de recepción de respuestas LogicQP')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=PUERTO_POR_DEFECTO)
+    parser.add_argument('--db', default='respuestas_cuestionario.sqlite3', help='Archivo SQLite de respuestas')
+    parser.add_argument('--columnar', metavar='DIR', help='Guardar en un almacén columnar en lugar de SQLite')
+    parser.add_argument('--lote', type=int, default=500, help='Máximo de respuestas por transacción')
+    parser.add_argument('--espera-ms', type=float, default=50, help='Espera máxima para completar un lote')
+    args = parser.parse_args()
+
+    print("🚀 Iniciando servicio de respuestas del cuestionario...")
+    try:
+        asyncio.run(ejecutar(args.host, args.puerto, args.db, args.lote, args.espera_ms / 1000, args.columnar))
+    except KeyboardInterrupt:
+        print("🛑 Servicio detenido")
+
+if __name__ == "__main__":
+    main()
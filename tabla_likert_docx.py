@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Construcción en bloque de tablas Likert para documentos Word
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Arma todas las filas de la tabla (w:tr) como un solo texto XML y lo
+convierte en elementos con una sola llamada al parser, en lugar de
+table.add_row(), cell.text, la alineación y cell.width celda por celda
+a través de los objetos de python-docx. El resultado es el mismo XML
+que produce ese camino, con los anchos de columna también en w:tblGrid.
+Con un EscritorDocx (escritor_docx.py) las filas se escriben en el
+archivo sin convertirse en elementos.
+
+Uso:
+    from tabla_likert_docx import agregar_tabla_likert
+    agregar_tabla_likert(doc, ['Pregunta', '1', '2', '3', '4', '5'], filas, [4.0] + [0.5] * 5)
+"""
+
+import re
+from xml.sax.saxutils import escape
+
+from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Inches
+
+# Saltos de línea y tabulaciones dentro de un texto: python-docx los convierte en w:br y w:tab
+SEPARADORES = re.compile(r'(\n|\t)')
+
+FIN_CELDA = '</w:r></w:p></w:tc>'
+
+# Filas convertidas por cada llamada al parser
+FILAS_POR_TRAMO = 2000
+
+def xml_texto(texto):
+    """Contenido de un w:r con `texto`, como lo escribe python-docx"""
+    partes = []
+    for parte in SEPARADORES.split(texto):
+        if parte == '\n':
+            partes.append('<w:br/>')
+        elif parte == '\t':
+            partes.append('<w:tab/>')
+        elif parte:
+            espacio = ' xml:space="preserve"' if parte != parte.strip() else ''
+            partes.append(f'<w:t{espacio}>{escape(parte)}</w:t>')
+    return ''.join(partes)
+
+def inicios_celda(anchos, negrita=False, centrar_primera=False):
+    """XML de apertura de cada celda de una fila (hasta el w:r), todas centradas salvo la primera"""
+    formato = '<w:rPr><w:b/></w:rPr>' if negrita else ''
+    inicios = []
+    for j, ancho in enumerate(anchos):
+        centrado = '<w:pPr><w:jc w:val="center"/></w:pPr>' if j or centrar_primera else ''
+        inicios.append(f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{ancho}"/></w:tcPr><w:p>{centrado}<w:r>{formato}')
+    return inicios
+
+def xml_filas(filas, inicios):
+    """w:tr de cada fila de textos"""
+    # Los textos repetidos (las casillas) se convierten una sola vez
+    memo = {}
+    for textos in filas:
+        celdas = ['<w:tr>']
+        for inicio, texto in zip(inicios, textos):
+            contenido = memo.get(texto)
+            if contenido is None:
+                contenido = memo[texto] = xml_texto(texto)
+            celdas += (inicio, contenido, FIN_CELDA)
+        celdas.append('</w:tr>')
+        yield ''.join(celdas)
+
+def agregar_tabla_likert(doc, encabezados, filas, anchos):
+    """Agregar una tabla 'Table Grid' centrada: encabezados en negrita y celdas centradas salvo la primera"""
+    table = doc.add_table(rows=0, cols=len(encabezados))
+    table.style = 'Table Grid'
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+
+    # Anchos en twips (unidad de w:tcW y w:gridCol)
+    twips = [Inches(ancho).twips for ancho in anchos]
+    for columna, ancho in zip(table._tbl.tblGrid.findall(qn('w:gridCol')), twips):
+        columna.set(qn('w:w'), str(ancho))
+
+    # Las filas se convierten por tramos: el texto XML de toda la tabla nunca está completo en memoria
+    inicios = inicios_celda(twips)
+    tramos = [xml_filas([encabezados], inicios_celda(twips, negrita=True, centrar_primera=True))]
+    tramos.extend(xml_filas(filas[inicio:inicio + FILAS_POR_TRAMO], inicios)
+                  for inicio in range(0, len(filas), FILAS_POR_TRAMO))
+    if hasattr(doc, 'escribir_filas'):
+        # EscritorDocx: las filas van directo al archivo, sin pasar por el árbol
+        doc.escribir_filas(table, tramos)
+        return table
+    for tramo in tramos:
+        table._tbl.extend(parse_xml(f'<w:tbl {nsdecls("w")}>{"".join(tramo)}</w:tbl>'))
+    return table
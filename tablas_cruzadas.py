@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tablas cruzadas de las puntuaciones por campos del perfil del encuestado
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Cruza la media de cada puntuación (compuestos, total y cada sección
+Likert) con cualquier combinación de los campos del perfil: Rol/Posición,
+Frecuencia de uso, Navegador utilizado, etc.
+
+Cada campo se convierte una sola vez en códigos enteros (0 = sin dato);
+el rol, que es texto libre, agrupa las variantes de escritura ("Cajero",
+"cajero "). Una combinación de campos se codifica en un solo entero de
+base mixta y cada columna se reduce con un bincount, sin recorrer los
+grupos en Python. Los resultados se guardan en una caché LRU por
+(campos, filtro), así que repetir una consulta del tablero es inmediato.
+
+Uso:
+    python tablas_cruzadas.py --almacen campana_2025 --por rol,frecuencia
+    python tablas_cruzadas.py --almacen campana_2025 --por navegador --filtro frecuencia=diario
+    python tablas_cruzadas.py --sintetico 1000000 --por rol,frecuencia,navegador
+"""
+
+import argparse
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from esquema_cuestionario import cargar_esquema
+from importador_respuestas import normalizar
+from puntuaciones import BLOQUE_FILAS, matriz_sintetica, orientar, puntuaciones_centesimas
+
+# Campos del formulario de Google Forms que definen segmentos
+CAMPOS_SEGMENTO = ('rol', 'frecuencia', 'navegador')
+
+# Consultas guardadas en la caché
+CAPACIDAD_CACHE = 128
+
+SIN_DATO = 'sin dato'
+
+def factorizar_textos(textos):
+    """Códigos (0 = sin dato) y etiquetas de un campo de texto libre, uniendo variantes de escritura"""
+    variantes = {}
+    # Un código por texto distinto; normalizar() se aplica una vez por variante, no por fila
+    codigos = np.fromiter((variantes.setdefault(t, len(variantes)) for t in textos), dtype=np.intp)
+    frecuencia = np.bincount(codigos, minlength=len(variantes))
+
+    # Cada grupo se rotula con su variante más frecuente
+    grupos = {}
+    for texto, v in variantes.items():
+        clave = normalizar(texto)
+        if clave:
+            grupos.setdefault(clave, []).append((frecuencia[v], texto.strip(), v))
+    etiquetas = [SIN_DATO]
+    traduccion = np.zeros(len(variantes), dtype=np.intp)
+    for clave, miembros in grupos.items():
+        traduccion[[v for _, _, v in miembros]] = len(etiquetas)
+        etiquetas.append(max(miembros)[1])
+    return traduccion[codigos], tuple(etiquetas)
+
+def puntuaciones_por_encuestado(likert, esquema=None, bloque=BLOQUE_FILAS):
+    """Nombres y matriz [valor · respondido | respondido] (float64) de compuestos, total y secciones"""
+    esquema = esquema or cargar_esquema()
+    likert = np.asarray(likert)
+    centesimas = puntuaciones_centesimas(likert, esquema)
+    secciones = [titulo for titulo, _ in esquema['secciones']]
+    nombres = [*centesimas, *secciones]
+    m = len(nombres)
+    # Orden Fortran: cada bincount recorre una columna contigua
+    datos = np.zeros((len(likert), 2 * m), order='F')
+    for j, valores in enumerate(centesimas.values()):
+        datos[:, j] = valores / 100
+        datos[:, m + j] = valores > 0
+
+    # Media de los ítems respondidos de cada sección: sumas y conteos con un matmul contra ítem × sección.
+    # Los ítems invertidos se dan vuelta antes (más alto = mejor), como en agregados_en_linea.py
+    pertenencia = np.zeros((len(esquema['items']), len(secciones)), dtype=np.float32)
+    pertenencia[np.arange(len(esquema['items'])), esquema['item_seccion']] = 1
+    j = len(centesimas)
+    for inicio in range(0, len(likert), bloque):
+        valores = likert[inicio:inicio + bloque]
+        suma = orientar(valores, esquema).astype(np.float32) @ pertenencia
+        cuenta = (valores > 0).astype(np.float32) @ pertenencia
+        datos[inicio:inicio + bloque, j:m] = suma / np.maximum(cuenta, 1)
+        datos[inicio:inicio + bloque, m + j:] = cuenta > 0
+    return nombres, datos
+
+class TablasCruzadas:
+    """Medias de las puntuaciones por combinaciones de campos del perfil, con caché LRU"""
+
+    def __init__(self, likert, campos, esquema=None, capacidad=CAPACIDAD_CACHE):
+        """`campos`: {nombre: (códigos por encuestado, etiquetas)}, con el código 0 = sin dato"""
+        self.esquema = esquema or cargar_esquema()
+        self.nombres, self.datos = puntuaciones_por_encuestado(likert, self.esquema)
+        self.campos = {}
+        for campo, (codigos, etiquetas) in campos.items():
+            codigos = np.asarray(codigos, dtype=np.intp)
+            if len(codigos) != len(self.datos):
+                raise ValueError(f"El campo '{campo}' no tiene un código por encuestado")
+            self.campos[campo] = (codigos, tuple(etiquetas))
+        self.capacidad = capacidad
+        self.cache = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    @classmethod
+    def desde_almacen(cls, almacen, campos=CAMPOS_SEGMENTO, esquema=None, capacidad=CAPACIDAD_CACHE):
+        """Motor sobre las respuestas de un almacén columnar"""
+        factorizados = {}
+        for campo in campos:
+            if campo in almacen.categoricos:
+                etiquetas = (SIN_DATO, *almacen.categoricos[campo])
+                factorizados[campo] = (np.array(almacen.categorico(campo)), etiquetas)
+            else:
+                factorizados[campo] = factorizar_textos(almacen.iterar_textos(campo))
+        return cls(almacen.matriz(), factorizados, esquema, capacidad)
+
+    def etiquetas(self, campo):
+        """Etiquetas de los códigos de un campo"""
+        return self.campos[campo][1]
+
+    def _clave(self, por, filtro):
+        filtro = filtro or {}
+        normalizado = []
+        for campo, valores in sorted(filtro.items()):
+            valores = (valores,) if isinstance(valores, str) else valores
+            # "Cajero", "cajero" y "CAJERO " son la misma consulta
+            normalizado.append((campo, tuple(sorted({normalizar(v) for v in valores}))))
+        return tuple(por), tuple(normalizado)
+
+    def _mascara(self, filtro):
+        mascara = np.ones(len(self.datos), dtype=bool)
+        for campo, valores in filtro:
+            codigos, etiquetas = self.campos[campo]
+            indice = {normalizar(etiqueta): i for i, etiqueta in enumerate(etiquetas)}
+            desconocidos = [v for v in valores if v not in indice]
+            if desconocidos:
+                raise ValueError(f"Valores desconocidos para '{campo}': {', '.join(desconocidos)}")
+            mascara &= np.isin(codigos, [indice[v] for v in valores])
+        return mascara
+
+    def _calcular(self, por, filtro):
+        dimensiones = tuple(len(self.campos[campo][1]) for campo in por)
+        celdas = int(np.prod(dimensiones, dtype=np.int64))
+        # Código de base mixta: una celda por combinación de valores
+        codigo = np.zeros(len(self.datos), dtype=np.intp)
+        for campo, dimension in zip(por, dimensiones):
+            codigo = codigo * dimension + self.campos[campo][0]
+        datos = self.datos
+        if filtro:
+            mascara = self._mascara(filtro)
+            codigo, datos = codigo[mascara], datos[mascara]
+
+        m = len(self.nombres)
+        sumas = np.stack([np.bincount(codigo, weights=datos[:, j], minlength=celdas)
+                          for j in range(2 * m)], axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            medias = sumas[:, :m] / sumas[:, m:]
+        tabla = {
+            'por': tuple(por),
+            'etiquetas': tuple(self.campos[campo][1] for campo in por),
+            'n': np.bincount(codigo, minlength=celdas).reshape(dimensiones),
+            'medias': {nombre: medias[:, j].reshape(dimensiones) for j, nombre in enumerate(self.nombres)},
+            'respondidos': {nombre: sumas[:, m + j].astype(np.int64).reshape(dimensiones)
+                            for j, nombre in enumerate(self.nombres)},
+        }
+        # Los resultados se comparten desde la caché: de solo lectura
+        for arreglo in [tabla['n'], *tabla['medias'].values(), *tabla['respondidos'].values()]:
+            arreglo.flags.writeable = False
+        return tabla
+
+    def tabla(self, por, filtro=None):
+        """Tabla cruzada por los campos `por` ({'n', 'medias', 'respondidos'} con un eje por campo)"""
+        por = tuple(por)
+        for campo in por + tuple(filtro or ()):
+            if campo not in self.campos:
+                raise KeyError(campo)
+        clave = self._clave(por, filtro)
+        if clave in self.cache:
+            self.aciertos += 1
+            self.cache.move_to_end(clave)
+            return self.cache[clave]
+        self.fallos += 1
+        tabla = self._calcular(por, clave[1])
+        self.cache[clave] = tabla
+        if len(self.cache) > self.capacidad:
+            self.cache.popitem(last=False)
+        return tabla
+
+    def filas(self, por, filtro=None):
+        """Celdas con encuestados como (etiquetas, n, {puntuación: media})"""
+        tabla = self.tabla(por, filtro)
+        for indice in zip(*np.nonzero(tabla['n'])):
+            etiquetas = tuple(tabla['etiquetas'][eje][i] for eje, i in enumerate(indice))
+            medias = {nombre: float(valores[indice]) for nombre, valores in tabla['medias'].items()}
+            yield etiquetas, int(tabla['n'][indice]), medias
+
+def campos_sinteticos(total, semilla=0, esquema=None):
+    """Campos del perfil aleatorios, con el rol escrito de varias formas"""
+    from almacen_columnar import campos_del_esquema
+    esquema = esquema or cargar_esquema()
+    categoricos, _ = campos_del_esquema(esquema)
+    rng = np.random.default_rng(semilla)
+    roles = ['Farmacéutico', 'farmaceutico', 'Cajero', 'CAJERO ', 'Administrador', 'Bodeguero', '']
+    campos = {'rol': factorizar_textos(rng.choice(roles, total).tolist())}
+    for campo in ('frecuencia', 'navegador', 'dispositivo'):
+        etiquetas = (SIN_DATO, *categoricos[campo])
+        campos[campo] = (rng.integers(0, len(etiquetas), total), etiquetas)
+    return campos
+
+def imprimir_tabla(motor, por, filtro=None, puntuaciones=None):
+    """Una línea por celda con sus medias"""
+    tabla = motor.tabla(por, filtro)
+    # Por defecto, los compuestos y el total
+    puntuaciones = puntuaciones or motor.nombres[:len(motor.esquema['compuestos']) + 1]
+    print(f"{' / '.join(por):<40} {'n':>9}  " + '  '.join(f'{p[:12]:>12}' for p in puntuaciones))
+    for etiquetas, n, medias in motor.filas(por, filtro):
+        print(f"{' / '.join(etiquetas):<40} {n:>9}  " + '  '.join(f'{medias[p]:>12.2f}' for p in puntuaciones))
+    return tabla
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description='Tablas cruzadas de puntuaciones por campos del perfil')
+    grupo = parser.add_mutually_exclusive_group(required=True)
+    grupo.add_argument('--almacen', help='Directorio del almacén columnar')
+    grupo.add_argument('--sintetico', type=int, metavar='N', help='Medir con N respuestas aleatorias')
+    parser.add_argument('--por', default='rol,frecuencia', help='Campos separados por coma')
+    parser.add_argument('--filtro', action='append', default=[], metavar='CAMPO=VALOR',
+                        help='Limitar a encuestados con ese valor (se puede repetir)')
+    args = parser.parse_args()
+
+    esquema = cargar_esquema()
+    por = [campo.strip() for campo in args.por.split(',') if campo.strip()]
+    filtro = {}
+    for condicion in args.filtro:
+        campo, _, valor = condicion.partition('=')
+        filtro.setdefault(campo.strip(), []).append(valor.strip())
+
+    inicio = time.perf_counter()
+    if args.almacen:
+        from almacen_columnar import AlmacenColumnar, campos_del_esquema
+        # Antes de leer el almacén: un campo desconocido es un error de uso, no un KeyError al cargar
+        categoricos, _ = campos_del_esquema(esquema)
+        validos = [*categoricos, *(name for name, (opciones, _) in esquema['perfil'].items() if opciones is None)]
+        for campo in [*por, *filtro]:
+            if campo not in validos:
+                parser.error(f"Campo desconocido: {campo} (campos: {', '.join(validos)})")
+        print(f"🚀 Cargando respuestas de {args.almacen}...")
+        campos = list(dict.fromkeys([*CAMPOS_SEGMENTO, *por, *filtro]))
+        motor = TablasCruzadas.desde_almacen(AlmacenColumnar(args.almacen, esquema), campos, esquema)
+    else:
+        print(f"🚀 Generando {args.sintetico} respuestas sintéticas...")
+        motor = TablasCruzadas(matriz_sintetica(args.sintetico, esquema=esquema),
+                               campos_sinteticos(args.sintetico, esquema=esquema), esquema)
+    print(f"⏱️ Puntuaciones y códigos preparados en {time.perf_counter() - inicio:.2f}s")
+
+    for campo in [*por, *filtro]:
+        if campo not in motor.campos:
+            parser.error(f"Campo desconocido: {campo}")
+
+    inicio = time.perf_counter()
+    imprimir_tabla(motor, por, filtro)
+    primera = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    motor.tabla(por, filtro)
+    print(f"⏱️ Consulta: {primera * 1000:.1f} ms; repetida desde la caché: {(time.perf_counter() - inicio) * 1000:.3f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de los agregados incrementales contra el cálculo directo con NumPy
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Uso:
+    python -m pytest -q test_agregados_en_linea.py
+"""
+
+import numpy as np
+
+from agregados_en_linea import AgregadosEnLinea, fusionar, separar
+from esquema_cuestionario import cargar_esquema
+from puntuaciones import matriz_sintetica, orientar
+
+def resumen_directo(valores):
+    """Conteo, media y M2 de cada columna (listas de valores) calculados de una vez"""
+    n = np.array([len(v) for v in valores], dtype=np.float64)
+    media = np.array([np.mean(v) if len(v) else 0.0 for v in valores])
+    m2 = np.array([((np.asarray(v) - np.mean(v)) ** 2).sum() if len(v) else 0.0 for v in valores])
+    return n, media, m2
+
+def esperado_items(matriz):
+    """n, media y varianza (ddof=1) de cada ítem sobre las respuestas distintas de 0"""
+    resultado = []
+    for columna in matriz.T:
+        valores = columna[columna > 0].astype(np.float64)
+        resultado.append((len(valores), valores.mean(), valores.var(ddof=1)))
+    return resultado
+
+def esperado_secciones(matriz, esquema):
+    """n, media y varianza de la media orientada de cada encuestado en cada sección"""
+    orientada = orientar(matriz, esquema).astype(np.float64)
+    orientada[matriz == 0] = np.nan
+    item_seccion = np.array(esquema['item_seccion'])
+    resultado = []
+    for s in range(len(esquema['secciones'])):
+        bloque = orientada[:, item_seccion == s]
+        respondieron = ~np.isnan(bloque).all(axis=1)
+        medias = np.nanmean(bloque[respondieron], axis=1)
+        resultado.append((len(medias), medias.mean(), medias.var(ddof=1)))
+    return resultado
+
+def comparar(agregados, matriz):
+    esquema = agregados.esquema
+    for item, (n, media, varianza) in zip(agregados.items, esperado_items(matriz)):
+        obtenido = agregados.estadisticas_item(item)
+        assert obtenido['n'] == n
+        assert np.isclose(obtenido['media'], media) and np.isclose(obtenido['varianza'], varianza)
+    for s, (n, media, varianza) in enumerate(esperado_secciones(matriz, esquema)):
+        obtenido = agregados.estadisticas_seccion(s)
+        assert obtenido['n'] == n
+        assert np.isclose(obtenido['media'], media) and np.isclose(obtenido['varianza'], varianza)
+
+def test_fusionar_y_separar():
+    rng = np.random.default_rng(3)
+    a = [rng.normal(2, 1, rng.integers(0, 50)) for _ in range(6)]
+    b = [rng.normal(4, 3, rng.integers(0, 50)) for _ in range(6)]
+    juntos = [np.concatenate([x, y]) for x, y in zip(a, b)]
+    fusionado = fusionar(*resumen_directo(a), *resumen_directo(b))
+    for obtenido, esperado in zip(fusionado, resumen_directo(juntos)):
+        assert np.allclose(obtenido, esperado)
+    for obtenido, esperado in zip(separar(*fusionado, *resumen_directo(b)), resumen_directo(a)):
+        assert np.allclose(obtenido, esperado)
+
+def test_bloques_equivalen_al_calculo_directo():
+    esquema = cargar_esquema()
+    matriz = matriz_sintetica(3000, semilla=4, esquema=esquema)
+    agregados = AgregadosEnLinea(esquema, filtrar_calidad=False)
+    # Bloques de tamaños desparejos, incluido uno de una sola respuesta
+    limites = [0, 1, 700, 2500, len(matriz)]
+    for inicio, fin in zip(limites, limites[1:]):
+        agregados.agregar_columnas(matriz[inicio:fin])
+    assert agregados.resumen()['respuestas'] == len(matriz)
+    comparar(agregados, matriz)
+
+def test_quitar_columnas_equivale_a_no_haberlas_incluido():
+    esquema = cargar_esquema()
+    matriz = matriz_sintetica(2000, semilla=5, esquema=esquema)
+    agregados = AgregadosEnLinea(esquema, filtrar_calidad=False)
+    agregados.agregar_columnas(matriz)
+    quitar = np.zeros(len(matriz), dtype=bool)
+    quitar[::3] = True
+    agregados.quitar_columnas(matriz[quitar])
+    assert agregados.excluidas == np.count_nonzero(quitar)
+    comparar(agregados, matriz[~quitar])
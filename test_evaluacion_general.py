@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de los indicadores de la Sección 10 contra conteos y correlaciones directos
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Uso:
+    python -m pytest -q test_evaluacion_general.py
+"""
+
+import numpy as np
+
+from esquema_cuestionario import cargar_esquema
+from evaluacion_general import DETRACTOR_MAXIMO, PROMOTOR_MINIMO, AnaliticaEvaluacion, datos_sinteticos
+from puntuaciones import puntuaciones_centesimas
+
+def analitica_por_bloques(likert, categoricos, recibido, limites):
+    analitica = AnaliticaEvaluacion(periodo='dia', desfase=0)
+    for inicio, fin in zip(limites, limites[1:]):
+        analitica.agregar_columnas(likert[inicio:fin], {c: v[inicio:fin] for c, v in categoricos.items()},
+                                   recibido=recibido[inicio:fin])
+    return analitica
+
+def test_promotores_y_detractores():
+    esquema = cargar_esquema()
+    likert, categoricos, recibido = datos_sinteticos(4000, semilla=8, esquema=esquema)
+    analitica = analitica_por_bloques(likert, categoricos, recibido, [0, 1, 1500, 4000])
+    assert analitica.filas == len(likert)
+    for campo, codigos in categoricos.items():
+        respondidas = codigos[codigos > 0]
+        promotores = np.mean(respondidas >= PROMOTOR_MINIMO)
+        detractores = np.mean(respondidas <= DETRACTOR_MAXIMO)
+        obtenido = analitica.indicadores(campo)
+        assert obtenido['n'] == len(respondidas)
+        assert np.isclose(obtenido['media'], respondidas.mean())
+        assert np.isclose(obtenido['promotores'], promotores)
+        assert np.isclose(obtenido['detractores'], detractores)
+        assert np.isclose(obtenido['pasivos'], 1 - promotores - detractores)
+        assert np.isclose(obtenido['neto'], promotores - detractores)
+
+def test_correlaciones_por_bloques():
+    esquema = cargar_esquema()
+    likert, categoricos, recibido = datos_sinteticos(3000, semilla=9, esquema=esquema)
+    analitica = analitica_por_bloques(likert, categoricos, recibido, [0, 999, 2000, 3000])
+    centesimas = puntuaciones_centesimas(likert, esquema)
+    for campo, codigos in categoricos.items():
+        obtenido = analitica.correlaciones(campo)
+        for name in [*esquema['compuestos'], 'total']:
+            ambos = (codigos > 0) & (centesimas[name] > 0)
+            esperado = np.corrcoef(codigos[ambos], centesimas[name][ambos])[0, 1]
+            assert np.isclose(obtenido[name], esperado)
+
+def test_sin_respuestas():
+    analitica = AnaliticaEvaluacion(desfase=0)
+    campo = analitica.campos[0]
+    assert analitica.indicadores(campo)['n'] == 0 and analitica.indicadores(campo)['neto'] == 0.0
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del alfa de Cronbach por bloques contra la fórmula directa con NumPy
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Uso:
+    python -m pytest -q test_fiabilidad.py
+"""
+
+import numpy as np
+
+from fiabilidad import analizar_fiabilidad, matriz_sintetica_escalas
+
+def alfa_directo(x):
+    """k/(k-1) · (1 - Σ var(ítem) / var(total)) sobre una matriz de casos completos"""
+    k = x.shape[1]
+    return k / (k - 1) * (1 - x.var(axis=0, ddof=1).sum() / x.sum(axis=1).var(ddof=1))
+
+def test_alfa_y_diagnosticos_por_item():
+    matriz, grupos = matriz_sintetica_escalas(5000, subsecciones=3, items=5, semilla=6)
+    # Bloques chicos: los momentos se acumulan en varias pasadas
+    resultados = analizar_fiabilidad(matriz, grupos, bloque=777)
+    for nombre, (inicio, fin) in grupos.items():
+        x = matriz[:, inicio:fin]
+        x = x[(x > 0).all(axis=1)].astype(np.float64)
+        obtenido = resultados[nombre]
+        assert obtenido['n'] == len(x)
+        assert np.isclose(obtenido['alfa'], alfa_directo(x), atol=1e-6)
+        for i in range(x.shape[1]):
+            resto = np.delete(x, i, axis=1)
+            assert np.isclose(obtenido['alfa_sin_item'][i], alfa_directo(resto), atol=1e-6)
+            correlacion = np.corrcoef(x[:, i], resto.sum(axis=1))[0, 1]
+            assert np.isclose(obtenido['correlacion_item_total'][i], correlacion, atol=1e-6)
+
+def test_sin_casos_completos():
+    matriz = np.array([[1, 2, 0], [0, 3, 4]], dtype=np.uint8)
+    resultado = analizar_fiabilidad(matriz, {'escala': (0, 3)})['escala']
+    assert resultado['n'] == 0 and np.isnan(resultado['alfa'])
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de reproducibilidad de los intervalos bootstrap
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Uso:
+    python -m pytest -q test_intervalos_bootstrap.py
+"""
+
+import numpy as np
+
+from esquema_cuestionario import cargar_esquema
+from intervalos_bootstrap import BLOQUE_REMUESTRAS, intervalos_bootstrap
+from puntuaciones import matriz_sintetica, puntuaciones_centesimas
+
+REMUESTRAS = 3 * BLOQUE_REMUESTRAS + 10
+
+def datos_prueba():
+    esquema = cargar_esquema()
+    likert = matriz_sintetica(1500, semilla=7, esquema=esquema)
+    segmento = np.random.default_rng(7).integers(0, 3, len(likert))
+    return esquema, likert, segmento
+
+def test_misma_semilla_mismo_resultado_con_cualquier_numero_de_procesos():
+    esquema, likert, segmento = datos_prueba()
+    uno = intervalos_bootstrap(likert, segmento, esquema=esquema, remuestras=REMUESTRAS, semilla=11)
+    otra_vez = intervalos_bootstrap(likert, segmento, esquema=esquema, remuestras=REMUESTRAS, semilla=11)
+    dos = intervalos_bootstrap(likert, segmento, esquema=esquema, remuestras=REMUESTRAS, semilla=11, procesos=2)
+    assert uno == otra_vez == dos
+    distinta = intervalos_bootstrap(likert, segmento, esquema=esquema, remuestras=REMUESTRAS, semilla=12)
+    assert distinta != uno
+
+def test_medias_puntuales_iguales_al_calculo_directo():
+    esquema, likert, segmento = datos_prueba()
+    resultados = intervalos_bootstrap(likert, segmento, esquema=esquema, remuestras=REMUESTRAS)
+    centesimas = puntuaciones_centesimas(likert, esquema)
+    for estrato, filas in [('Todos', np.ones(len(likert), dtype=bool)),
+                           *((str(codigo), segmento == codigo) for codigo in range(3))]:
+        for name in esquema['compuestos']:
+            valores = centesimas[name][filas]
+            valores = valores[valores > 0] / 100
+            obtenido = resultados[estrato]['compuestos'][name]
+            assert obtenido['n'] == len(valores)
+            assert np.isclose(obtenido['media'], valores.mean())
+            assert obtenido['inferior'] <= obtenido['media'] <= obtenido['superior']
+        for grupo in esquema['grupos']:
+            inicio, fin = esquema['grupo_rango'][grupo]
+            valores = likert[filas, inicio:fin].astype(np.float64)
+            valores[valores == 0] = np.nan
+            medias = np.nanmean(valores[~np.isnan(valores).all(axis=1)], axis=1)
+            obtenido = resultados[estrato]['subsecciones'][grupo]
+            assert obtenido['n'] == len(medias)
+            assert np.isclose(obtenido['media'], medias.mean())
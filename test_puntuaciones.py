@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas de paridad de puntuaciones.py con calculateScores() del navegador
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Los valores esperados se obtuvieron una vez con Node.js (el mismo
+calculateScores() que publica generar_cuestionario_digital.py y
+Number.prototype.toFixed); las pruebas no necesitan Node.
+
+Uso:
+    python -m pytest -q test_puntuaciones.py
+"""
+
+import numpy as np
+
+from esquema_cuestionario import cargar_esquema
+from puntuaciones import centesimas_tofixed, puntuaciones_centesimas, valores_js
+
+# x.toFixed(2) en Node.js: empates exactos hacia arriba, casi-empates según el double
+TOFIXED = [
+    (1.005, '1.00'), (1.125, '1.13'), (2.675, '2.67'), (0.125, '0.13'), (3.335, '3.33'),
+    (4.445, '4.45'), (2.345, '2.35'), (1.115, '1.11'), (3.875, '3.88'), (2.5, '2.50'),
+    (0.005, '0.01'), (4.995, '5.00'), (8.345, '8.35'),
+]
+
+def esquema_con_invertidos():
+    """Esquema con un compuesto adicional que mezcla ítems invertidos (problemas, mejoras) y directos (impacto)"""
+    esquema = cargar_esquema()
+    return dict(esquema, compuestos=dict(esquema['compuestos'], problemas=('problemas', 'mejoras', 'impacto')))
+
+def matriz_prueba():
+    """Respuestas armadas para provocar empates de redondeo e ítems invertidos"""
+    esquema = cargar_esquema()
+    rango = esquema['grupo_rango']
+    filas = np.zeros((6, len(esquema['items'])), dtype=np.uint8)
+    filas[0] = 3
+    # Usabilidad 25/8 = 3.125 y eficiencia 17/8 = 2.125: empates exactos en el compuesto
+    for fila in (1, 2):
+        filas[fila, rango['facilidad'][0]:rango['facilidad'][0] + 8] = [5, 5, 5, 2, 2, 2, 2, 2]
+        filas[fila, rango['velocidad'][0]:rango['velocidad'][0] + 8] = [3, 2, 2, 2, 2, 2, 2, 2]
+    filas[2, rango['problemas'][0]:rango['impacto'][1]] = 1
+    filas[3, rango['facilidad'][0]:rango['navegacion'][1]] = 1
+    filas[3, rango['problemas'][0]:rango['impacto'][1]] = [5] * 10 + [1] * 5
+    filas[4, rango['facilidad'][0]:rango['facilidad'][0] + 3] = [5, 5, 4]
+    filas[4, rango['satisfaccion'][0]:rango['satisfaccion'][0] + 2] = [1, 2]
+    filas[4, rango['problemas'][0]:rango['problemas'][0] + 3] = [2, 1, 1]
+    # Fila 5: sin respuestas
+    return filas
+
+ESPERADO = [
+    {'usabilidad': '3.00', 'eficiencia': '3.00', 'satisfaccion': '3.00', 'total': '3.00'},
+    {'usabilidad': '3.13', 'eficiencia': '2.13', 'satisfaccion': 0, 'total': '1.75'},
+    {'usabilidad': '3.13', 'eficiencia': '2.13', 'satisfaccion': 0, 'total': '1.75'},
+    {'usabilidad': '1.00', 'eficiencia': 0, 'satisfaccion': 0, 'total': '0.33'},
+    {'usabilidad': '4.67', 'eficiencia': 0, 'satisfaccion': '1.50', 'total': '2.06'},
+    {'usabilidad': 0, 'eficiencia': 0, 'satisfaccion': 0, 'total': '0.00'},
+]
+
+ESPERADO_INVERTIDOS = [
+    {'usabilidad': '3.00', 'eficiencia': '3.00', 'satisfaccion': '3.00', 'problemas': '3.00', 'total': '3.00'},
+    # (3.13 + 2.13) / 4 = 1.315 queda por debajo del empate en double: toFixed da 1.31
+    {'usabilidad': '3.13', 'eficiencia': '2.13', 'satisfaccion': 0, 'problemas': 0, 'total': '1.31'},
+    # Todo en 1: problemas y mejoras invertidos valen 5, impacto (directo) vale 1
+    {'usabilidad': '3.13', 'eficiencia': '2.13', 'satisfaccion': 0, 'problemas': '3.67', 'total': '2.23'},
+    {'usabilidad': '1.00', 'eficiencia': 0, 'satisfaccion': 0, 'problemas': '1.00', 'total': '0.50'},
+    {'usabilidad': '4.67', 'eficiencia': 0, 'satisfaccion': '1.50', 'problemas': '4.67', 'total': '2.71'},
+    {'usabilidad': 0, 'eficiencia': 0, 'satisfaccion': 0, 'problemas': 0, 'total': '0.00'},
+]
+
+def test_centesimas_tofixed():
+    obtenido = centesimas_tofixed(np.array([x for x, _ in TOFIXED]))
+    assert [f'{c / 100:.2f}' for c in obtenido] == [texto for _, texto in TOFIXED]
+
+def test_paridad_compuestos_publicados():
+    centesimas = puntuaciones_centesimas(matriz_prueba())
+    assert [valores_js(centesimas, fila) for fila in range(len(ESPERADO))] == ESPERADO
+
+def test_paridad_con_items_invertidos():
+    centesimas = puntuaciones_centesimas(matriz_prueba(), esquema_con_invertidos())
+    assert [valores_js(centesimas, fila) for fila in range(len(ESPERADO_INVERTIDOS))] == ESPERADO_INVERTIDOS
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Pruebas del servicio de recepción de respuestas contra una base SQLite en memoria
+Sistema LogicQP - Grupo 6 - Cel@g
+
+Uso:
+    python -m pytest -q test_servicio_respuestas.py
+"""
+
+import asyncio
+import json
+
+from esquema_cuestionario import cargar_esquema
+from servicio_respuestas import (TAMANO_MAXIMO_CUERPO, AlmacenRespuestas, RespuestaInvalida,
+                                 ServicioRespuestas, validar_respuesta)
+
+def respuesta_valida(valor=None):
+    """Objeto `data` completo, como el que envía submitForm() (sin `valor`, respuestas variadas)"""
+    esquema = cargar_esquema()
+    data = {item: (j * 7 % 5 + 1 if valor is None else valor) for j, item in enumerate(esquema['items'])}
+    for campo, (opciones, requerido) in esquema['perfil'].items():
+        if requerido:
+            data[campo] = opciones[0] if opciones else 'Cajero'
+    data.update((campo, opciones[0]) for campo, opciones in esquema['evaluacion_general'].items())
+    data['tiempos'] = {'total_ms': 600_000, 'secciones': {}}
+    return data
+
+class AlmacenConFalla(AlmacenRespuestas):
+    """Almacén en memoria cuya escritura falla como un almacén con datos fuera de rango"""
+
+    def escribir_lote(self, filas):
+        raise ValueError("Código fuera de rango")
+
+async def peticion(puerto, metodo, cuerpo=b'', largo=None):
+    """Enviar una petición HTTP/1.1 y devolver (estado, cuerpo JSON, cabeceras)"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', puerto)
+    largo = len(cuerpo) if largo is None else largo
+    writer.write(f'{metodo} /respuestas HTTP/1.1\r\nHost: prueba\r\nContent-Length: {largo}\r\n'
+                 f'Connection: close\r\n\r\n'.encode('latin-1') + cuerpo)
+    await writer.drain()
+    datos = await reader.read()
+    writer.close()
+    encabezado, _, contenido = datos.partition(b'\r\n\r\n')
+    lineas = encabezado.decode('latin-1').split('\r\n')
+    cabeceras = dict(linea.lower().split(': ', 1) for linea in lineas[1:])
+    return int(lineas[0].split()[1]), json.loads(contenido) if contenido else None, cabeceras
+
+def con_servicio(prueba, almacen=None, **opciones):
+    """Ejecutar `prueba(servicio, puerto)` con un servicio en un puerto libre"""
+    async def ejecutar():
+        servicio = ServicioRespuestas(almacen or AlmacenRespuestas.sqlite(':memory:'), **opciones)
+        servidor = await servicio.iniciar('127.0.0.1', 0)
+        try:
+            return await prueba(servicio, servidor.sockets[0].getsockname()[1])
+        finally:
+            await servicio.detener()
+    return asyncio.run(ejecutar())
+
+def test_respuesta_valida_201():
+    async def prueba(servicio, puerto):
+        estado, cuerpo, _ = await peticion(puerto, 'POST', json.dumps(respuesta_valida()).encode())
+        assert estado == 201 and len(cuerpo['id']) == 32
+        assert await servicio._en_hilo_db(servicio.almacen.contar) == 1
+    con_servicio(prueba)
+
+def test_json_mal_formado_400():
+    async def prueba(servicio, puerto):
+        estado, cuerpo, _ = await peticion(puerto, 'POST', b'{"facilidad_1": ')
+        assert estado == 400
+    con_servicio(prueba)
+
+def test_cuerpo_demasiado_grande_413_cierra_la_conexion():
+    async def prueba(servicio, puerto):
+        estado, _, cabeceras = await peticion(puerto, 'POST', largo=TAMANO_MAXIMO_CUERPO + 1)
+        assert estado == 413 and cabeceras['connection'] == 'close'
+    con_servicio(prueba)
+
+def test_esquema_no_cumplido_422():
+    async def prueba(servicio, puerto):
+        for valor in (3.9, True, 7, '3.0'):
+            estado, cuerpo, _ = await peticion(puerto, 'POST', json.dumps(respuesta_valida(valor)).encode())
+            assert estado == 422, valor
+        assert servicio.estadisticas['rechazadas'] == 4
+        assert await servicio._en_hilo_db(servicio.almacen.contar) == 0
+    con_servicio(prueba)
+
+def test_falla_del_almacen_503():
+    async def prueba(servicio, puerto):
+        estado, cuerpo, _ = await peticion(puerto, 'POST', json.dumps(respuesta_valida()).encode())
+        assert estado == 503
+    con_servicio(prueba, AlmacenConFalla(AlmacenRespuestas.sqlite(':memory:').conectar))
+
+def test_escritura_agrupada():
+    async def prueba(servicio, puerto):
+        cuerpo = json.dumps(respuesta_valida()).encode()
+        resultados = await asyncio.gather(*(peticion(puerto, 'POST', cuerpo) for _ in range(40)))
+        assert [estado for estado, _, _ in resultados] == [201] * 40
+        assert servicio.estadisticas['guardadas'] == 40
+        assert servicio.estadisticas['lotes'] < 40  # Varias respuestas por transacción
+        assert await servicio._en_hilo_db(servicio.almacen.contar) == 40
+        assert servicio.agregados.resumen()['respuestas'] == 40
+    con_servicio(prueba, espera_lote=0.2)
+
+def test_validar_respuesta_lanza_respuesta_invalida():
+    data = respuesta_valida()
+    data['tiempos'] = {'total_ms': -1}
+    try:
+        validar_respuesta(data)
+    except RespuestaInvalida as error:
+        assert 'total_ms' in str(error)
+    else:
+        raise AssertionError("Se esperaba RespuestaInvalida")